@@ -0,0 +1,87 @@
+"""二分探索木の各ノードクラスについて, __slots__の有無によるメモリ使用量の比較
+
+__slots__を持たない比較用のノードは, 各ノードクラスを継承しただけのクラス (インスタンスが__dict__を持つ) で置き換えて作る.
+
+Usage:
+    python -m benchmarks.BinarySearchTree.bench_node_memory [N]
+"""
+import sys
+import tracemalloc
+from operator import add
+from random import Random
+from types import ModuleType, new_class
+from typing import Callable
+
+from src.DataStructures.BinarySearchTree.SearchTree import AVL_Tree, binary_search_tree
+from src.DataStructures.BinarySearchTree.SplayTree import bottom_up_splay_tree, splay_hash_map, splay_hash_map_fast
+from src.DataStructures.BinarySearchTree.Treap import (
+    implicit_treap_recursion,
+    insert_delete_treap,
+    treap_hash_map,
+    treap_hash_map_fast,
+)
+
+
+def insert_keys(tree, keys: list[int]):
+    for key in keys:
+        tree.insert(key)
+
+
+def insert_items(tree, keys: list[int]):
+    for key in keys:
+        tree.insert(key, key)
+
+
+def append_values(tree, keys: list[int]):
+    for key in keys:
+        tree.append(key)
+
+
+# (モジュール, ノードクラス名, 木を作る関数, 要素を入れる関数)
+# scapegoat_tree, lazy_implicit_treap_recursionは実装途中で読み込めないため含めない
+TREES: list[tuple[ModuleType, str, Callable, Callable]] = [
+    (binary_search_tree, "Node", binary_search_tree.BinarySearchTree, insert_keys),
+    (AVL_Tree, "Node", AVL_Tree.AVLTree, insert_items),
+    (bottom_up_splay_tree, "Node", bottom_up_splay_tree.SplayTree, insert_keys),
+    (splay_hash_map, "Node", splay_hash_map.SplayHashMap, insert_items),
+    (splay_hash_map_fast, "Node", splay_hash_map_fast.SplayHashMap, insert_items),
+    (insert_delete_treap, "TreapNode", insert_delete_treap.Treap, insert_keys),
+    (treap_hash_map, "TreapNode", treap_hash_map.TreapHashMap, insert_items),
+    (treap_hash_map_fast, "TreapNode", treap_hash_map_fast.TreapHashMap, insert_items),
+    (implicit_treap_recursion, "TreapNode", lambda: implicit_treap_recursion.ImplicitTreap(add, add), append_values),
+]
+
+
+def measure(factory: Callable, fill: Callable, keys: list[int]) -> int:
+    """木を作ってkeysを入れたときに確保したメモリ量 (byte)"""
+    tracemalloc.start()
+    tree = factory()
+    fill(tree, keys)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tree
+    return size
+
+
+def main(N: int):
+    rng = Random(0)
+    keys = rng.sample(range(10 * N), N)
+    print(f"N={N}")
+    print(f"{'tree':<48}{'__dict__':>12}{'__slots__':>12}{'ratio':>8}  (byte/node)")
+    for module, name, factory, fill in TREES:
+        node = getattr(module, name)
+        slotted = measure(factory, fill, keys)
+        # __slots__を持つクラスを継承しただけのクラスは, インスタンスが__dict__を持つ
+        # Genericなノードは, 型引数を付けて生成できるように型変数ごと継承する
+        base = node[node.__parameters__] if getattr(node, "__parameters__", ()) else node
+        setattr(module, name, new_class(name, (base,)))
+        try:
+            with_dict = measure(factory, fill, keys)
+        finally:
+            setattr(module, name, node)
+        label = f"{module.__name__.rsplit('.', 1)[1]}.{name}"
+        print(f"{label:<48}{with_dict / N:>12.1f}{slotted / N:>12.1f}{with_dict / slotted:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10**5)
@@ -0,0 +1,37 @@
+"""BitVectorAccとSuccinctBitVectorのメモリ使用量の比較
+
+Usage:
+    python -m benchmarks.BitVector.bench_bit_vector_memory [N]
+"""
+import sys
+import tracemalloc
+from random import Random
+
+from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc
+from src.DataStructures.BitVector.succinct_bit_vector import SuccinctBitVector
+
+
+def measure(factory, B: list[int]) -> int:
+    """factory(B)で確保したメモリ量 (byte). Bそのものは含まない."""
+    tracemalloc.start()
+    obj = factory(B)  # noqa: F841
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def main(N: int):
+    rng = Random(0)
+    B = [rng.randrange(2) for _ in range(N)]
+
+    # BitVectorAccはBを参照するだけなので, Bのコピー分を足して比較する
+    acc = measure(lambda B: BitVectorAcc(B[:]), B)
+    succinct = measure(SuccinctBitVector, B)
+    print(f"N={N}")
+    print(f"BitVectorAcc     : {acc / N:8.3f} byte/bit")
+    print(f"SuccinctBitVector: {succinct / N:8.3f} byte/bit")
+    print(f"ratio            : {acc / succinct:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10**6)
@@ -0,0 +1,67 @@
+"""BitVectorAccのselectについて, サンプルを使う実装と全体を二分探索する実装の比較
+
+Usage:
+    python -m benchmarks.BitVector.bench_select [N] [Q]
+"""
+import sys
+from random import Random
+from time import perf_counter
+from typing import Optional
+
+from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc
+from src.DataStructures.BinaryTree.wavelet_matrix import WaveletMatrix
+
+
+class BinarySearchBitVector(BitVectorAcc):
+    """rankを使って全体を二分探索する, サンプルなしのselect"""
+
+    def select0(self, k: int) -> Optional[int]:
+        if (k <= 0) or (k > self.rank0_all()):
+            return None
+        left, right = 0, len(self)
+        while (right - left) > 1:
+            mid = (left + right) // 2
+            if self.rank0(mid) < k:
+                left = mid
+            else:
+                right = mid
+        return left
+
+    def select1(self, k: int) -> Optional[int]:
+        if (k <= 0) or (k > self.rank1_all()):
+            return None
+        left, right = 0, len(self)
+        while (right - left) > 1:
+            mid = (left + right) // 2
+            if self.rank1(mid) < k:
+                left = mid
+            else:
+                right = mid
+        return left
+
+
+def run(wm: WaveletMatrix, queries: list[tuple[int, int]]) -> tuple[float, list[Optional[int]]]:
+    start = perf_counter()
+    result = [wm.select(x, k) for x, k in queries]
+    return perf_counter() - start, result
+
+
+def main(N: int, Q: int):
+    rng = Random(0)
+    T = [rng.randrange(1 << 10) for _ in range(N)]
+    queries = [(T[rng.randrange(N)], rng.randrange(1, N // (1 << 10) + 1)) for _ in range(Q)]
+
+    baseline, expected = run(WaveletMatrix(T, bit_vector=BinarySearchBitVector, with_sum=False), queries)
+    sampled, result = run(WaveletMatrix(T, with_sum=False), queries)
+    assert result == expected
+
+    print(f"N={N}, Q={Q}")
+    print(f"binary search: {baseline:8.3f} s")
+    print(f"sampled      : {sampled:8.3f} s")
+    print(f"speedup      : {baseline / sampled:8.1f}x")
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 10**6
+    Q = int(sys.argv[2]) if len(sys.argv) > 2 else 10**5
+    main(N, Q)
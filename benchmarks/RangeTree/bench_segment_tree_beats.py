@@ -0,0 +1,78 @@
+"""Segment Tree Beats と, 要素ごとにclampする素朴な実装の比較
+
+Usage:
+    python -m benchmarks.RangeTree.bench_segment_tree_beats [N] [Q]
+"""
+import sys
+from random import Random
+from time import perf_counter
+
+from src.DataStructures.RangeTree.segment_tree_beats import SegmentTreeBeats
+
+
+def make_queries(N: int, Q: int, seed: int = 0) -> list[tuple[int, int, int, int]]:
+    """(種類, left, right, x)のクエリ列を作る
+
+    種類: 0 -> chmin, 1 -> chmax, 2 -> add, 3 -> sum
+    """
+    rng = Random(seed)
+    queries = []
+    for _ in range(Q):
+        left, right = sorted((rng.randrange(N + 1), rng.randrange(N + 1)))
+        queries.append((rng.randrange(4), left, right, rng.randrange(-(10**9), 10**9)))
+    return queries
+
+
+def run_beats(A: list[int], queries: list[tuple[int, int, int, int]]) -> list[int]:
+    seg = SegmentTreeBeats(A)
+    result = []
+    for t, left, right, x in queries:
+        if t == 0:
+            seg.range_chmin(left, right, x)
+        elif t == 1:
+            seg.range_chmax(left, right, x)
+        elif t == 2:
+            seg.range_add(left, right, x)
+        else:
+            result.append(seg.range_sum(left, right))
+    return result
+
+
+def run_naive(A: list[int], queries: list[tuple[int, int, int, int]]) -> list[int]:
+    A = A[:]
+    result = []
+    for t, left, right, x in queries:
+        if t == 0:
+            A[left:right] = [a if a < x else x for a in A[left:right]]
+        elif t == 1:
+            A[left:right] = [a if a > x else x for a in A[left:right]]
+        elif t == 2:
+            A[left:right] = [a + x for a in A[left:right]]
+        else:
+            result.append(sum(A[left:right]))
+    return result
+
+
+def main(N: int, Q: int):
+    rng = Random(1)
+    A = [rng.randrange(-(10**9), 10**9) for _ in range(N)]
+    queries = make_queries(N, Q)
+
+    start = perf_counter()
+    expected = run_naive(A, queries)
+    naive_time = perf_counter() - start
+
+    start = perf_counter()
+    result = run_beats(A, queries)
+    beats_time = perf_counter() - start
+
+    assert result == expected
+    print(f"N={N} Q={Q}")
+    print(f"naive clamp       : {naive_time:.3f} sec")
+    print(f"segment tree beats: {beats_time:.3f} sec")
+
+
+if __name__ == "__main__":
+    N = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    Q = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    main(N, Q)
@@ -46,6 +46,8 @@ class Node:
         size (int): 部分木のサイズ（自分を含む）
     """
 
+    __slots__ = ("key", "value", "left", "right", "bias", "size")
+
     def __init__(self, key, value):
         self.key = key
         self.value = value
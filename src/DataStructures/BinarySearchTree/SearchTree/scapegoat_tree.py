@@ -20,6 +20,8 @@ class ScapegoatNode:
         多重集合化はしていない
     """
 
+    __slots__ = ("key", "left", "right", "subtree_size", "removed")
+
     def __init__(self, key: int, count: int = 1):
         self.key = key
         self.left: Optional[ScapegoatNode] = None
@@ -16,6 +16,8 @@ class Node:
         data(value)は載せてない
     """
 
+    __slots__ = ("key", "left", "right", "count", "subtree_size")
+
     def __init__(self, key: int, count: int = 1):
         self.key = key
         self.left: Optional[Node] = None
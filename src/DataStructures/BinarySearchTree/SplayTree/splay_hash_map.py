@@ -21,6 +21,8 @@ class Node(Generic[K, V]):
         subtree_size (int): このノードを根とする部分木の要素数
     """
 
+    __slots__ = ("key", "value", "left", "right", "subtree_size")
+
     def __init__(self, key: K, value: V):
         self.key = key
         self.value = value
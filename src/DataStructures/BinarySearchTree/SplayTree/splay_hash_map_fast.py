@@ -20,6 +20,8 @@ class Node(Generic[K, V]):
         right (Optional[Node]): 右の子
     """
 
+    __slots__ = ("key", "value", "left", "right")
+
     def __init__(self, key: K, value: V):
         self.key = key
         self.value = value
@@ -38,6 +40,8 @@ class DummyNode:
         right (Optional[Node]): 右の子
     """
 
+    __slots__ = ("left", "right")
+
     def __init__(self):
         self.left: Optional[Node] = None
         self.right: Optional[Node] = None
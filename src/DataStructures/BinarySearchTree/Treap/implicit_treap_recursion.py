@@ -21,6 +21,8 @@ class TreapNode(Generic[Value]):
         aggregation_value (Value): このノードを根とする部分木の集約値
     """
 
+    __slots__ = ("value", "left", "right", "subtree_size", "priority", "aggregation_value")
+
     def __init__(self, value: Value):
         self.value = value
         self.left: Optional[TreapNode[Value]] = None
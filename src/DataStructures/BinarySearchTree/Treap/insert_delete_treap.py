@@ -18,6 +18,8 @@ class TreapNode:
         data(value)は載せてない
     """
 
+    __slots__ = ("key", "left", "right", "count", "subtree_size", "priority")
+
     def __init__(self, key: int, count: int = 1):
         self.key = key
         self.left: Optional[TreapNode] = None
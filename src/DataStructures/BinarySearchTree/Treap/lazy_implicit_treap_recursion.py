@@ -23,6 +23,8 @@ class LazyTreapNode(Generic[Value]):
         reversed (bool): 反転のフラグ
     """
 
+    __slots__ = ("value", "left", "right", "subtree_size", "priority", "aggregation_value", "lazy", "reversed")
+
     def __init__(self, value: Value):
         self.value = value
         self.left: Optional[LazyTreapNode[Value]] = None
@@ -23,6 +23,8 @@ class TreapNode(Generic[K, V]):
         priority (float): このノードの優先度
     """
 
+    __slots__ = ("value", "key", "left", "right", "subtree_size", "priority")
+
     def __init__(self, key: K, value: V):
         self.value = value
         self.key = key
@@ -0,0 +1,268 @@
+from typing import Generic, Optional, TypeVar
+from bisect import bisect_left
+
+from src.DataStructures.BitVector.bit_vector_base import BitVectorBase
+from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc as BitVector
+from src.DataStructures.BinaryTree.wavelet_matrix import WaveletMatrix
+
+
+K = TypeVar("K")
+
+
+class CompressedWaveletMatrix(Generic[K]):
+    """座標圧縮したWaveletMatrix. 比較可能な任意の値 (負の整数, 浮動小数点数, 文字列など) を扱える
+
+    元の配列の値を, 値の種類の中での順位 (0-indexed) に置き換えてWaveletMatrixを構築する.
+    段数はlog2(値の種類数)になる.
+
+    Attributes:
+        keys (list[K]): 元の配列に現れる値 (昇順, 重複なし). keys[順位] = 値.
+        index (dict[K, int]): index[値] = 順位.
+        wavelet_matrix (WaveletMatrix): 順位の配列に対するWaveletMatrix.
+
+    Methods:
+        access(i): T[i], O(bit_size).
+        rank(x, right): T[0..right)におけるxの出現回数, O(bit_size).
+        rank_range(x, left, right): T[left..right)におけるxの出現回数, O(bit_size).
+        select(x, k): Tのk個目のxの出現位置, O(bit_size).
+        quantile(left, right, k): T[left..right)の中のk番目に小さい値, O(bit_size).
+        kth_smallest(left, right, k): T[left..right)の中でk番目に小さい要素, O(bit_size).
+        kth_largest(left, right, k): T[left..right)の中でk番目に大きい要素, O(bit_size).
+        topk(left, right, k): T[left..right)の中で出現回数が多い順に(要素, 出現回数)をk個.
+        range_freq(left, right, lower, upper): T[left..right)の中で, lower <= x < upper となるxの個数, O(bit_size).
+        prev_value(left, right, upper): T[left..right)の中で x < upperを満たす最大のx, O(bit_size).
+        next_value(left, right, lower): T[left..right)の中で lower <= x を満たす最小のx, O(bit_size).
+
+    Notes:
+        - bit_sizeは, log2(値の種類数)
+        - 値の範囲 (lower, upper) には, 元の配列に現れない値も指定できる
+    """
+
+    def __init__(self, T: list[K], bit_vector: type[BitVectorBase] = BitVector):
+        """座標圧縮したWaveletMatrix
+
+        Args:
+            T (list[K]): 比較可能な値の配列
+            bit_vector (type[BitVectorBase]): 各段に使うBit Vectorのクラス.
+
+        TimeComplexity:
+            O(len(T) * (log len(T) + bit_size))
+        """
+        self.keys: list[K] = sorted(set(T))
+        self.index: dict[K, int] = {x: i for i, x in enumerate(self.keys)}
+        # 順位の和は使わないので, 累積和は持たない
+        self.wavelet_matrix = WaveletMatrix([self.index[t] for t in T], bit_vector, with_sum=False)
+
+    def __len__(self) -> int:
+        """len(T).
+
+        Returns:
+            int: len(T)
+        """
+        return len(self.wavelet_matrix)
+
+    def __getitem__(self, i: int) -> K:
+        """元の配列T[i]を返す
+
+        Args:
+            i (int): index
+
+        Returns:
+            K: T[i]
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        return self.access(i)
+
+    def _to_key(self, x: Optional[int]) -> Optional[K]:
+        """順位を値に戻す
+
+        Args:
+            x (Optional[int]): 順位
+
+        Returns:
+            Optional[K]: 値. 順位がNoneの場合はNone.
+        """
+        return None if x is None else self.keys[x]
+
+    def access(self, i: int) -> K:
+        """元の配列T[i]を返す
+
+        Args:
+            i (int): index
+
+        Returns:
+            K: T[i]
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        return self.keys[self.wavelet_matrix.access(i)]
+
+    def rank(self, x: K, right: int) -> int:
+        """T[0..right)における, xの出現回数を返す
+
+        Args:
+            x (K): 対象の要素
+            right (int): Tの範囲の上限
+
+        Returns:
+            int: 出現回数
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        return self.rank_range(x, 0, right)
+
+    def rank_range(self, x: K, left: int, right: int) -> int:
+        """T[left..right)におけるxの出現回数を返す
+
+        Args:
+            x (K): 対象の要素
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+
+        Returns:
+            int: 出現回数
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        if x not in self.index:
+            return 0
+        return self.wavelet_matrix.rank_range(self.index[x], left, right)
+
+    def select(self, x: K, k: int) -> Optional[int]:
+        """元の配列Tのk個目のxの出現位置 (index) を返す
+
+        Args:
+            x (K): 対象の要素.
+            k (int): 何個目の出現か. 1-index.
+
+        Returns:
+            Optional[int]: index. 該当要素が存在しない場合はNone.
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        if x not in self.index:
+            return None
+        return self.wavelet_matrix.select(self.index[x], k)
+
+    def quantile(self, left: int, right: int, k: int) -> Optional[K]:
+        """元の配列T[left..right)の中のk番目に小さい値を返す
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            k (int): 何番目の要素か, 1-index
+
+        Returns:
+            Optional[K]: k番目に小さい値. 該当要素が存在しない場合はNone.
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        return self._to_key(self.wavelet_matrix.quantile(left, right, k))
+
+    def kth_smallest(self, left: int, right: int, k: int) -> Optional[K]:
+        """T[left..right)の中で, k番目に小さい要素を返す.
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            k (int): 何番目の要素か, 1-index
+
+        Returns:
+            Optional[K]: k番目に小さい値. 該当要素が存在しない場合はNone.
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        return self.quantile(left, right, k)
+
+    def kth_largest(self, left: int, right: int, k: int) -> Optional[K]:
+        """T[left..right)の中で, k番目に大きい要素を返す.
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            k (int): 何番目の要素か, 1-index
+
+        Returns:
+            Optional[K]: k番目に大きい要素. 存在しない場合None.
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        return self._to_key(self.wavelet_matrix.kth_largest(left, right, k))
+
+    def topk(self, left: int, right: int, k: int) -> list[tuple[K, int]]:
+        """T[left..right)の中で, 出現回数が多い順に(要素, 出現回数)をk個返す.
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            k (int): いくつ返すか, 1-index
+
+        Returns:
+            list[tuple[K, int]]: [(出現回数が1番多い要素, その出現回数), ...]
+
+        Note:
+            - 出現回数が同じものは, 値が小さいものが先に返る
+            - k個未満の場合, 全て返す
+        """
+        return [(self.keys[x], count) for x, count in self.wavelet_matrix.topk(left, right, k)]
+
+    def range_freq(self, left: int, right: int, lower: K, upper: K) -> int:
+        """T[left..right)のlower <= x < upper となるxの個数を計算する
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            lower (K): 要素の下限
+            upper (K): 要素の上限
+
+        Returns:
+            int: lower <= x < upperとなる要素の数
+
+        TimeComplexity:
+            O(bit_size + log(値の種類数))
+        """
+        lower, upper = bisect_left(self.keys, lower), bisect_left(self.keys, upper)
+        return self.wavelet_matrix.range_freq(left, right, lower, upper)
+
+    def prev_value(self, left: int, right: int, upper: K) -> Optional[K]:
+        """T[left..right)の中で, x < upperを満たす最大のxを返す
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            upper (K): 要素の上限
+
+        Returns:
+            Optional[K]: x < upperを満たす最大のx. 存在しない場合None.
+
+        TimeComplexity:
+            O(bit_size + log(値の種類数))
+        """
+        upper = bisect_left(self.keys, upper)
+        return self._to_key(self.wavelet_matrix.prev_value(left, right, upper))
+
+    def next_value(self, left: int, right: int, lower: K) -> Optional[K]:
+        """T[left..right)の中で, lower <= x を満たす最小のxを返す
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            lower (K): 要素の下限
+
+        Returns:
+            Optional[K]: lower <= x を満たす最小のx. 存在しない場合None.
+
+        TimeComplexity:
+            O(bit_size + log(値の種類数))
+        """
+        lower = bisect_left(self.keys, lower)
+        return self._to_key(self.wavelet_matrix.next_value(left, right, lower))
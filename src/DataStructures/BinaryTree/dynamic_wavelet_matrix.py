@@ -0,0 +1,143 @@
+from typing import Optional
+
+from src.DataStructures.BitVector.dynamic_bit_vector import DynamicBitVector
+from src.DataStructures.BinaryTree.wavelet_matrix import WaveletMatrix
+
+
+class DynamicWaveletMatrix(WaveletMatrix):
+    """要素の挿入・削除・更新ができるWaveletMatrix
+
+    各段のBit VectorをDynamicBitVectorにしたもの.
+    クエリ (access, rank_range, select, quantile, range_freq, prev_value, next_value など) はWaveletMatrixと共通で,
+    rankがO(logN)になる分, 計算量はO(bit_size * logN)になる.
+
+    Attributes:
+        _N (int): 元の配列の長さ.
+        bit_size (int): WaveletMatrixの列数 (深さ). 構築後は変わらない.
+        wavelet_matrix (list[DynamicBitVector]): WaveletMatrix.
+
+    Methods:
+        insert(i, x): T[i]の前にxを挿入する, O(bit_size * logN).
+        erase(i): T[i]を削除し, その値を返す, O(bit_size * logN).
+        set(i, x): T[i] = x, O(bit_size * logN).
+
+    Notes:
+        - 値は 0 <= x < 2^bit_size である必要がある
+        - 各段の累積和は持たないので, sumはtopkを使い, range_sum_lowerは使用できない
+    """
+
+    def __init__(self, T: Optional[list[int]] = None, bit_size: Optional[int] = None):
+        """動的WaveletMatrix
+
+        Args:
+            T (Optional[list[int]]): 初期の整数列
+            bit_size (Optional[int]): 段数. 挿入する値xは x < 2^bit_size である必要がある.
+                省略した場合はmax(T)のbit長.
+
+        TimeComplexity:
+            O(len(T) * bit_size)
+        """
+        T = T if T is not None else []
+        max_bit_size = max(T).bit_length() if T else 0
+        if bit_size is None:
+            bit_size = max_bit_size
+        if max_bit_size > bit_size:
+            raise ValueError("values must be less than 2^bit_size")
+
+        self._N = len(T)
+        self.bit_size = bit_size
+        self.bit_vector = DynamicBitVector
+        self.with_sum = False
+        self.sums = []
+        self.wavelet_matrix: list[DynamicBitVector] = self._build(T)
+
+    def _check_value(self, x: int):
+        """xが格納できる値か確認する
+
+        Args:
+            x (int): 値
+
+        Raises:
+            ValueError: 0 <= x < 2^bit_sizeでない場合
+        """
+        if not (0 <= x < 1 << self.bit_size):
+            raise ValueError("values must be in [0, 2^bit_size)")
+
+    def insert(self, i: int, x: int):
+        """T[i]の前にxを挿入する
+
+        Args:
+            i (int): index. 0 <= i <= len(T). i = len(T)の場合は末尾に追加する.
+            x (int): 挿入する値
+
+        TimeComplexity:
+            O(bit_size * logN)
+        """
+        if not (0 <= i <= self._N):
+            raise IndexError("list index out of range")
+        self._check_value(x)
+
+        for digit, B in enumerate(self.wavelet_matrix):
+            bit = self._get_i_bit(x, self.bit_size - digit - 1)
+            B.insert(i, bit)
+            # 挿入した要素の, 次の段での位置
+            if bit == 0:
+                i = B.rank0(i)
+            else:
+                i = B.rank0_all() + B.rank1(i)
+        self._N += 1
+
+    def erase(self, i: int) -> int:
+        """T[i]を削除する
+
+        Args:
+            i (int): index
+
+        Returns:
+            int: 削除した値
+
+        TimeComplexity:
+            O(bit_size * logN)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        x = 0
+        for digit, B in enumerate(self.wavelet_matrix):
+            bit = B[i]
+            x |= bit << (self.bit_size - digit - 1)
+            # 削除する要素の, 次の段での位置 (bitが1の要素を削除しても0の個数は変わらない)
+            if bit == 0:
+                next_i = B.rank0(i)
+            else:
+                next_i = B.rank0_all() + B.rank1(i)
+            B.erase(i)
+            i = next_i
+        self._N -= 1
+        return x
+
+    def set(self, i: int, x: int):
+        """T[i] = x
+
+        Args:
+            i (int): index
+            x (int): 更新後の値
+
+        TimeComplexity:
+            O(bit_size * logN)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+        self._check_value(x)
+
+        self.erase(i)
+        self.insert(i, x)
+
+    def __setitem__(self, i: int, x: int):
+        """T[i] = x
+
+        Args:
+            i (int): index
+            x (int): 更新後の値
+        """
+        self.set(i, x)
@@ -0,0 +1,272 @@
+from typing import Optional
+from bisect import bisect_left
+from itertools import accumulate, compress
+
+from src.DataStructures.BitVector.bit_vector_base import BitVectorBase
+from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc as BitVector
+from src.DataStructures.BinaryTree.wavelet_matrix import WaveletMatrix
+from src.DataStructures.RangeTree.binary_indexed_tree import BinaryIndexedTree
+
+
+# 0, 1のbyteを反転する表
+_FLIP = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+
+
+class RectangleSumWaveletMatrix:
+    """重み付きの2次元の点集合に対して, 長方形内の点の個数・重みの和を計算する
+
+    点をx座標の順に並べ, y座標 (座標圧縮した順位) の列に対するWaveletMatrixを構築する.
+    xの範囲は並べた列のindexの範囲, yの範囲はWaveletMatrixの値の範囲になる.
+    重みの和は, 各段の並びでの重みの累積和を使って計算する (WaveletMatrix.range_sum_lowerと同じ).
+
+    Attributes:
+        xs (list[int]): 点のx座標 (昇順).
+        ys (list[int]): 点のy座標の種類 (昇順, 重複なし).
+        wavelet_matrix (WaveletMatrix): x座標の順に並べた点の, yの順位の列に対するWaveletMatrix.
+        sums (list[list[int]]): sums[j][i]: j段目の並びでの, 先頭i個の点の重みの和.
+            sums[0]はx座標の順, sums[j + 1]はj段目で安定に分割した後の並び.
+
+    Methods:
+        count_rectangle(x1, y1, x2, y2): x1 <= x < x2, y1 <= y < y2 の点の個数, O(log N).
+        sum_rectangle(x1, y1, x2, y2): x1 <= x < x2, y1 <= y < y2 の点の重みの和, O(log N).
+
+    Notes:
+        - 点の追加・削除はできない. 重みを更新する場合はPointAddRectangleSumWaveletMatrixを使う.
+        - 同じ座標の点が複数あってもよい
+    """
+
+    def __init__(
+        self,
+        points: list[tuple[int, int]],
+        weights: Optional[list[int]] = None,
+        bit_vector: type[BitVectorBase] = BitVector,
+    ):
+        """長方形クエリのためのWaveletMatrix
+
+        Args:
+            points (list[tuple[int, int]]): 点の座標 (x, y) の配列
+            weights (Optional[list[int]]): 各点の重み. 省略した場合は全て1.
+            bit_vector (type[BitVectorBase]): 各段に使うBit Vectorのクラス.
+
+        TimeComplexity:
+            O(N log N)
+        """
+        weights = weights if weights is not None else [1] * len(points)
+        order = sorted(range(len(points)), key=lambda i: points[i])
+        self.xs: list[int] = [points[i][0] for i in order]
+        self.ys: list[int] = sorted({y for _, y in points})
+
+        Y = [bisect_left(self.ys, points[i][1]) for i in order]
+        self.wavelet_matrix = WaveletMatrix(Y, bit_vector, with_sum=False)
+        self._build_weights([weights[i] for i in order])
+
+    def _levels(self, W: list[int]) -> list[list[int]]:
+        """各段の並びでの重みの列を計算する
+
+        Args:
+            W (list[int]): x座標の順に並べた重み
+
+        Returns:
+            list[list[int]]: [x座標の順の並び, 0段目で分割した後の並び, ...]
+        """
+        levels = [W]
+        for B in self.wavelet_matrix.wavelet_matrix:
+            bits = B.to_bytes()
+            # bitが0のもの -> bitが1のものの順に並べる (WaveletMatrixの構築と同じ)
+            W = [*compress(W, bits.translate(_FLIP)), *compress(W, bits)]
+            levels.append(W)
+        return levels
+
+    def _build_weights(self, W: list[int]):
+        """重みの累積和を構築する
+
+        Args:
+            W (list[int]): x座標の順に並べた重み
+        """
+        self.sums: list[list[int]] = [[0, *accumulate(level)] for level in self._levels(W)]
+
+    def _weight_range(self, j: int, left: int, right: int) -> int:
+        """j段目の並びでの, [left..right)の点の重みの和
+
+        Args:
+            j (int): 段
+            left (int): 並びの範囲の下限
+            right (int): 並びの範囲の上限
+
+        Returns:
+            int: 重みの和
+        """
+        return self.sums[j][right] - self.sums[j][left]
+
+    def _x_range(self, x1: int, x2: int) -> tuple[int, int]:
+        """x1 <= x < x2 の点の, x座標の順に並べた列での範囲
+
+        Args:
+            x1 (int): xの下限
+            x2 (int): xの上限
+
+        Returns:
+            tuple[int, int]: [left..right)
+        """
+        return bisect_left(self.xs, x1), bisect_left(self.xs, x2)
+
+    def count_rectangle(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """x1 <= x < x2, y1 <= y < y2 の点の個数
+
+        Args:
+            x1 (int): xの下限
+            y1 (int): yの下限
+            x2 (int): xの上限
+            y2 (int): yの上限
+
+        Returns:
+            int: 点の個数
+
+        TimeComplexity:
+            O(log N)
+        """
+        if (x1 >= x2) or (y1 >= y2):
+            return 0
+        left, right = self._x_range(x1, x2)
+        lower, upper = bisect_left(self.ys, y1), bisect_left(self.ys, y2)
+        return self.wavelet_matrix.range_freq(left, right, lower, upper)
+
+    def _sum_lower(self, left: int, right: int, upper: int) -> int:
+        """x座標の順の並びで[left..right)にある点のうち, yの順位が upper 未満の点の重みの和
+
+        Args:
+            left (int): 並びの範囲の下限
+            right (int): 並びの範囲の上限
+            upper (int): yの順位の上限
+
+        Returns:
+            int: 重みの和
+        """
+        wm = self.wavelet_matrix
+        if (left >= right) or (upper <= 0):
+            return 0
+
+        # 全ての点が < upper
+        if upper.bit_length() > wm.bit_size:
+            return self._weight_range(0, left, right)
+
+        s = 0
+        for digit, B in enumerate(wm.wavelet_matrix):
+            upper_bit = wm._get_i_bit(upper, wm.bit_size - digit - 1)
+            # upperのbitが1 -> このbitが0の点は全て < upper. 次の段の並びでの範囲の和を足す.
+            if upper_bit == 1:
+                s += self._weight_range(digit + 1, B.rank0(left), B.rank0(right))
+
+            left, right = wm._next_range(B, upper_bit, left, right)
+
+        return s
+
+    def sum_rectangle(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """x1 <= x < x2, y1 <= y < y2 の点の重みの和
+
+        Args:
+            x1 (int): xの下限
+            y1 (int): yの下限
+            x2 (int): xの上限
+            y2 (int): yの上限
+
+        Returns:
+            int: 重みの和
+
+        TimeComplexity:
+            O(log N)
+        """
+        if (x1 >= x2) or (y1 >= y2):
+            return 0
+        left, right = self._x_range(x1, x2)
+        lower, upper = bisect_left(self.ys, y1), bisect_left(self.ys, y2)
+        return self._sum_lower(left, right, upper) - self._sum_lower(left, right, lower)
+
+
+class PointAddRectangleSumWaveletMatrix(RectangleSumWaveletMatrix):
+    """重み付きの2次元の点集合に対して, 点の重みの加算と, 長方形内の点の重みの和を計算する
+
+    RectangleSumWaveletMatrixの各段の累積和を, Binary Indexed Treeにしたもの.
+    点の座標はあらかじめ全て与える必要がある (重み0の点として登録しておく).
+
+    Attributes:
+        trees (list[BinaryIndexedTree]): trees[j]: j段目の並びでの, 点の重みのBinary Indexed Tree.
+
+    Methods:
+        add(x, y, w): 座標(x, y)の点の重みにwを加える, O(log^2 N).
+        count_rectangle(x1, y1, x2, y2): x1 <= x < x2, y1 <= y < y2 の点の個数, O(log N).
+        sum_rectangle(x1, y1, x2, y2): x1 <= x < x2, y1 <= y < y2 の点の重みの和, O(log^2 N).
+
+    Notes:
+        - 重みの和はint64に収まる必要がある
+    """
+
+    def __init__(
+        self,
+        points: list[tuple[int, int]],
+        weights: Optional[list[int]] = None,
+        bit_vector: type[BitVectorBase] = BitVector,
+    ):
+        """点の重みを更新できる, 長方形クエリのためのWaveletMatrix
+
+        Args:
+            points (list[tuple[int, int]]): 点の座標 (x, y) の配列
+            weights (Optional[list[int]]): 各点の重み. 省略した場合は全て1.
+            bit_vector (type[BitVectorBase]): 各段に使うBit Vectorのクラス.
+
+        TimeComplexity:
+            O(N log N)
+        """
+        super().__init__(points, weights, bit_vector)
+        # 座標 -> x座標の順の並びでのindex を二分探索するため, (x, y)の順に並べておく
+        self._points = sorted(points)
+
+    def _build_weights(self, W: list[int]):
+        """重みのBinary Indexed Treeを構築する
+
+        Args:
+            W (list[int]): x座標の順に並べた重み
+        """
+        self.trees: list[BinaryIndexedTree] = [BinaryIndexedTree(level) for level in self._levels(W)]
+
+    def _weight_range(self, j: int, left: int, right: int) -> int:
+        """j段目の並びでの, [left..right)の点の重みの和
+
+        Args:
+            j (int): 段
+            left (int): 並びの範囲の下限
+            right (int): 並びの範囲の上限
+
+        Returns:
+            int: 重みの和
+        """
+        return self.trees[j].sum_range(left, right)
+
+    def add(self, x: int, y: int, w: int):
+        """座標(x, y)の点の重みにwを加える
+
+        Args:
+            x (int): 点のx座標
+            y (int): 点のy座標
+            w (int): 加算する重み
+
+        Raises:
+            KeyError: 座標(x, y)の点が存在しない場合
+
+        TimeComplexity:
+            O(log^2 N)
+
+        Notes:
+            同じ座標の点が複数ある場合は, そのうち1つに加える
+        """
+        i = bisect_left(self._points, (x, y))
+        if i == len(self._points) or self._points[i] != (x, y):
+            raise KeyError((x, y))
+
+        wm = self.wavelet_matrix
+        self.trees[0].add(i, w)
+        # 点が各段の並びでどこにあるかを追いながら加算する
+        for digit, B in enumerate(wm.wavelet_matrix):
+            bit = B[i]
+            i, _ = wm._next_range(B, bit, i, i + 1)
+            self.trees[digit + 1].add(i, w)
@@ -1,7 +1,24 @@
 from typing import Optional
+from array import array
 from heapq import heappush, heappop
+from itertools import accumulate, compress
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from src.DataStructures.BitVector.array_file import load_arrays, save_arrays
+from src.DataStructures.BitVector.bit_vector_base import BitVectorBase
 from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc as BitVector
+from src.DataStructures.BitVector.dynamic_bit_vector import DynamicBitVector
+from src.DataStructures.BitVector.succinct_bit_vector import SuccinctBitVector
+
+
+# 保存したファイルから復元できるBit Vectorのクラス
+BIT_VECTORS: dict[str, type[BitVectorBase]] = {
+    cls.__name__: cls for cls in (BitVector, SuccinctBitVector, DynamicBitVector)
+}
 
 
 class WaveletMatrix:
@@ -15,8 +32,13 @@ class WaveletMatrix:
         bit_size: log2(Tの最大値)
 
     Attributes:
+        _N (int): 元の配列の長さ.
         bit_size (int): WaveletMatrixの列数 (深さ).
+        bit_vector (type[BitVectorBase]): 各段に使うBit Vectorのクラス.
         wavelet_matrix (list[BitVector]): WaveletMatrix.
+        with_sum (bool): 各段の累積和を持つかどうか.
+        sums (list[array | list[int]]): sums[j][i]: j段目のBit Vectorに対応する並びの, 先頭i個の値の和.
+            sums[bit_size]は最後の段で安定に分割した後の並び. with_sum = Falseの場合は空.
 
     Methods:
         access(i): T[i], O(bit_size).
@@ -26,23 +48,46 @@ class WaveletMatrix:
         quantile(left, right, k): T[left..right)の中のk番目に小さい値, O(bit_size).
         kth_smallest(left, right, k): T[left..right)の中でk番目に小さい要素, O(bit_size).
         kth_largest(left, right, k): T[left..right)の中でk番目に大きい要素, O(bit_size).
-        topk(left, right, k): T[left..right)の中で出現回数が多い順に(要素, 出現回数)をk個.
-        sum(left, right): T[left..right)の和.
+        topk(left, right, k): T[left..right)の中で出現回数が多い順に(要素, 出現回数)をk個, O(k * bit_size * log(k * bit_size)).
+        sum(left, right): T[left..right)の和, O(1) (with_sum = Falseの場合はtopkを使う).
+        range_sum_lower(left, right, upper): T[left..right)の中で, x < upper となるxの和, O(bit_size).
+            with_sum = Trueが必要.
+        range_sum(left, right, lower, upper): T[left..right)の中で, lower <= x < upper となるxの和, O(bit_size).
+            with_sum = Trueが必要.
         range_freq(left, right, lower, upper): T[left..right)の中で, lower <= x < upper となるxの個数, O(bit_size).
         prev_value(left, right, upper): T[left..right)の中で x < upperを満たす最大のx, O(bit_size).
         next_value(left, right, lower): T[left..right)の中で lower <= x を満たす最小のx, O(bit_size).
+        quantile_many(lefts, rights, ks): quantileをQ個まとめて計算, O(Q * bit_size).
+        range_freq_many(lefts, rights, lowers, uppers): range_freqをQ個まとめて計算, O(Q * bit_size).
+        save(path): ファイルに保存する.
+        load(path, mmap): saveで保存したファイルから読み込む.
     """
 
-    def __init__(self, T: list[int]):
+    def __init__(
+        self,
+        T: list[int],
+        bit_vector: type[BitVectorBase] = BitVector,
+        with_sum: bool = False,
+    ):
         """WaveletMatrix
 
         Args:
             T (list[int]): 整数列
+            bit_vector (type[BitVectorBase]): 各段に使うBit Vectorのクラス.
+                メモリを抑えたい場合はSuccinctBitVectorを指定する.
+            with_sum (bool): 各段の累積和を持つかどうか. range_sum_lower, range_sumを使う場合はTrueにする.
+                累積和は (bit_size + 1) * (len(T) + 1) 個の整数を使うので, Bit Vectorよりずっと大きい.
 
         TimeComplexity:
             構築にO(len(T) * bit_size)
         """
+        self._N = len(T)
         self.bit_size: int = max(T).bit_length() if T else 0
+        self.bit_vector = bit_vector
+        self.with_sum = with_sum
+        # 和がint64に収まる場合はarray("q")に格納する
+        self._sum_typecode = "q" if (1 << self.bit_size) * self._N < 1 << 63 else None
+        self.sums: list = []
         self.wavelet_matrix: list[BitVector] = self._build(T)
 
     def _build(self, T: list[int]) -> list[BitVector]:
@@ -56,16 +101,149 @@ class WaveletMatrix:
 
         TimeComplexity:
             O(len(T) * bit_size)
+
+        Notes:
+            各段で, その段のbitを記録した後, そのbitで安定に分割 (0が前, 1が後) したものを次の段に渡す.
+            numpyがある場合はまとめてベクトル演算する.
         """
+        if np is not None and T and self.bit_size < 64:
+            return self._build_numpy(T)
+
         wavelet_matrix: list[BitVector] = []
+        self._append_sums(T)
         for digit in range(self.bit_size)[::-1]:
-            zeros = [t for t in T if not self._get_i_bit(t, digit + 1)]
-            ones = [t for t in T if self._get_i_bit(t, digit + 1)]
+            bits = [(t >> digit) & 1 for t in T]
+            wavelet_matrix.append(self.bit_vector(bits))
 
-            T = zeros + ones
-            wavelet_matrix.append(BitVector([self._get_i_bit(t, digit) for t in T]))
+            # bitが0のもの -> bitが1のものの順に並べる
+            zeros = compress(T, [bit ^ 1 for bit in bits])
+            T = [*zeros, *compress(T, bits)]
+            self._append_sums(T)
         return wavelet_matrix
 
+    def _build_numpy(self, T: list[int]) -> list[BitVector]:
+        """numpyを使ってWaveletMatrixを構築する
+
+        Args:
+            T (list[int]): 元の配列
+
+        Returns:
+            list[BitVector]: WaveletMatrix
+
+        TimeComplexity:
+            O(len(T) * bit_size)
+        """
+        wavelet_matrix: list[BitVector] = []
+        T = np.asarray(T, dtype=np.uint32 if self.bit_size <= 32 else np.uint64)
+        self._append_sums(T)
+        for digit in range(self.bit_size)[::-1]:
+            bits = ((T >> digit) & 1).astype(np.bool_)
+            wavelet_matrix.append(self._bit_vector_from_numpy(bits))
+            # 真偽値の添字よりcompressの方が速い
+            T = np.concatenate((np.compress(~bits, T), np.compress(bits, T)))
+            self._append_sums(T)
+        return wavelet_matrix
+
+    def _append_sums(self, T: list[int]):
+        """ある段の並びTの累積和をsumsに追加する
+
+        Args:
+            T (list[int] | np.ndarray): ある段の並び
+        """
+        if not self.with_sum:
+            return
+
+        if np is not None and isinstance(T, np.ndarray) and self._sum_typecode is not None:
+            acc = np.zeros(len(T) + 1, dtype=np.int64)
+            np.cumsum(T, out=acc[1:])
+            self.sums.append(array(self._sum_typecode, acc.tobytes()))
+            return
+
+        if np is not None and isinstance(T, np.ndarray):
+            T = T.tolist()
+        acc = [0, *accumulate(T)]
+        self.sums.append(acc if self._sum_typecode is None else array(self._sum_typecode, acc))
+
+    def _bit_vector_from_numpy(self, bits) -> BitVector:
+        """0-1のnumpy配列からBit Vectorを作る
+
+        Args:
+            bits (np.ndarray): 要素は0 or 1
+
+        Returns:
+            BitVector: Bit Vector
+        """
+        # ワード列から構築できる場合は, 0-1のリストを経由しない
+        if hasattr(self.bit_vector, "from_words"):
+            packed = np.packbits(bits, bitorder="little")
+            packed = np.concatenate((packed, np.zeros(-len(packed) % 8, dtype=np.uint8)))
+            return self.bit_vector.from_words(array("Q", packed.tobytes()), len(bits))
+        return self.bit_vector(bits.astype(np.int64).tolist())
+
+    def save(self, path: str):
+        """ファイルに保存する
+
+        各段のBit Vectorと累積和を, 1つのファイルに固定長の配列として書き込む.
+
+        Args:
+            path (str): ファイルのパス
+
+        Raises:
+            ValueError: 累積和がint64に収まらない場合
+
+        TimeComplexity:
+            O(len(T) * bit_size)
+        """
+        if self.with_sum and self._sum_typecode is None:
+            raise ValueError("sums must fit in int64 to save")
+
+        meta = [self._N, self.bit_size, int(self.with_sum), len(self.wavelet_matrix)]
+        arrays = [array("B", self.bit_vector.__name__.encode())]
+        # 各段のメタデータ・配列の個数を記録して, 1列に並べる
+        for B in self.wavelet_matrix:
+            level_meta, level_arrays = B._to_arrays()
+            meta += [len(level_meta), len(level_arrays), *level_meta]
+            arrays += level_arrays
+        arrays += [array("q", acc) if isinstance(acc, memoryview) else acc for acc in self.sums]
+        save_arrays(path, type(self).__name__, meta, arrays)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "WaveletMatrix":
+        """saveで保存したファイルから読み込む
+
+        Args:
+            path (str): ファイルのパス
+            mmap (bool): ファイルをメモリマップするかどうか.
+                Trueの場合, SuccinctBitVectorの各配列と累積和はコピーせずにファイルを参照するため,
+                読み込みはほぼ一瞬で, 同じファイルを読み込んだプロセス間でページキャッシュを共有できる.
+
+        Returns:
+            WaveletMatrix: 読み込んだWaveletMatrix
+
+        Raises:
+            ValueError: 別のクラスで保存したファイルの場合
+
+        TimeComplexity:
+            SuccinctBitVectorの場合O(bit_size). それ以外のBit Vectorは作り直すので, O(len(T) * bit_size).
+        """
+        meta, arrays = load_arrays(path, cls.__name__, mmap)
+        wm = cls.__new__(cls)
+        wm._N, wm.bit_size, with_sum, num_levels = meta[:4]
+        wm.with_sum = bool(with_sum)
+        wm._sum_typecode = "q"
+        wm.bit_vector = BIT_VECTORS[bytes(arrays[0]).decode()]
+
+        wm.wavelet_matrix = []
+        m, a = 4, 1
+        for _ in range(num_levels):
+            num_meta, num_arrays = meta[m], meta[m + 1]
+            level_meta = meta[m + 2: m + 2 + num_meta]
+            wm.wavelet_matrix.append(wm.bit_vector._from_arrays(level_meta, arrays[a: a + num_arrays]))
+            m += 2 + num_meta
+            a += num_arrays
+        wm.sums = arrays[a:]
+        return wm
+
     def __len__(self) -> int:
         """len(T).
 
@@ -75,9 +253,8 @@ class WaveletMatrix:
         TimeComplexity:
             O(1)
         """
-        if len(self.wavelet_matrix) == 0:
-            return 0
-        return len(self.wavelet_matrix[0])
+        # 全ての要素が0の場合はbit_size = 0で, 段が存在しないため元の配列の長さを持っておく
+        return self._N
 
     def __getitem__(self, i: int) -> int:
         """元の配列T[i]を返す
@@ -214,7 +391,7 @@ class WaveletMatrix:
             x_bit = self._get_i_bit(x, self.bit_size - digit - 1)
             left, right = self._next_range(B, x_bit, left, right)
 
-        if left >= right:
+        if right - left < k:
             return None
 
         # 上記範囲のk番目が, 元の配列で何番目か計算
@@ -309,9 +486,11 @@ class WaveletMatrix:
         Note:
             - 出現回数が同じものは, 値が小さいものが先に返る
             - k個未満の場合, 全て返す
+            - 要素を含まない範囲はヒープに入れないので, ヒープから取り出すノードは
+              上位k個の要素のいずれかに至る経路上のノード (高々k * bit_size個) に限られる
 
         TimeComplexity:
-            TODO: ?????
+            O(k * bit_size * log(k * bit_size))
         """
         if (left >= right) or (k <= 0):
             return []
@@ -331,18 +510,19 @@ class WaveletMatrix:
             _, x, left, right, j = heappop(hq)
 
             if j == self.bit_size:
-                if right - left > 0:
-                    topk.append((x, right - left))
+                topk.append((x, right - left))
                 continue
 
             B = self.wavelet_matrix[j]
 
             zero_left, zero_right = self._next_range(B, 0, left, right)
-            heappush(hq, (-(zero_right - zero_left), x, zero_left, zero_right, j + 1))
+            if zero_left < zero_right:
+                heappush(hq, (-(zero_right - zero_left), x, zero_left, zero_right, j + 1))
 
             one_left, one_right = self._next_range(B, 1, left, right)
-            x |= 1 << (self.bit_size - j - 1)
-            heappush(hq, (-(one_right - one_left), x, one_left, one_right, j + 1))
+            if one_left < one_right:
+                x |= 1 << (self.bit_size - j - 1)
+                heappush(hq, (-(one_right - one_left), x, one_left, one_right, j + 1))
 
         return topk
 
@@ -357,15 +537,83 @@ class WaveletMatrix:
             int: ΣT[left..right)
 
         TimeComplexity:
-            TODO: ????
+            O(1). with_sum = Falseの場合は, T[left..right)の値の種類数をDとしてO(D * bit_size * log(D * bit_size)).
         """
+        left = max(left, 0)
+        right = min(right, len(self))
         if left >= right:
             return 0
 
+        if self.with_sum:
+            return self.sums[0][right] - self.sums[0][left]
+
         topk = self.topk(left, right, right - left + 1)
         s = sum(x * cnt for x, cnt in topk)
         return s
 
+    def range_sum_lower(self, left: int, right: int, upper: int) -> int:
+        """T[left..right)の x < upper となるxの和を計算する
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            upper (int): 要素の上限
+
+        Returns:
+            int: x < upperとなる要素の和
+
+        Raises:
+            ValueError: with_sum = Falseの場合
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        if not self.with_sum:
+            raise ValueError("range_sum_lower needs the per-level sums. Build the WaveletMatrix with with_sum=True.")
+
+        left = max(left, 0)
+        right = min(right, len(self))
+        if (left >= right) or (upper <= 0):
+            return 0
+
+        # 全ての要素が < upper
+        if upper.bit_length() > self.bit_size:
+            return self.sum(left, right)
+
+        s = 0
+        for digit, B in enumerate(self.wavelet_matrix):
+            upper_bit = self._get_i_bit(upper, self.bit_size - digit - 1)
+            # upperのbitが1 -> このbitが0の要素は全て < upper. 次の段の並びでの範囲の和を足す.
+            if upper_bit == 1:
+                zero_left, zero_right = B.rank0(left), B.rank0(right)
+                s += self.sums[digit + 1][zero_right] - self.sums[digit + 1][zero_left]
+
+            left, right = self._next_range(B, upper_bit, left, right)
+
+        return s
+
+    def range_sum(self, left: int, right: int, lower: int, upper: int) -> int:
+        """T[left..right)の lower <= x < upper となるxの和を計算する
+
+        Args:
+            left (int): Tの範囲の下限
+            right (int): Tの範囲の上限
+            lower (int): 要素の下限
+            upper (int): 要素の上限
+
+        Returns:
+            int: lower <= x < upperとなる要素の和
+
+        Raises:
+            ValueError: with_sum = Falseの場合
+
+        TimeComplexity:
+            O(bit_size)
+        """
+        if lower >= upper:
+            return 0
+        return self.range_sum_lower(left, right, upper) - self.range_sum_lower(left, right, lower)
+
     def range_freq_to(self, left: int, right: int, upper: int) -> int:
         """T[left..right)の0 <= x < upper となるxの個数を計算する
 
@@ -442,6 +690,121 @@ class WaveletMatrix:
             left, right, lower
         )
 
+    def _rank0_many(self, B: BitVector, I):
+        """各iについて, B[0..I[i])の0の個数をまとめて計算する
+
+        Args:
+            B (BitVector): Bit Vector
+            I (np.ndarray): 上限の列. 各要素は0以上len(B)以下.
+
+        Returns:
+            np.ndarray: B.rank0(I[i])の列
+
+        TimeComplexity:
+            O(Q). Bit Vectorがまとめて計算できない場合は O(Q * rank1).
+        """
+        return I - np.asarray(B.rank1_many(I), dtype=np.int64)
+
+    def quantile_many(self, lefts: list[int], rights: list[int], ks: list[int]) -> list[Optional[int]]:
+        """複数のクエリ quantile(lefts[q], rights[q], ks[q]) をまとめて計算する
+
+        Args:
+            lefts (list[int]): Tの範囲の下限
+            rights (list[int]): Tの範囲の上限
+            ks (list[int]): 何番目の要素か, 1-index
+
+        Returns:
+            list[Optional[int]]: 各クエリのk番目に小さい値. 該当要素が存在しない場合はNone.
+
+        TimeComplexity:
+            O(Q * bit_size). Qはクエリ数.
+
+        Notes:
+            numpyがある場合は, 段ごとに全てのクエリの範囲をまとめて更新する.
+            rankは各Bit Vectorの補助配列からまとめて計算する (rank1_many).
+        """
+        N = len(self)
+        if np is None or self.bit_size >= 63:
+            return [
+                self.quantile(min(max(left, 0), N), min(max(right, 0), N), k)
+                for left, right, k in zip(lefts, rights, ks)
+            ]
+
+        L = np.clip(np.asarray(lefts, dtype=np.int64), 0, N)
+        R = np.clip(np.asarray(rights, dtype=np.int64), 0, N)
+        K = np.asarray(ks, dtype=np.int64)
+        valid = (L < R) & (K > 0) & (K <= R - L)
+
+        X = np.zeros(len(K), dtype=np.int64)
+        for digit, B in enumerate(self.wavelet_matrix):
+            zeros = B.rank0_all()
+            zero_left, zero_right = self._rank0_many(B, L), self._rank0_many(B, R)
+            num_zeros = zero_right - zero_left
+
+            # 該当要素が1の中にあるクエリは, 1の範囲に移る
+            go_one = K > num_zeros
+            K -= np.where(go_one, num_zeros, 0)
+            X |= go_one.astype(np.int64) << (self.bit_size - digit - 1)
+            L = np.where(go_one, zeros + (L - zero_left), zero_left)
+            R = np.where(go_one, zeros + (R - zero_right), zero_right)
+
+        return [int(x) if ok else None for x, ok in zip(X.tolist(), valid.tolist())]
+
+    def range_freq_many(
+        self, lefts: list[int], rights: list[int], lowers: list[int], uppers: list[int]
+    ) -> list[int]:
+        """複数のクエリ range_freq(lefts[q], rights[q], lowers[q], uppers[q]) をまとめて計算する
+
+        Args:
+            lefts (list[int]): Tの範囲の下限
+            rights (list[int]): Tの範囲の上限
+            lowers (list[int]): 要素の下限
+            uppers (list[int]): 要素の上限
+
+        Returns:
+            list[int]: 各クエリの, lower <= x < upperとなる要素の数
+
+        TimeComplexity:
+            O(Q * bit_size). Qはクエリ数.
+
+        Notes:
+            numpyがある場合は, 段ごとに全てのクエリの範囲をまとめて更新する.
+            rankは各Bit Vectorの補助配列からまとめて計算する (rank1_many).
+        """
+        N = len(self)
+        if np is None or self.bit_size >= 63:
+            return [
+                self.range_freq(min(max(left, 0), N), min(max(right, 0), N), lower, upper)
+                for left, right, lower, upper in zip(lefts, rights, lowers, uppers)
+            ]
+
+        L = np.clip(np.asarray(lefts, dtype=np.int64), 0, N)
+        R = np.clip(np.asarray(rights, dtype=np.int64), 0, N)
+        # 値の範囲を [0, 2^bit_size] に収めても個数は変わらない
+        cap = 1 << self.bit_size
+        lowers = np.array([min(max(x, 0), cap) for x in lowers], dtype=np.int64)
+        uppers = np.array([min(max(x, 0), cap) for x in uppers], dtype=np.int64)
+        valid = (L < R) & (lowers < uppers)
+
+        # range_freq_to(upper) - range_freq_to(lower) を, 2つの上限を並べてまとめて計算する
+        L = np.concatenate((L, L))
+        R = np.concatenate((R, R))
+        U = np.concatenate((uppers, lowers))
+        # upper = 2^bit_size は全ての要素が < upper
+        cnt = np.where(U >> self.bit_size, R - L, 0)
+        for digit, B in enumerate(self.wavelet_matrix):
+            zeros = B.rank0_all()
+            zero_left, zero_right = self._rank0_many(B, L), self._rank0_many(B, R)
+
+            # upperのbitが1 -> このbitが0の要素は全て < upper
+            upper_bit = ((U >> (self.bit_size - digit - 1)) & 1).astype(np.bool_)
+            cnt += np.where(upper_bit, zero_right - zero_left, 0)
+            L = np.where(upper_bit, zeros + (L - zero_left), zero_left)
+            R = np.where(upper_bit, zeros + (R - zero_right), zero_right)
+
+        Q = len(valid)
+        return np.where(valid, cnt[:Q] - cnt[Q:], 0).tolist()
+
     # TODO: 実装
     def range_list(self, left: int, right: int, lower: int, upper: int):
         """T[left..right)の中で, lower <= x < upperを満たすxを頻度とともに返す
@@ -0,0 +1,103 @@
+import mmap as _mmap
+import struct
+from array import array
+from typing import Union
+
+
+# ファイルの先頭に書く識別子
+MAGIC = b"ARRFILE1"
+# 各配列の先頭は8byte境界に揃える
+ALIGN = 8
+
+ArrayLike = Union[array, memoryview]
+
+
+def _padding(size: int) -> int:
+    """sizeをALIGNの倍数にするために足すbyte数"""
+    return -size % ALIGN
+
+
+def save_arrays(path: str, name: str, meta: list[int], arrays: list[array]):
+    """整数のメタデータと, 固定長の数値の配列をまとめてファイルに書き込む
+
+    Args:
+        path (str): 書き込むファイルのパス
+        name (str): 内容の種類を表す名前. 読み込み時に照合する.
+        meta (list[int]): メタデータ. 各要素はint64.
+        arrays (list[array]): 配列. typecodeはB, H, q, Q のいずれか.
+
+    Notes:
+        形式 (整数は全てlittle endian):
+            MAGIC (8byte), 名前の長さ, 名前 (8byte境界まで0埋め),
+            メタデータの個数, 配列の個数 (各8byte), メタデータ (各8byte),
+            各配列について typecode (8byte, 0埋め), byte数 (8byte), 内容 (8byte境界まで0埋め)
+    """
+    encoded = name.encode()
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<q", len(encoded)))
+        f.write(encoded + bytes(_padding(len(encoded))))
+        f.write(struct.pack("<qq", len(meta), len(arrays)))
+        f.write(struct.pack(f"<{len(meta)}q", *meta))
+        for A in arrays:
+            data = A.tobytes()
+            f.write(A.typecode.encode().ljust(8, b"\x00"))
+            f.write(struct.pack("<q", len(data)))
+            f.write(data + bytes(_padding(len(data))))
+
+
+def load_arrays(path: str, name: str, mmap: bool = True) -> tuple[list[int], list[ArrayLike]]:
+    """save_arraysで書き込んだファイルを読み込む
+
+    Args:
+        path (str): 読み込むファイルのパス
+        name (str): 内容の種類を表す名前. 書き込み時の名前と一致する必要がある.
+        mmap (bool): Trueの場合, ファイルを読み取り専用でメモリマップし, 配列はコピーせずmemoryviewで返す.
+            Falseの場合, 配列はarrayにコピーして返す.
+
+    Returns:
+        tuple[list[int], list[array | memoryview]]: (メタデータ, 配列)
+
+    Raises:
+        ValueError: 形式または名前が一致しない場合
+
+    Notes:
+        mmap = Trueの場合, 同じファイルを読み込んだプロセス間でページキャッシュを共有できる.
+        ファイルは返した配列が参照されている間マップされたままになる.
+    """
+    with open(path, "rb") as f:
+        if mmap:
+            buffer = memoryview(_mmap.mmap(f.fileno(), 0, access=_mmap.ACCESS_READ))
+        else:
+            buffer = memoryview(f.read())
+
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"{path} is not an array file")
+    offset = len(MAGIC)
+
+    (name_size,) = struct.unpack_from("<q", buffer, offset)
+    offset += 8
+    stored_name = bytes(buffer[offset: offset + name_size]).decode()
+    if stored_name != name:
+        raise ValueError(f"{path} contains {stored_name}, not {name}")
+    offset += name_size + _padding(name_size)
+
+    num_meta, num_arrays = struct.unpack_from("<qq", buffer, offset)
+    offset += 16
+    meta = list(struct.unpack_from(f"<{num_meta}q", buffer, offset))
+    offset += 8 * num_meta
+
+    arrays: list[ArrayLike] = []
+    for _ in range(num_arrays):
+        typecode = bytes(buffer[offset: offset + 1]).decode()
+        (size,) = struct.unpack_from("<q", buffer, offset + 8)
+        offset += 16
+        data = buffer[offset: offset + size]
+        if mmap:
+            arrays.append(data.cast(typecode))
+        else:
+            A = array(typecode)
+            A.frombytes(data)
+            arrays.append(A)
+        offset += size + _padding(size)
+    return meta, arrays
@@ -1,23 +1,44 @@
 from typing import Optional
-from itertools import accumulate
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import accumulate, compress, count, islice
 
 from src.DataStructures.BitVector.bit_vector_base import BitVectorBase
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# selectのサンプリング間隔 (何個おきに位置を記録するか)
+SELECT_SAMPLE = 16
+
 
 class BitVectorAcc(BitVectorBase):
     """0-1の配列Bに対して, 累積和を使用したビットベクトル
 
     Attributes:
         B (list[int]): 要素は0 or 1
-        acc (list[int]): Bの累積和
+        acc (array): Bの累積和. array("q").
+        ones (int): Bの1の個数
+        select0_samples (list[int]): select0_samples[j]: 16j+1個目の0のindex
+        select1_samples (list[int]): select1_samples[j]: 16j+1個目の1のindex
 
     Methods:
         - rank0(i): B[0..i)の0の個数. O(1).
         - rank1(i): B[0..i)の1の個数. O(1).
+        - rank1_many(indices): 各iについてrank1(indices[i]). O(Q).
         - rank0_all(): Bの0の個数. O(1).
         - rank1_all(): Bの1の個数. O(1).
-        - select0(k): 0がk番目に現れるindex. O(logN)
-        - select1(k): 1がk番目に現れるindex. O(logN)
+        - select0(k): 0がk番目に現れるindex. O(サンプル間の長さ).
+        - select1(k): 1がk番目に現れるindex. O(log(サンプル間の長さ)).
+
+    Notes:
+        - selectは, 直前のサンプルの位置から探す.
+          select1は累積和の二分探索, select0はlist.indexによる走査 (どちらもC実装).
+        - 0, 1が極端に偏っていない場合, サンプル間の長さはO(SELECT_SAMPLE)
     """
 
     def __init__(self, B: list[int]):
@@ -27,7 +48,11 @@ class BitVectorAcc(BitVectorBase):
             B (list[int]): 要素は0 or 1
         """
         self.B = B
-        self.acc = list(accumulate(B))
+        self.acc = array("q", accumulate(B))
+        self.ones = self.acc[-1] if B else 0
+        # SELECT_SAMPLE個おきに, 0, 1の位置を記録する
+        self.select1_samples = list(islice(compress(count(), B), 0, None, SELECT_SAMPLE))
+        self.select0_samples = list(islice(compress(count(), [b ^ 1 for b in B]), 0, None, SELECT_SAMPLE))
 
     def __len__(self) -> int:
         """元の配列の長さ
@@ -48,6 +73,17 @@ class BitVectorAcc(BitVectorBase):
         """
         return self.B[i]
 
+    def to_bytes(self) -> bytes:
+        """元の配列Bを, 1要素1byte (0 or 1) のbytesにする
+
+        Returns:
+            bytes: B
+
+        TimeComplexity:
+            O(N)
+        """
+        return bytes(self.B)
+
     def rank0(self, i: int) -> int:
         """元の配列B[0..i)の0の個数
 
@@ -82,6 +118,27 @@ class BitVectorAcc(BitVectorBase):
         i = min(i, len(self))
         return self.acc[i - 1]
 
+    def rank1_many(self, indices: Sequence[int]) -> list[int]:
+        """各iについて, rank1(indices[i])をまとめて計算する
+
+        Args:
+            indices (Sequence[int]): 上限の列. numpy配列も可.
+
+        Returns:
+            list[int] | np.ndarray: 各上限に対する1の個数. numpyがある場合はnp.ndarray.
+
+        TimeComplexity:
+            O(Q)
+        """
+        if np is None:
+            return super().rank1_many(indices)
+
+        I = np.clip(np.asarray(indices, dtype=np.int64), 0, len(self))
+        if not len(self):
+            return np.zeros(I.shape, dtype=np.int64)
+        acc = np.frombuffer(self.acc, dtype=np.int64)
+        return np.where(I > 0, acc[I - 1], 0)
+
     def rank0_all(self) -> int:
         """元の配列Bの0の個数
 
@@ -91,7 +148,7 @@ class BitVectorAcc(BitVectorBase):
         TimeComplexity:
             O(1)
         """
-        return self.rank0(len(self.B))
+        return len(self.B) - self.ones
 
     def rank1_all(self) -> int:
         """元の配列Bの1の個数
@@ -102,7 +159,7 @@ class BitVectorAcc(BitVectorBase):
         TimeComplexity:
             O(1)
         """
-        return self.rank1(len(self.B))
+        return self.ones
 
     def select0(self, k: int) -> Optional[int]:
         """0がk番目に現れるindexを返す
@@ -114,19 +171,17 @@ class BitVectorAcc(BitVectorBase):
             Optional[int]: 該当のindex. 存在しない場合はNone
 
         TimeComplexity:
-            O(log N)
+            O(サンプル間の長さ)
         """
         if (k <= 0) or (k > self.rank0_all()):
             return None
 
-        left, right = 0, len(self)
-        while (right - left) > 1:
-            mid = (left + right) // 2
-            if self.rank0(mid) < k:
-                left = mid
-            else:
-                right = mid
-        return left
+        # 直前のサンプルの位置から, 残りの個数だけ0を探す
+        k -= 1
+        index = self.select0_samples[k // SELECT_SAMPLE]
+        for _ in range(k % SELECT_SAMPLE):
+            index = self.B.index(0, index + 1)
+        return index
 
     def select1(self, k: int) -> Optional[int]:
         """1がk番目に現れるindexを返す
@@ -138,16 +193,14 @@ class BitVectorAcc(BitVectorBase):
             Optional[int]: 該当のindex. 存在しない場合はNone
 
         TimeComplexity:
-            O(log N)
+            O(log(サンプル間の長さ))
         """
-        if (k <= 0) or (k > self.rank1_all()):
+        if (k <= 0) or (k > self.ones):
             return None
 
-        left, right = 0, len(self)
-        while (right - left) > 1:
-            mid = (left + right) // 2
-            if self.rank1(mid) < k:
-                left = mid
-            else:
-                right = mid
-        return left
+        # k番目の1は, 直前のサンプルの位置から次のサンプルの位置の間にある
+        j = (k - 1) // SELECT_SAMPLE
+        left = self.select1_samples[j]
+        right = self.select1_samples[j + 1] if j + 1 < len(self.select1_samples) else len(self)
+        # B[0..i]の1の個数 (acc[i]) が k 以上となる最小のi
+        return bisect_left(self.acc, k, left, right)
@@ -1,6 +1,10 @@
 from abc import ABCMeta, abstractmethod
+from array import array
+from collections.abc import Sequence
 from typing import Optional
 
+from src.DataStructures.BitVector.array_file import ArrayLike, load_arrays, save_arrays
+
 
 class BitVectorBase(metaclass=ABCMeta):
     @abstractmethod
@@ -107,3 +111,78 @@ class BitVectorBase(metaclass=ABCMeta):
             O(1) or O(log N)で実装する
         """
         pass
+
+    def rank1_many(self, indices: Sequence[int]) -> list[int]:
+        """各iについて, rank1(indices[i])をまとめて計算する
+
+        Args:
+            indices (Sequence[int]): 上限の列. numpy配列も可.
+
+        Returns:
+            list[int] | np.ndarray: 各上限に対する1の個数
+
+        Note:
+            O(Q * rank1). まとめて計算できる方法がある場合はサブクラスで上書きする
+        """
+        return [self.rank1(i) for i in map(int, indices)]
+
+    def to_bytes(self) -> bytes:
+        """元の配列Bを, 1要素1byte (0 or 1) のbytesにする
+
+        Returns:
+            bytes: B
+
+        Note:
+            O(N). 効率のよい方法がある場合はサブクラスで上書きする
+        """
+        return bytes(self[i] for i in range(len(self)))
+
+    def _to_arrays(self) -> tuple[list[int], list[array]]:
+        """保存用に, メタデータと配列に変換する
+
+        Returns:
+            tuple[list[int], list[array]]: (メタデータ, 配列)
+
+        Note:
+            既定では元の配列Bのみを保存する. 補助配列も保存できる場合はサブクラスで上書きする
+        """
+        return [], [array("B", self.to_bytes())]
+
+    @classmethod
+    def _from_arrays(cls, meta: list[int], arrays: list[ArrayLike]) -> "BitVectorBase":
+        """_to_arraysの結果から復元する
+
+        Args:
+            meta (list[int]): メタデータ
+            arrays (list[array | memoryview]): 配列
+
+        Returns:
+            BitVectorBase: 復元したビットベクトル
+        """
+        return cls(list(arrays[0]))
+
+    def save(self, path: str):
+        """ファイルに保存する
+
+        Args:
+            path (str): ファイルのパス
+        """
+        meta, arrays = self._to_arrays()
+        save_arrays(path, type(self).__name__, meta, arrays)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "BitVectorBase":
+        """saveで保存したファイルから読み込む
+
+        Args:
+            path (str): ファイルのパス
+            mmap (bool): ファイルをメモリマップするかどうか. 補助配列を保存しているクラスでは, コピーせずに参照する.
+
+        Returns:
+            BitVectorBase: 読み込んだビットベクトル
+
+        Raises:
+            ValueError: 別のクラスで保存したファイルの場合
+        """
+        meta, arrays = load_arrays(path, cls.__name__, mmap)
+        return cls._from_arrays(meta, arrays)
@@ -0,0 +1,337 @@
+from typing import Optional
+
+from src.DataStructures.BitVector.bit_vector_base import BitVectorBase
+
+
+# ブロックの長さの目安. 長さが2倍を超えたブロックは分割する.
+BLOCK_SIZE = 1024
+
+
+class DynamicBitVector(BitVectorBase):
+    """挿入・削除・更新ができるビットベクトル
+
+    0-1の配列Bを長さBLOCK_SIZE程度のブロック (bytearray) に分割して持ち,
+    各ブロックの長さと1の個数をBinary Indexed Treeで管理する.
+    i番目の要素を含むブロックはBIT上の二分探索で求め, ブロック内の操作はbytearrayのメソッド (C実装) で行う.
+
+    Attributes:
+        N (int): 元の配列の長さ
+        ones (int): Bの1の個数
+        blocks (list[bytearray]): Bをブロックに分割したもの
+        size_tree (list[int]): 各ブロックの長さのBIT. 1-indexed.
+        ones_tree (list[int]): 各ブロックの1の個数のBIT. 1-indexed.
+
+    Methods:
+        - insert(i, bit): B[i]の前にbitを挿入する. O(logN + BLOCK_SIZE).
+        - erase(i): B[i]を削除し, その値を返す. O(logN + BLOCK_SIZE).
+        - set(i, bit): B[i] = bit. O(logN).
+        - rank0(i): B[0..i)の0の個数. O(logN + BLOCK_SIZE).
+        - rank1(i): B[0..i)の1の個数. O(logN + BLOCK_SIZE).
+        - rank0_all(): Bの0の個数. O(1).
+        - rank1_all(): Bの1の個数. O(1).
+        - select0(k): 0がk番目に現れるindex. O(logN + BLOCK_SIZE).
+        - select1(k): 1がk番目に現れるindex. O(logN + BLOCK_SIZE).
+
+    Notes:
+        - ブロック内の処理はC実装のため, BLOCK_SIZEの項は実質的に小さい
+        - ブロックの分割・削除のたびにBITを作り直す (O(N / BLOCK_SIZE), 償却O(1 / BLOCK_SIZE))
+    """
+
+    def __init__(self, B: Optional[list[int]] = None):
+        """動的ビットベクトル
+
+        Args:
+            B (Optional[list[int]]): 要素は0 or 1
+
+        TimeComplexity:
+            O(N)
+        """
+        B = B if B is not None else []
+        self.N = len(B)
+        self.blocks = [bytearray(B[i: i + BLOCK_SIZE]) for i in range(0, len(B), BLOCK_SIZE)] or [bytearray()]
+        self.ones = sum(block.count(1) for block in self.blocks)
+        self._build()
+
+    def _build(self):
+        """ブロックの長さと1の個数のBITを構築する"""
+        M = len(self.blocks)
+        self.size_tree = [0] + [len(block) for block in self.blocks]
+        self.ones_tree = [0] + [block.count(1) for block in self.blocks]
+        for i in range(1, M + 1):
+            j = i + (i & -i)
+            if j <= M:
+                self.size_tree[j] += self.size_tree[i]
+                self.ones_tree[j] += self.ones_tree[i]
+        self._log = 1 << (M.bit_length() - 1)
+
+    def _add(self, b: int, size: int, ones: int):
+        """ブロックbの長さにsize, 1の個数にonesを足す
+
+        Args:
+            b (int): ブロック番号. 0-indexed.
+            size (int): 長さの増分
+            ones (int): 1の個数の増分
+        """
+        b += 1
+        M = len(self.blocks)
+        while b <= M:
+            self.size_tree[b] += size
+            self.ones_tree[b] += ones
+            b += b & -b
+
+    def _locate(self, i: int) -> tuple[int, int, int]:
+        """B[i]を含むブロックを求める
+
+        Args:
+            i (int): index. 0 <= i <= N.
+
+        Returns:
+            tuple[int, int, int]: (ブロック番号, ブロック内のindex, そのブロックより前の1の個数)
+
+        Notes:
+            i = Nの場合は, 最後のブロックの末尾を返す
+        """
+        M = len(self.blocks)
+        b, ones = 0, 0
+        step = self._log
+        # 先頭からの長さの和が i 以下となる最大のブロック数
+        while step:
+            if b + step <= M and self.size_tree[b + step] <= i:
+                b += step
+                i -= self.size_tree[b]
+                ones += self.ones_tree[b]
+            step >>= 1
+
+        if b == M:
+            b -= 1
+            i += len(self.blocks[b])
+            ones -= self.blocks[b].count(1)
+        return b, i, ones
+
+    def __len__(self) -> int:
+        """元の配列の長さ
+
+        Returns:
+            int: 元の配列の長さ
+        """
+        return self.N
+
+    def __getitem__(self, i: int) -> int:
+        """B[i]を取得
+
+        Args:
+            i (int): i番目の要素
+
+        Returns:
+            int: B[i]
+        """
+        if not (0 <= i < self.N):
+            raise IndexError("list index out of range")
+        b, i, _ = self._locate(i)
+        return self.blocks[b][i]
+
+    def to_bytes(self) -> bytes:
+        """元の配列Bを, 1要素1byte (0 or 1) のbytesにする
+
+        Returns:
+            bytes: B
+
+        TimeComplexity:
+            O(N)
+        """
+        return b"".join(self.blocks)
+
+    def insert(self, i: int, bit: int):
+        """B[i]の前にbitを挿入する
+
+        Args:
+            i (int): index. 0 <= i <= N. i = Nの場合は末尾に追加する.
+            bit (int): 0 or 1
+
+        TimeComplexity:
+            O(logN + BLOCK_SIZE)
+        """
+        if not (0 <= i <= self.N):
+            raise IndexError("list index out of range")
+
+        b, i, _ = self._locate(i)
+        block = self.blocks[b]
+        block.insert(i, bit)
+        self.N += 1
+        self.ones += bit
+
+        # 大きくなりすぎたブロックは2つに分割する
+        if len(block) > 2 * BLOCK_SIZE:
+            self.blocks[b: b + 1] = [block[:BLOCK_SIZE], block[BLOCK_SIZE:]]
+            self._build()
+        else:
+            self._add(b, 1, bit)
+
+    def erase(self, i: int) -> int:
+        """B[i]を削除する
+
+        Args:
+            i (int): index
+
+        Returns:
+            int: 削除した値
+
+        TimeComplexity:
+            O(logN + BLOCK_SIZE)
+        """
+        if not (0 <= i < self.N):
+            raise IndexError("list index out of range")
+
+        b, i, _ = self._locate(i)
+        block = self.blocks[b]
+        bit = block.pop(i)
+        self.N -= 1
+        self.ones -= bit
+
+        # 空になったブロックは削除する (ブロックは常に1つ以上)
+        if not block and len(self.blocks) > 1:
+            del self.blocks[b]
+            self._build()
+        else:
+            self._add(b, -1, -bit)
+        return bit
+
+    def set(self, i: int, bit: int):
+        """B[i] = bit
+
+        Args:
+            i (int): index
+            bit (int): 0 or 1
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= i < self.N):
+            raise IndexError("list index out of range")
+
+        b, i, _ = self._locate(i)
+        diff = bit - self.blocks[b][i]
+        self.blocks[b][i] = bit
+        self.ones += diff
+        self._add(b, 0, diff)
+
+    def rank0(self, i: int) -> int:
+        """元の配列B[0..i)の0の個数
+
+        Args:
+            i (int): 上限
+
+        Returns:
+            int: 0の個数
+
+        TimeComplexity:
+            O(logN + BLOCK_SIZE)
+        """
+        if i <= 0:
+            return 0
+        i = min(i, self.N)
+        return i - self.rank1(i)
+
+    def rank1(self, i: int) -> int:
+        """元の配列B[0..i)の1の個数
+
+        Args:
+            i (int): 上限
+
+        Returns:
+            int: 1の個数
+
+        TimeComplexity:
+            O(logN + BLOCK_SIZE)
+        """
+        if i <= 0:
+            return 0
+        if i >= self.N:
+            return self.ones
+
+        b, i, ones = self._locate(i)
+        return ones + self.blocks[b].count(1, 0, i)
+
+    def rank0_all(self) -> int:
+        """元の配列Bの0の個数
+
+        Returns:
+            int: 0の個数
+
+        TimeComplexity:
+            O(1)
+        """
+        return self.N - self.ones
+
+    def rank1_all(self) -> int:
+        """元の配列Bの1の個数
+
+        Returns:
+            int: 1の個数
+
+        TimeComplexity:
+            O(1)
+        """
+        return self.ones
+
+    def _select(self, bit: int, k: int) -> int:
+        """bitがk番目に現れるindexを返す
+
+        Args:
+            bit (int): 0 or 1
+            k (int): k番目. 1-indexed. 1 <= k <= (bitの個数).
+
+        Returns:
+            int: 該当のindex
+        """
+        # bitの個数の和が k 未満となる最大のブロック数
+        M = len(self.blocks)
+        b, position = 0, 0
+        step = self._log
+        while step:
+            if b + step <= M:
+                count = self.ones_tree[b + step] if bit else self.size_tree[b + step] - self.ones_tree[b + step]
+                if count < k:
+                    b += step
+                    k -= count
+                    position += self.size_tree[b]
+            step >>= 1
+
+        # ブロック内でk番目のbitを探す
+        block = self.blocks[b]
+        i = -1
+        for _ in range(k):
+            i = block.find(bit, i + 1)
+        return position + i
+
+    def select0(self, k: int) -> Optional[int]:
+        """0がk番目に現れるindexを返す
+
+        Args:
+            k (int): k番目. 1-indexed.
+
+        Returns:
+            Optional[int]: 該当のindex. 存在しない場合はNone
+
+        TimeComplexity:
+            O(logN + BLOCK_SIZE)
+        """
+        if (k <= 0) or (k > self.rank0_all()):
+            return None
+        return self._select(0, k)
+
+    def select1(self, k: int) -> Optional[int]:
+        """1がk番目に現れるindexを返す
+
+        Args:
+            k (int): k番目. 1-indexed.
+
+        Returns:
+            Optional[int]: 該当のindex. 存在しない場合はNone
+
+        TimeComplexity:
+            O(logN + BLOCK_SIZE)
+        """
+        if (k <= 0) or (k > self.ones):
+            return None
+        return self._select(1, k)
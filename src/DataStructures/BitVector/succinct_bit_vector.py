@@ -0,0 +1,398 @@
+from typing import Optional
+from array import array
+from collections.abc import Sequence
+
+from src.DataStructures.BitVector.bit_vector_base import BitVectorBase
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# 1ワードのbit数
+WORD_SIZE = 64
+# 大ブロックあたりのワード数 (大ブロック = 512bit)
+SUPER_BLOCK_WORDS = 8
+# selectのサンプリング間隔 (何個おきに位置を記録するか)
+SELECT_SAMPLE = 512
+# 0, 1のbyteを"0", "1"の文字に変換する表
+_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+_FROM_ASCII = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def _popcount(words):
+    """各ワードの1の個数
+
+    Args:
+        words (np.ndarray): uint64の配列
+
+    Returns:
+        np.ndarray: 各要素の1の個数. int64.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).astype(np.int64)
+    return np.unpackbits(words.view(np.uint8)).reshape(-1, WORD_SIZE).sum(axis=1, dtype=np.int64)
+
+
+class SuccinctBitVector(BitVectorBase):
+    """0-1の配列Bを64bitのワード列で持ち, 大ブロック・小ブロックの2段の累積和でrankを求める簡潔ビットベクトル
+
+    小ブロックは1ワード (64bit), 大ブロックは8ワード (512bit).
+    rank1(i) = (iを含む大ブロックより前の1の個数) + (大ブロックの先頭からiを含むワードの前までの1の個数) + (ワード内のpopcount)
+
+    Attributes:
+        N (int): 元の配列の長さ
+        words (array): words[w]: B[64w..64w+64)をbit列にしたもの. array("Q").
+        super_block (array): super_block[s]: B[0..512s)の1の個数. array("Q").
+        block (array): block[w]: B[512(w//8)..64w)の1の個数. array("H").
+        ones (int): Bの1の個数
+        select1_samples (array): select1_samples[j]: 512j+1個目の1を含むワード番号
+        select0_samples (array): select0_samples[j]: 512j+1個目の0を含むワード番号
+
+    Methods:
+        - rank0(i): B[0..i)の0の個数. O(1).
+        - rank1(i): B[0..i)の1の個数. O(1).
+        - rank1_many(indices): 各iについてrank1(indices[i]). O(Q).
+        - rank0_all(): Bの0の個数. O(1).
+        - rank1_all(): Bの1の個数. O(1).
+        - select0(k): 0がk番目に現れるindex. O(log(サンプル間のワード数)).
+        - select1(k): 1がk番目に現れるindex. O(log(サンプル間のワード数)).
+
+    Notes:
+        - 1bitあたりのメモリは約1.4bit (BitVectorAccは1bitあたり数十byte)
+    """
+
+    def __init__(self, B: list[int]):
+        """簡潔ビットベクトル
+
+        Args:
+            B (list[int]): 要素は0 or 1
+
+        TimeComplexity:
+            O(N)
+        """
+        self.N = len(B)
+        # B[i]がi bit目になる整数を作り, 64bitずつに分ける
+        value = int(bytes(B[::-1]).translate(_TO_ASCII), 2) if B else 0
+        num_words = (self.N + WORD_SIZE - 1) // WORD_SIZE
+        self.words = array("Q")
+        self.words.frombytes(value.to_bytes(num_words * 8, "little"))
+        self._build()
+
+    @classmethod
+    def from_words(cls, words: array, N: int) -> "SuccinctBitVector":
+        """ワード列から構築する
+
+        Args:
+            words (array): ワード列. array("Q"). words[w]の下からb bit目がB[64w+b].
+            N (int): 元の配列の長さ
+
+        Returns:
+            SuccinctBitVector: 簡潔ビットベクトル
+
+        TimeComplexity:
+            O(N / 64)
+        """
+        bv = cls.__new__(cls)
+        bv.N = N
+        bv.words = words
+        bv._build()
+        return bv
+
+    def _to_arrays(self) -> tuple[list[int], list[array]]:
+        """保存用に, メタデータと配列に変換する
+
+        Returns:
+            tuple[list[int], list[array]]: ([N, ones], [words, super_block, block, select1_samples, select0_samples])
+        """
+        arrays = [self.words, self.super_block, self.block, self.select1_samples, self.select0_samples]
+        return [self.N, self.ones], [array(A.format, A) if isinstance(A, memoryview) else A for A in arrays]
+
+    @classmethod
+    def _from_arrays(cls, meta: list[int], arrays: list) -> "SuccinctBitVector":
+        """_to_arraysの結果から, 補助配列を作り直さずに復元する
+
+        Args:
+            meta (list[int]): [N, ones]
+            arrays (list[array | memoryview]): [words, super_block, block, select1_samples, select0_samples]
+
+        Returns:
+            SuccinctBitVector: 簡潔ビットベクトル
+
+        TimeComplexity:
+            O(1)
+        """
+        bv = cls.__new__(cls)
+        bv.N, bv.ones = meta
+        bv.words, bv.super_block, bv.block, bv.select1_samples, bv.select0_samples = arrays
+        return bv
+
+    def _build(self):
+        """rank, selectの補助配列を構築する
+
+        Notes:
+            numpyがある場合はまとめてベクトル演算する.
+        """
+        if np is not None and len(self.words) > 0:
+            self._build_numpy()
+            return
+
+        words = self.words
+        self.super_block = array("Q", [0]) * ((len(words) + SUPER_BLOCK_WORDS - 1) // SUPER_BLOCK_WORDS)
+        self.block = array("H", [0]) * len(words)
+
+        total = 0
+        select1_samples, select0_samples = [], []
+        for w, word in enumerate(words):
+            if w % SUPER_BLOCK_WORDS == 0:
+                self.super_block[w // SUPER_BLOCK_WORDS] = total
+            self.block[w] = total - self.super_block[w // SUPER_BLOCK_WORDS]
+
+            # このワードに含まれる, 512j+1個目の1, 0を記録
+            count = word.bit_count()
+            zeros = min(WORD_SIZE, self.N - w * WORD_SIZE) - count
+            while len(select1_samples) * SELECT_SAMPLE < total + count:
+                select1_samples.append(w)
+            while len(select0_samples) * SELECT_SAMPLE < w * WORD_SIZE - total + zeros:
+                select0_samples.append(w)
+            total += count
+
+        self.ones = total
+        self.select1_samples = array("q", select1_samples)
+        self.select0_samples = array("q", select0_samples)
+
+    def _build_numpy(self):
+        """numpyを使って, rank, selectの補助配列を構築する"""
+        words = np.frombuffer(self.words, dtype=np.uint64)
+        counts = np.unpackbits(words.view(np.uint8)).reshape(-1, WORD_SIZE).sum(axis=1, dtype=np.int64)
+
+        # acc[w]: B[0..64w)の1の個数
+        acc = np.zeros(len(words) + 1, dtype=np.int64)
+        np.cumsum(counts, out=acc[1:])
+        super_block = acc[:-1:SUPER_BLOCK_WORDS]
+        block = acc[:-1] - np.repeat(super_block, SUPER_BLOCK_WORDS)[: len(words)]
+        self.ones = int(acc[-1])
+        self.super_block = array("Q", super_block.astype(np.uint64).tobytes())
+        self.block = array("H", block.astype(np.uint16).tobytes())
+
+        # 512j+1個目の1 (0) を含むワード = acc[w] <= 512j となる最大のw
+        zero_acc = np.arange(len(words) + 1, dtype=np.int64) * WORD_SIZE - acc
+        zero_acc[-1] = self.N - self.ones
+        targets1 = np.arange(0, self.ones, SELECT_SAMPLE, dtype=np.int64)
+        targets0 = np.arange(0, self.N - self.ones, SELECT_SAMPLE, dtype=np.int64)
+        self.select1_samples = array("q", (np.searchsorted(acc, targets1, side="right") - 1).tobytes())
+        self.select0_samples = array("q", (np.searchsorted(zero_acc, targets0, side="right") - 1).tobytes())
+
+    def __len__(self) -> int:
+        """元の配列の長さ
+
+        Returns:
+            int: 元の配列の長さ
+        """
+        return self.N
+
+    def __getitem__(self, i: int) -> int:
+        """B[i]を取得
+
+        Args:
+            i (int): i番目の要素
+
+        Returns:
+            int: B[i]
+        """
+        if not (0 <= i < self.N):
+            raise IndexError("list index out of range")
+        return (self.words[i >> 6] >> (i & 63)) & 1
+
+    def to_bytes(self) -> bytes:
+        """元の配列Bを, 1要素1byte (0 or 1) のbytesにする
+
+        Returns:
+            bytes: B
+
+        TimeComplexity:
+            O(N)
+        """
+        if self.N == 0:
+            return b""
+        # B[0]が最上位になるように, 2進表記を反転する
+        value = int.from_bytes(self.words.tobytes(), "little")
+        return f"{value:0{self.N}b}"[::-1].encode().translate(_FROM_ASCII)
+
+    def _rank1_word(self, w: int) -> int:
+        """B[0..64w)の1の個数
+
+        Args:
+            w (int): ワード番号
+
+        Returns:
+            int: 1の個数
+        """
+        return self.super_block[w >> 3] + self.block[w]
+
+    def rank0(self, i: int) -> int:
+        """元の配列B[0..i)の0の個数
+
+        Args:
+            i (int): 上限
+
+        Returns:
+            int: 0の個数
+
+        TimeComplexity:
+            O(1)
+        """
+        if i <= 0:
+            return 0
+        i = min(i, self.N)
+        return i - self.rank1(i)
+
+    def rank1(self, i: int) -> int:
+        """元の配列B[0..i)の1の個数
+
+        Args:
+            i (int): 上限
+
+        Returns:
+            int: 1の個数
+
+        TimeComplexity:
+            O(1)
+        """
+        if i <= 0:
+            return 0
+        if i >= self.N:
+            return self.ones
+
+        w = i >> 6
+        return self.super_block[w >> 3] + self.block[w] + (self.words[w] & ((1 << (i & 63)) - 1)).bit_count()
+
+    def rank1_many(self, indices: Sequence[int]) -> list[int]:
+        """各iについて, rank1(indices[i])をまとめて計算する
+
+        Args:
+            indices (Sequence[int]): 上限の列. numpy配列も可.
+
+        Returns:
+            list[int] | np.ndarray: 各上限に対する1の個数. numpyがある場合はnp.ndarray.
+
+        TimeComplexity:
+            O(Q)
+
+        Notes:
+            numpyがある場合, rank1と同じく大ブロック・小ブロック・ワード内のpopcountの和をまとめて計算する
+        """
+        if np is None:
+            return super().rank1_many(indices)
+
+        I = np.clip(np.asarray(indices, dtype=np.int64), 0, self.N)
+        if self.N == 0:
+            return np.zeros(I.shape, dtype=np.int64)
+
+        # i >= N は最後に self.ones に置き換えるので, ワード番号は0を使っておく
+        inside = I < self.N
+        i = np.where(inside, I, 0)
+        w = i >> 6
+        words = np.frombuffer(self.words, dtype=np.uint64)[w]
+        mask = (np.uint64(1) << (i & 63).astype(np.uint64)) - np.uint64(1)
+        super_block = np.frombuffer(self.super_block, dtype=np.uint64)[w >> 3].astype(np.int64)
+        block = np.frombuffer(self.block, dtype=np.uint16)[w]
+        return np.where(inside, super_block + block + _popcount(words & mask), self.ones)
+
+    def rank0_all(self) -> int:
+        """元の配列Bの0の個数
+
+        Returns:
+            int: 0の個数
+
+        TimeComplexity:
+            O(1)
+        """
+        return self.N - self.ones
+
+    def rank1_all(self) -> int:
+        """元の配列Bの1の個数
+
+        Returns:
+            int: 1の個数
+
+        TimeComplexity:
+            O(1)
+        """
+        return self.ones
+
+    def _select_in_word(self, word: int, k: int) -> int:
+        """wordの下から数えてk番目 (0-indexed) に立っているbitの位置
+
+        Args:
+            word (int): ワード
+            k (int): 0-indexed.
+
+        Returns:
+            int: bitの位置
+        """
+        # 下位のbitをk個消す
+        for _ in range(k):
+            word &= word - 1
+        return (word & -word).bit_length() - 1
+
+    def select0(self, k: int) -> Optional[int]:
+        """0がk番目に現れるindexを返す
+
+        Args:
+            k (int): k番目. 1-indexed.
+
+        Returns:
+            Optional[int]: 該当のindex. 存在しない場合はNone
+
+        TimeComplexity:
+            O(log(サンプル間のワード数))
+        """
+        if (k <= 0) or (k > self.rank0_all()):
+            return None
+
+        # サンプルから, k番目の0を含むワードの範囲を絞って二分探索
+        k -= 1
+        j = k // SELECT_SAMPLE
+        left = self.select0_samples[j]
+        right = self.select0_samples[j + 1] + 1 if j + 1 < len(self.select0_samples) else len(self.words)
+        while right - left > 1:
+            mid = (left + right) >> 1
+            if mid * WORD_SIZE - self._rank1_word(mid) <= k:
+                left = mid
+            else:
+                right = mid
+
+        k -= left * WORD_SIZE - self._rank1_word(left)
+        return left * WORD_SIZE + self._select_in_word(~self.words[left] & 0xFFFFFFFFFFFFFFFF, k)
+
+    def select1(self, k: int) -> Optional[int]:
+        """1がk番目に現れるindexを返す
+
+        Args:
+            k (int): k番目. 1-indexed.
+
+        Returns:
+            Optional[int]: 該当のindex. 存在しない場合はNone
+
+        TimeComplexity:
+            O(log(サンプル間のワード数))
+        """
+        if (k <= 0) or (k > self.ones):
+            return None
+
+        # サンプルから, k番目の1を含むワードの範囲を絞って二分探索
+        k -= 1
+        j = k // SELECT_SAMPLE
+        left = self.select1_samples[j]
+        right = self.select1_samples[j + 1] + 1 if j + 1 < len(self.select1_samples) else len(self.words)
+        while right - left > 1:
+            mid = (left + right) >> 1
+            if self._rank1_word(mid) <= k:
+                left = mid
+            else:
+                right = mid
+
+        k -= self._rank1_word(left)
+        return left * WORD_SIZE + self._select_in_word(self.words[left], k)
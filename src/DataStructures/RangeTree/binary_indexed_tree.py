@@ -1,5 +1,12 @@
 from typing import Optional
 from array import array
+from itertools import accumulate
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 class BinaryIndexedTree:
@@ -16,6 +23,8 @@ class BinaryIndexedTree:
         sum(i): sum(A[0..i)), O(logN)
         sum_range(i, j): sum(A[i..j)), O(logN)
         lower_bound(x): A[0] + A[1] + ... A[i - 1] >= x となる最小のi, O(logN)
+        query_many(lefts, rights): 各iについてsum_range(lefts[i], rights[i]), O(Q logN)
+        add_many(indices, values): 各iについてadd(indices[i], values[i]), O(Q logN)
 
     Notes:
         - 0-indexedで扱う (内部では1-indexedで扱う)
@@ -26,12 +35,52 @@ class BinaryIndexedTree:
 
         Args:
             A (list[int]): 元の配列
+
+        TimeComplexity:
+            O(N)
         """
         self.size = len(A) + 1
-        self.data = array("q", [0] * self.size)
+        self.data = self._build(list(accumulate(A, initial=0)))
+
+    @classmethod
+    def from_prefix_sums(cls, S: Sequence[int]) -> "BinaryIndexedTree":
+        """累積和からBinary Indexed Treeを構築する
+
+        Args:
+            S (Sequence[int]): 元の配列Aの累積和. S[i] = A[0] + ... + A[i]. (list(accumulate(A))と同じ)
+
+        Returns:
+            BinaryIndexedTree: Aに対するBinary Indexed Tree
+
+        TimeComplexity:
+            O(N)
+        """
+        bit = cls.__new__(cls)
+        bit.size = len(S) + 1
+        bit.data = bit._build([0, *S])
+        return bit
+
+    def _build(self, prefix: list[int]) -> array:
+        """累積和からBinary Indexed Treeを構築する
 
-        for i, a in enumerate(A):
-            self.update(i, a)
+        Args:
+            prefix (list[int]): prefix[i] = sum(A[0..i)). 長さはself.size.
+
+        Returns:
+            array: Binary Indexed Tree
+
+        TimeComplexity:
+            O(N)
+
+        Notes:
+            data[i] = sum(A[i - lsb(i)..i)) = prefix[i] - prefix[i - lsb(i)]
+        """
+        if np is not None:
+            prefix = np.asarray(prefix, dtype=np.int64)
+            i = np.arange(self.size, dtype=np.int64)
+            return array("q", (prefix - prefix[i - (i & -i)]).tobytes())
+
+        return array("q", [prefix[i] - prefix[i - (i & -i)] for i in range(self.size)])
 
     def __getitem__(self, i: int) -> int:
         """A[i]を取得.
@@ -173,3 +222,276 @@ class BinaryIndexedTree:
             length //= 2
 
         return i + 1
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int]) -> array:
+        """各iについて, sum(A[lefts[i]..rights[i]))をまとめて計算する
+
+        Args:
+            lefts (Sequence[int]): 下限indexの列. 0-indexed. numpy配列も可.
+            rights (Sequence[int]): 上限indexの列. 0-indexed. numpy配列も可.
+
+        Returns:
+            array: 各クエリの結果. typecode="q".
+
+        TimeComplexity:
+            O(Q logN)
+
+        Notes:
+            numpyがある場合, 全クエリの累積和を1段ずつまとめて計算する (段ごとにベクトル演算)
+        """
+        if np is None:
+            return array("q", map(self.sum_range, lefts, rights))
+
+        lefts = np.asarray(lefts, dtype=np.int64)
+        rights = np.asarray(rights, dtype=np.int64)
+        result = self._sum_many(rights) - self._sum_many(lefts)
+        result[lefts >= rights] = 0
+        return array("q", result.tobytes())
+
+    def _sum_many(self, indices: "np.ndarray") -> "np.ndarray":
+        """各iについて, sum(A[0..indices[i]))をまとめて計算する
+
+        Args:
+            indices (np.ndarray): indexの列. 0-indexed.
+
+        Returns:
+            np.ndarray: 各indexまでの総和
+        """
+        data = np.frombuffer(self.data, dtype=np.int64)
+        i = np.clip(indices, 0, self.size - 1)
+        s = np.zeros(i.shape, dtype=np.int64)
+        # data[0] = 0なので, 既に0になったindexはそのまま足してよい
+        while i.any():
+            s += data[i]
+            i -= i & -i
+        return s
+
+    def add_many(self, indices: Sequence[int], values: Sequence[int]):
+        """各iについて, A[indices[i]] += values[i]をまとめて行う
+
+        Args:
+            indices (Sequence[int]): indexの列. 0-indexed. numpy配列も可.
+            values (Sequence[int]): 加算する値の列. numpy配列も可.
+
+        TimeComplexity:
+            O(Q logN)
+
+        Notes:
+            numpyがある場合, 全クエリを1段ずつまとめて上に登りながら加算する
+        """
+        if np is None:
+            for i, x in zip(indices, values):
+                self.add(i, x)
+            return
+
+        data = np.frombuffer(self.data, dtype=np.int64)
+        i = np.asarray(indices, dtype=np.int64) + 1
+        x = np.asarray(values, dtype=np.int64)
+
+        # 範囲外のindexは無視する
+        mask = (0 < i) & (i < self.size)
+        i, x = i[mask], x[mask]
+        while i.size:
+            # 同じindexが複数回現れる場合も正しく加算する
+            np.add.at(data, i, x)
+            i += i & -i
+            mask = i < self.size
+            i, x = i[mask], x[mask]
+
+
+class RangeAddBinaryIndexedTree:
+    """区間加算 + 区間和を O(log N)で行う
+
+    2本のBinary Indexed Treeを使う.
+    sum(A[0..i)) = sum(data0[1..i]) + sum(data1[1..i]) * i となるように管理する.
+
+    Attributes:
+        size (int): 配列の要素数 + 1
+        data0 (array): 定数項を管理するBinary Indexed Tree. 1-indexedで扱う.
+        data1 (array): iの係数を管理するBinary Indexed Tree. 1-indexedで扱う.
+
+    Methods:
+        get(i): A[i], O(logN)
+        add(i, x): A[i] += x, O(logN)
+        range_add(i, j, x): A[i..j) += x, O(logN)
+        sum(i): sum(A[0..i)), O(logN)
+        sum_range(i, j): sum(A[i..j)), O(logN)
+
+    Notes:
+        - 0-indexedで扱う (内部では1-indexedで扱う)
+        - LazySegmentTreeのRangeSumRangeAddと同じ名前のメソッド (range_update, one_point_update, query) も持つ
+    """
+
+    def __init__(self, A: list[int]):
+        """区間加算 + 区間和 Binary Indexed Tree
+
+        Args:
+            A (list[int]): 元の配列
+
+        TimeComplexity:
+            O(N)
+        """
+        self.size = len(A) + 1
+        self.data0 = BinaryIndexedTree(A).data
+        self.data1 = array("q", [0]) * self.size
+
+    def __getitem__(self, i: int) -> int:
+        """A[i]を取得.
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: A[i]
+
+        TimeComplexity:
+            O(log N)
+        """
+        return self.get(i)
+
+    def get(self, i: int) -> int:
+        """A[i]を取得.
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: A[i]
+
+        TimeComplexity:
+            O(log N)
+        """
+        if not (0 <= i < self.size - 1):
+            raise IndexError("list index out of range")
+
+        return self.sum(i + 1) - self.sum(i)
+
+    def _add(self, i: int, x0: int, x1: int):
+        """data0[i] += x0, data1[i] += x1 (BITとしての加算)
+
+        Args:
+            i (int): index. 1-indexed.
+            x0 (int): data0に加算する値.
+            x1 (int): data1に加算する値.
+        """
+        data0, data1 = self.data0, self.data1
+        while i < self.size:
+            data0[i] += x0
+            data1[i] += x1
+            i += i & -i
+
+    def add(self, i: int, x: int):
+        """A[i] += x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (int): 加算する値.
+
+        TimeComplexity:
+            O(log N)
+        """
+        self.range_add(i, i + 1, x)
+
+    def range_add(self, i: int, j: int, x: int):
+        """A[i..j) += x
+
+        Args:
+            i (int): 下限index. 0-indexed.
+            j (int): 上限index. 0-indexed.
+            x (int): 加算する値.
+
+        TimeComplexity:
+            O(log N)
+        """
+        i = max(i, 0)
+        j = min(j, self.size - 1)
+        if i >= j:
+            return
+
+        # k in [i, j) -> sum(A[0..k))に x * (k - i)を加える
+        # k >= j -> sum(A[0..k))に x * (j - i)を加える
+        self._add(i + 1, -x * i, x)
+        self._add(j + 1, x * j, -x)
+
+    def sum(self, i: int) -> int:
+        """A[0..i)の総和
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: sum(A[:i])
+
+        TimeComplexity:
+            O(log N)
+        """
+        if i <= 0:
+            return 0
+
+        i = min(i, self.size - 1)
+        data0, data1 = self.data0, self.data1
+        s0, s1 = 0, 0
+        k = i
+        while k > 0:
+            s0 += data0[k]
+            s1 += data1[k]
+            k -= k & -k
+
+        return s0 + s1 * i
+
+    def sum_range(self, i: int, j: int) -> int:
+        """A[i..j)の総和
+
+        Args:
+            i (int): index. 0-indexed.
+            j (int): index. 0-indexed.
+
+        Returns:
+            int: sum(A[i:j])
+
+        TimeComplexity:
+            O(log N)
+        """
+        if i >= j:
+            return 0
+        return self.sum(j) - self.sum(i)
+
+    def range_update(self, left: int, right: int, x: int):
+        """A[left..right) += x. (LazySegmentTreeと同じインターフェース)
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            x (int): 加算する値.
+
+        TimeComplexity:
+            O(log N)
+        """
+        self.range_add(left, right, x)
+
+    def one_point_update(self, i: int, x: int):
+        """A[i] += x. (LazySegmentTreeと同じインターフェース)
+
+        Args:
+            i (int): index. 0-indexed.
+            x (int): 加算する値.
+
+        TimeComplexity:
+            O(log N)
+        """
+        self.range_add(i, i + 1, x)
+
+    def query(self, left: int, right: int) -> int:
+        """sum(A[left..right)). (LazySegmentTreeと同じインターフェース)
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: sum(A[left..right))
+
+        TimeComplexity:
+            O(log N)
+        """
+        return self.sum_range(left, right)
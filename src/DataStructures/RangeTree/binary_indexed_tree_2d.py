@@ -0,0 +1,292 @@
+from typing import Optional
+from array import array
+from bisect import bisect_left
+
+
+class BinaryIndexedTree2D:
+    """2次元の部分和 + 一点加算を O(logH logW)で行う
+
+    Attributes:
+        H (int): 行数
+        W (int): 列数
+        data (array): データを格納するBinary Indexed Tree. (H+1)*(W+1)を1次元に並べ, 1-indexedで扱う.
+
+    Methods:
+        get(x, y): A[x][y], O(logH logW)
+        add(x, y, v): A[x][y] += v, O(logH logW)
+        sum(x, y): sum(A[0..x)[0..y)), O(logH logW)
+        sum_rectangle(x1, y1, x2, y2): sum(A[x1..x2)[y1..y2)), O(logH logW)
+
+    Notes:
+        - 0-indexedで扱う (内部では1-indexedで扱う)
+        - H * Wの配列を確保するため, 座標が大きい場合はOfflineBinaryIndexedTree2Dを使用する
+    """
+
+    def __init__(self, A: list[list[int]]):
+        """2次元Binary Indexed Tree
+
+        Args:
+            A (list[list[int]]): 元の2次元配列. H x W.
+
+        TimeComplexity:
+            O(HW)
+        """
+        self.H = len(A)
+        self.W = len(A[0]) if A else 0
+        self.data = self._build(A)
+
+    def _build(self, A: list[list[int]]) -> array:
+        """元の配列からBinary Indexed Treeを構築する
+
+        Args:
+            A (list[list[int]]): 元の2次元配列
+
+        Returns:
+            array: Binary Indexed Tree
+
+        TimeComplexity:
+            O(HW)
+        """
+        H, W = self.H, self.W
+        width = W + 1
+        data = array("q", [0]) * ((H + 1) * width)
+        for x, row in enumerate(A, 1):
+            data[x * width + 1: (x + 1) * width] = array("q", row)
+
+        # 各行を1次元のBITにする
+        for x in range(1, H + 1):
+            base = x * width
+            for y in range(1, W + 1):
+                parent = y + (y & -y)
+                if parent <= W:
+                    data[base + parent] += data[base + y]
+
+        # 行方向に1次元のBITと同様に足し込む
+        for x in range(1, H + 1):
+            parent = x + (x & -x)
+            if parent <= H:
+                for y in range(1, W + 1):
+                    data[parent * width + y] += data[x * width + y]
+        return data
+
+    def get(self, x: int, y: int) -> int:
+        """A[x][y]を取得.
+
+        Args:
+            x (int): 行のindex. 0-indexed.
+            y (int): 列のindex. 0-indexed.
+
+        Returns:
+            int: A[x][y]
+
+        TimeComplexity:
+            O(logH logW)
+        """
+        if not (0 <= x < self.H and 0 <= y < self.W):
+            raise IndexError("list index out of range")
+
+        return self.sum_rectangle(x, y, x + 1, y + 1)
+
+    def add(self, x: int, y: int, v: int):
+        """A[x][y] += v
+
+        Args:
+            x (int): 行のindex. 0-indexed.
+            y (int): 列のindex. 0-indexed.
+            v (int): 加算する値.
+
+        TimeComplexity:
+            O(logH logW)
+        """
+        if not (0 <= x < self.H and 0 <= y < self.W):
+            return
+
+        data = self.data
+        width = self.W + 1
+        x += 1
+        while x <= self.H:
+            base = x * width
+            j = y + 1
+            while j <= self.W:
+                data[base + j] += v
+                j += j & -j
+            x += x & -x
+
+    def sum(self, x: int, y: int) -> int:
+        """A[0..x)[0..y)の総和
+
+        Args:
+            x (int): 行の上限. 0-indexed.
+            y (int): 列の上限. 0-indexed.
+
+        Returns:
+            int: sum(A[0..x)[0..y))
+
+        TimeComplexity:
+            O(logH logW)
+        """
+        if x <= 0 or y <= 0:
+            return 0
+
+        data = self.data
+        width = self.W + 1
+        x = min(x, self.H)
+        y = min(y, self.W)
+        s = 0
+        while x > 0:
+            base = x * width
+            j = y
+            while j > 0:
+                s += data[base + j]
+                j -= j & -j
+            x -= x & -x
+        return s
+
+    def sum_rectangle(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """A[x1..x2)[y1..y2)の総和
+
+        Args:
+            x1 (int): 行の下限. 0-indexed.
+            y1 (int): 列の下限. 0-indexed.
+            x2 (int): 行の上限. 0-indexed.
+            y2 (int): 列の上限. 0-indexed.
+
+        Returns:
+            int: sum(A[x1..x2)[y1..y2))
+
+        TimeComplexity:
+            O(logH logW)
+        """
+        if x1 >= x2 or y1 >= y2:
+            return 0
+        return self.sum(x2, y2) - self.sum(x1, y2) - self.sum(x2, y1) + self.sum(x1, y1)
+
+
+class OfflineBinaryIndexedTree2D:
+    """座標圧縮した2次元の部分和 + 一点加算を O(log^2 N)で行う
+
+    事前に与えた点集合に対してのみ加算できる. x方向のBITの各ノードが,
+    そのノードが担当する点のy座標 (ソート済み) の上にBITを持つ.
+
+    Attributes:
+        xs (list[int]): 点のx座標 (重複なし, ソート済み)
+        ys (list[list[int]]): ys[i]: x方向のBITのノードiが担当する点のy座標 (重複なし, ソート済み). 1-indexed.
+        offsets (list[int]): offsets[i]: ノードiのBITのdataにおける開始位置.
+        data (array): 全ノードのBITを1次元に並べたもの. 各BITは1-indexedで扱う.
+
+    Methods:
+        add(x, y, v): 点(x, y)の重みにvを加算, O(log^2 N)
+        sum(x, y): x' < x, y' < y となる点(x', y')の重みの総和, O(log^2 N)
+        sum_rectangle(x1, y1, x2, y2): x1 <= x' < x2, y1 <= y' < y2 となる点(x', y')の重みの総和, O(log^2 N)
+
+    Notes:
+        - 座標は任意の整数でよい (負も可)
+        - メモリはO(N logN)で, グリッドの大きさに依存しない
+    """
+
+    def __init__(self, points: list[tuple[int, int]], weights: Optional[list[int]] = None):
+        """座標圧縮した2次元Binary Indexed Tree
+
+        Args:
+            points (list[tuple[int, int]]): 加算対象となる点(x, y)の集合
+            weights (Optional[list[int]]): 各点の初期の重み. 指定しない場合は全て0.
+
+        TimeComplexity:
+            O(N log^2 N)
+        """
+        self.xs = sorted(set(x for x, _ in points))
+        n = len(self.xs)
+
+        ys: list[list[int]] = [[] for _ in range(n + 1)]
+        for x, y in points:
+            i = bisect_left(self.xs, x) + 1
+            while i <= n:
+                ys[i].append(y)
+                i += i & -i
+        self.ys = [sorted(set(y)) for y in ys]
+
+        self.offsets = [0] * (n + 2)
+        for i in range(n + 1):
+            self.offsets[i + 1] = self.offsets[i] + len(self.ys[i]) + 1
+        self.data = array("q", [0]) * self.offsets[-1]
+
+        if weights is not None:
+            for (x, y), w in zip(points, weights):
+                self.add(x, y, w)
+
+    def add(self, x: int, y: int, v: int):
+        """点(x, y)の重みにvを加算する
+
+        Args:
+            x (int): 点のx座標.
+            y (int): 点のy座標.
+            v (int): 加算する値.
+
+        Raises:
+            KeyError: (x, y)が事前に与えた点集合に含まれない場合
+
+        TimeComplexity:
+            O(log^2 N)
+        """
+        i = bisect_left(self.xs, x)
+        if i == len(self.xs) or self.xs[i] != x:
+            raise KeyError((x, y))
+
+        data = self.data
+        i += 1
+        while i < len(self.ys):
+            ys = self.ys[i]
+            j = bisect_left(ys, y)
+            if j == len(ys) or ys[j] != y:
+                raise KeyError((x, y))
+
+            offset, size = self.offsets[i], len(ys)
+            j += 1
+            while j <= size:
+                data[offset + j] += v
+                j += j & -j
+            i += i & -i
+
+    def sum(self, x: int, y: int) -> int:
+        """x' < x, y' < y となる点(x', y')の重みの総和
+
+        Args:
+            x (int): x座標の上限.
+            y (int): y座標の上限.
+
+        Returns:
+            int: 重みの総和
+
+        TimeComplexity:
+            O(log^2 N)
+        """
+        data = self.data
+        s = 0
+        i = bisect_left(self.xs, x)
+        while i > 0:
+            offset = self.offsets[i]
+            j = bisect_left(self.ys[i], y)
+            while j > 0:
+                s += data[offset + j]
+                j -= j & -j
+            i -= i & -i
+        return s
+
+    def sum_rectangle(self, x1: int, y1: int, x2: int, y2: int) -> int:
+        """x1 <= x' < x2, y1 <= y' < y2 となる点(x', y')の重みの総和
+
+        Args:
+            x1 (int): x座標の下限.
+            y1 (int): y座標の下限.
+            x2 (int): x座標の上限.
+            y2 (int): y座標の上限.
+
+        Returns:
+            int: 重みの総和
+
+        TimeComplexity:
+            O(log^2 N)
+        """
+        if x1 >= x2 or y1 >= y2:
+            return 0
+        return self.sum(x2, y2) - self.sum(x1, y2) - self.sum(x2, y1) + self.sum(x1, y1)
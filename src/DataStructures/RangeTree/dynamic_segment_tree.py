@@ -0,0 +1,344 @@
+from typing import Callable, Generic, Optional, TypeVar
+from array import array
+
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+class DynamicSegmentTree(Generic[T, S]):
+    """添字の範囲が巨大な場合の (遅延評価) Segment Tree
+
+    ノードは探索で通った経路上にのみ作成する. ノードはオブジェクトではなく,
+    ノード番号で参照する並列な配列 (ノードプール) に格納する.
+    一度も更新していない要素の値はide_eleとみなす.
+
+    Attributes:
+        size (int): 添字の範囲. [0, size).
+        segfunc (Callable[[T, T], T]): Segment Treeに乗せる演算
+        ide_ele (T): segfuncに対する単位元
+        mapping (Optional[Callable[[S, T, int], T]]): mapping(f, x, length): 長さlengthの区間の集約値xに作用fを適用した値
+        composition (Optional[Callable[[S, S], S]]): composition(f, g): 作用gの後に作用fを適用する作用
+        id_ (Optional[S]): 作用の単位元
+        left (array): left[k]: ノードkの左の子のノード番号. 存在しない場合は0.
+        right (array): right[k]: ノードkの右の子のノード番号. 存在しない場合は0.
+        value (list[T] | array): value[k]: ノードkが表す区間の集約値.
+        lazy (list[S]): lazy[k]: ノードkの遅延情報. 作用を使用する場合のみ.
+
+    Methods:
+        get(i: int): A[i], O(log size)
+        update(i: int, x: T): A[i] = x, O(log size)
+        add(i: int, x: T): A[i] += x, O(log size)
+        query(left: int, right: int): segfunc(A[left..right)), O(log size)
+        range_update(left: int, right: int, f: S): A[left..right)に作用fを適用する, O(log size)
+
+    Notes:
+        - ノード0は「存在しないノード」を表す番兵で, 値は常にide_ele
+        - ノード1が根
+        - Q回の操作でのノード数はO(Q log size)
+    """
+
+    def __init__(
+        self,
+        size: int,
+        segfunc: Callable[[T, T], T],
+        ide_ele: T,
+        mapping: Optional[Callable[[S, T, int], T]] = None,
+        composition: Optional[Callable[[S, S], S]] = None,
+        id_: Optional[S] = None,
+        typecode: Optional[str] = None,
+    ):
+        """動的Segment Tree
+
+        Args:
+            size (int): 添字の範囲. [0, size).
+            segfunc (Callable[[T, T], T]): Segment Treeに乗せる演算
+            ide_ele (T): segfuncに対する単位元
+            mapping (Optional[Callable[[S, T, int], T]]): 区間作用を使う場合, 長さlengthの区間の集約値xに作用fを適用する関数
+            composition (Optional[Callable[[S, S], S]]): 区間作用を使う場合, composition(f, g) = f ∘ g
+            id_ (Optional[S]): 区間作用を使う場合, 作用の単位元
+            typecode (Optional[str]): 指定した場合, 集約値をそのtypecodeのarrayに格納する. ("q" or "d")
+
+        TimeComplexity:
+            O(1)
+        """
+        self.size = size
+        self.segfunc = segfunc
+        self.ide_ele = ide_ele
+        self.mapping = mapping
+        self.composition = composition
+        self.id_ = id_
+        self._lazy = mapping is not None
+
+        # ノード0: 番兵, ノード1: 根
+        self.left = array("q", [0, 0])
+        self.right = array("q", [0, 0])
+        self.value = [ide_ele, ide_ele] if typecode is None else array(typecode, [ide_ele, ide_ele])
+        self.lazy: list[S] = [id_, id_] if self._lazy else []
+
+    def __len__(self) -> int:
+        """作成したノード数 (番兵を除く)
+
+        Returns:
+            int: ノード数
+        """
+        return len(self.left) - 1
+
+    def _new_node(self) -> int:
+        """ノードプールに新しいノードを追加する
+
+        Returns:
+            int: 追加したノードのノード番号
+        """
+        self.left.append(0)
+        self.right.append(0)
+        self.value.append(self.ide_ele)
+        if self._lazy:
+            self.lazy.append(self.id_)
+        return len(self.left) - 1
+
+    def _left_child(self, node: int) -> int:
+        """ノードnodeの左の子を返す. 存在しない場合は作成する.
+
+        Args:
+            node (int): ノード番号
+
+        Returns:
+            int: 左の子のノード番号
+        """
+        if self.left[node] == 0:
+            child = self._new_node()
+            self.left[node] = child
+        return self.left[node]
+
+    def _right_child(self, node: int) -> int:
+        """ノードnodeの右の子を返す. 存在しない場合は作成する.
+
+        Args:
+            node (int): ノード番号
+
+        Returns:
+            int: 右の子のノード番号
+        """
+        if self.right[node] == 0:
+            child = self._new_node()
+            self.right[node] = child
+        return self.right[node]
+
+    def _all_apply(self, node: int, f: S, length: int):
+        """ノードnodeに作用fを適用し, 遅延配列に合成する
+
+        Args:
+            node (int): ノード番号
+            f (S): 作用
+            length (int): ノードが表す区間の長さ
+        """
+        self.value[node] = self.mapping(f, self.value[node], length)
+        self.lazy[node] = self.composition(f, self.lazy[node])
+
+    def _push(self, node: int, node_left: int, node_right: int):
+        """ノードnodeの遅延情報を子に伝播する. 必要なら子を作成する.
+
+        Args:
+            node (int): ノード番号
+            node_left (int): ノードの左端index.
+            node_right (int): ノードの右端index.
+        """
+        if not self._lazy or self.lazy[node] == self.id_:
+            return
+
+        f = self.lazy[node]
+        node_mid = (node_left + node_right) >> 1
+        self._all_apply(self._left_child(node), f, node_mid - node_left)
+        self._all_apply(self._right_child(node), f, node_right - node_mid)
+        self.lazy[node] = self.id_
+
+    def _pull(self, node: int):
+        """ノードnodeの集約値を子から再計算する
+
+        Args:
+            node (int): ノード番号
+        """
+        self.value[node] = self.segfunc(self.value[self.left[node]], self.value[self.right[node]])
+
+    def __getitem__(self, i: int) -> T:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+        """
+        return self.get(i)
+
+    def __setitem__(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+        """
+        self.update(i, x)
+
+    def get(self, i: int) -> T:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+
+        TimeComplexity:
+            O(log size)
+        """
+        if not (0 <= i < self.size):
+            raise IndexError("list index out of range")
+
+        node = 1
+        node_left, node_right = 0, self.size
+        while node and node_right - node_left > 1:
+            self._push(node, node_left, node_right)
+            node_mid = (node_left + node_right) >> 1
+            if i < node_mid:
+                node = self.left[node]
+                node_right = node_mid
+            else:
+                node = self.right[node]
+                node_left = node_mid
+        return self.value[node]
+
+    def update(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+
+        TimeComplexity:
+            O(log size)
+        """
+        if not (0 <= i < self.size):
+            raise IndexError("list index out of range")
+
+        # 根 -> 葉まで降りる (経路上のノードは作成する)
+        path = []
+        node = 1
+        node_left, node_right = 0, self.size
+        while node_right - node_left > 1:
+            self._push(node, node_left, node_right)
+            path.append(node)
+            node_mid = (node_left + node_right) >> 1
+            if i < node_mid:
+                node = self._left_child(node)
+                node_right = node_mid
+            else:
+                node = self._right_child(node)
+                node_left = node_mid
+        self.value[node] = x
+
+        # 葉 -> 根まで集約値を更新
+        for node in reversed(path):
+            self._pull(node)
+
+    def add(self, i: int, x: T):
+        """A[i] += x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): add value.
+
+        TimeComplexity:
+            O(log size)
+        """
+        self.update(i, self.get(i) + x)
+
+    def _query(self, node: int, node_left: int, node_right: int, left: int, right: int) -> T:
+        """A[left..right)を表すノードまで探索する
+
+        Args:
+            node (int): 現在見ているノード番号.
+            node_left (int): 現在見ているノードの左端index.
+            node_right (int): 現在見ているノードの右端index.
+            left (int): クエリ下限index.
+            right (int): クエリ上限index.
+
+        Returns:
+            T: segfunc(A[left..right))
+        """
+        # 範囲外 or 存在しないノード -> 単位元
+        if node == 0 or right <= node_left or node_right <= left:
+            return self.ide_ele
+        # ノード区間[node_left, node_right) ⊂ クエリ区間[left, right) -> ノード区間の値
+        if left <= node_left and node_right <= right:
+            return self.value[node]
+
+        self._push(node, node_left, node_right)
+        node_mid = (node_left + node_right) >> 1
+        left_value = self._query(self.left[node], node_left, node_mid, left, right)
+        right_value = self._query(self.right[node], node_mid, node_right, left, right)
+        return self.segfunc(left_value, right_value)
+
+    def query(self, left: int, right: int) -> T:
+        """segfunc(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            T: segfunc(A[left..right))
+
+        TimeComplexity:
+            O(log size)
+        """
+        left, right = max(left, 0), min(right, self.size)
+        if left >= right:
+            return self.ide_ele
+        return self._query(1, 0, self.size, left, right)
+
+    def _range_update(self, node: int, node_left: int, node_right: int, left: int, right: int, f: S):
+        """A[left..right)を表すノードまで探索し, 作用を適用する
+
+        Args:
+            node (int): 現在見ているノード番号. 存在するノードであること.
+            node_left (int): 現在見ているノードの左端index.
+            node_right (int): 現在見ているノードの右端index.
+            left (int): クエリ下限index.
+            right (int): クエリ上限index.
+            f (S): 作用.
+        """
+        if left <= node_left and node_right <= right:
+            self._all_apply(node, f, node_right - node_left)
+            return
+
+        self._push(node, node_left, node_right)
+        node_mid = (node_left + node_right) >> 1
+        if left < node_mid:
+            self._range_update(self._left_child(node), node_left, node_mid, left, right, f)
+        if node_mid < right:
+            self._range_update(self._right_child(node), node_mid, node_right, left, right, f)
+        self._pull(node)
+
+    def range_update(self, left: int, right: int, f: S):
+        """A[left..right)に作用fを適用する
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            f (S): 作用.
+
+        Raises:
+            ValueError: 作用 (mapping, composition, id_) を指定していない場合
+
+        TimeComplexity:
+            O(log size)
+        """
+        if not self._lazy:
+            raise ValueError("mapping, composition and id_ are required for range_update")
+
+        left, right = max(left, 0), min(right, self.size)
+        if left >= right:
+            return
+        self._range_update(1, 0, self.size, left, right, f)
@@ -1,6 +1,9 @@
-from typing import Optional, Callable, TypeVar, Generic
+from typing import Optional, Callable, TypeVar, Generic, Union
 from itertools import chain
 
+from src.DataStructures.RangeTree.binary_indexed_tree import RangeAddBinaryIndexedTree
+from src.DataStructures.RangeTree.lazy_segment_tree_fast import AffineRangeSumLazySegmentTree
+
 
 T = TypeVar("T")
 S = TypeVar("S")
@@ -28,6 +31,9 @@ class LazySegmentTree(Generic[T, S]):
         query_recursion(left: int, right: int): 再帰 segfunc(A[left..right))の値を取得する, O(logN)
         query(left: int, right: int): 非再帰 segfunc(A[left..right))の値を取得する, O(logN)
         get(i: int): A[i], O(logN)
+        to_list(): 全ての遅延情報を反映したA, O(N)
+        max_right(left: int, pred): pred(segfunc(A[left..right)))を満たす最大のright, O(logN)
+        min_left(right: int, pred): pred(segfunc(A[left..right)))を満たす最小のleft, O(logN)
 
     Notes:
         Bit演算
@@ -420,23 +426,127 @@ class LazySegmentTree(Generic[T, S]):
         if not (0 <= i < self._N):
             raise IndexError("list index out of range")
 
-        node_k = 1
-        node_left, node_right = 0, self.N
-        while node_k < len(self.data):
-            if self.lazy[node_k] is not None:
+        # 根 -> 葉までの経路上のノードのみLazyを伝播する
+        leaf = i + self.N
+        lazy = self.lazy
+        for h in range(self.N.bit_length() - 1, -1, -1):
+            if lazy[leaf >> h] is not None:
+                self._propagate(leaf >> h)
+
+        return self.data[leaf]
+
+    def to_list(self) -> list[T]:
+        """全ての遅延情報を反映した元の配列を返す
+
+        Returns:
+            list[T]: A
+
+        Notes:
+            ノード番号の小さい順 (根 -> 葉の順)に1度ずつ伝播すれば, 全てのLazyを反映できる.
+            N回getを呼ぶ場合のO(N logN)に対して, O(N)で済む.
+
+        TimeComplexity:
+            O(N)
+        """
+        lazy = self.lazy
+        for node_k in range(1, 2 * self.N):
+            if lazy[node_k] is not None:
                 self._propagate(node_k)
 
-            node_mid = (node_left + node_right) >> 1
-            # 左の子に含まれる場合
-            if i < node_mid:
-                node_k <<= 1
-                node_right = node_mid
-            # 右の子に含まれる場合
-            else:
-                node_k = (node_k << 1) + 1
-                node_left = node_mid
+        return self.data[self.N: self.N + self._N]
 
-        return self.data[i + self.N]
+    def max_right(self, left: int, pred: Callable[[T], bool]) -> int:
+        """pred(segfunc(A[left..right))) = Trueとなる最大のrightを返す
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            pred (Callable[[T], bool]): 判定関数. pred(ide_ele) = Trueである必要がある.
+
+        Returns:
+            int: right. left <= right <= len(A).
+
+        Notes
+            1. 根 -> leftの葉までLazyを伝播
+            2. 訪れるノードは, 値を読む前にLazyを反映する
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= left <= self._N):
+            raise IndexError("list index out of range")
+        if left == self._N:
+            return self._N
+
+        left += self.N
+        # 1. 根 -> leftの葉までLazyを伝播
+        for h in range(self.N.bit_length() - 1, 0, -1):
+            self._propagate(left >> h)
+
+        value = self.ide_ele
+        while True:
+            while left & 1 == 0:
+                left >>= 1
+
+            self._propagate(left)
+            # このノードを加えるとpredを満たさない -> このノードの中に答えがあるので子に降りる
+            if not pred(self.segfunc(value, self.data[left])):
+                while left < self.N:
+                    left <<= 1
+                    self._propagate(left)
+                    if pred(self.segfunc(value, self.data[left])):
+                        value = self.segfunc(value, self.data[left])
+                        left += 1
+                        self._propagate(left)
+                return left - self.N
+
+            value = self.segfunc(value, self.data[left])
+            left += 1
+            if left & -left == left:
+                return self._N
+
+    def min_left(self, right: int, pred: Callable[[T], bool]) -> int:
+        """pred(segfunc(A[left..right))) = Trueとなる最小のleftを返す
+
+        Args:
+            right (int): 上限index. 0-indexed.
+            pred (Callable[[T], bool]): 判定関数. pred(ide_ele) = Trueである必要がある.
+
+        Returns:
+            int: left. 0 <= left <= right.
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= right <= self._N):
+            raise IndexError("list index out of range")
+        if right == 0:
+            return 0
+
+        right += self.N
+        # 根 -> right - 1の葉までLazyを伝播
+        for h in range(self.N.bit_length() - 1, 0, -1):
+            self._propagate((right - 1) >> h)
+
+        value = self.ide_ele
+        while True:
+            right -= 1
+            while right > 1 and right & 1:
+                right >>= 1
+
+            self._propagate(right)
+            if not pred(self.segfunc(self.data[right], value)):
+                while right < self.N:
+                    right = (right << 1) + 1
+                    self._propagate(right)
+                    if pred(self.segfunc(self.data[right], value)):
+                        value = self.segfunc(self.data[right], value)
+                        right -= 1
+                        self._propagate(right)
+                return right + 1 - self.N
+
+            value = self.segfunc(self.data[right], value)
+            if right & -right == right:
+                return 0
 
 
 def RangeMinimumRangeAdd(A: list[int]) -> LazySegmentTree[int, int]:
@@ -501,15 +611,24 @@ def RangeMinimumRangeUpdate(A: list[int]) -> LazySegmentTree[int, int]:
     )
 
 
-def RangeSumRangeAdd(A: list[int]) -> LazySegmentTree[int, int]:
+def RangeSumRangeAdd(
+    A: list[int], use_bit: bool = False
+) -> Union[LazySegmentTree[int, int], RangeAddBinaryIndexedTree]:
     """Range Sum Query & Range Add Query
 
     Args:
         A (list[int]): Segment Treeに乗せる元の配列
+        use_bit (bool): Trueの場合, 2本のBinary Indexed Treeで実装したRangeAddBinaryIndexedTreeを返す
 
     Returns:
-        LazySegmentTree[int, int]: Range Sum Query & Range Add Query
+        Union[LazySegmentTree[int, int], RangeAddBinaryIndexedTree]: Range Sum Query & Range Add Query
+
+    Notes:
+        RangeAddBinaryIndexedTreeはrange_update, one_point_update, query, getのみ持つ
     """
+    if use_bit:
+        return RangeAddBinaryIndexedTree(A)
+
     DataValue = int
     UpdatedValue = int
 
@@ -647,21 +766,26 @@ def PointGetRangeAffineWithMod(
 
 
 def RangeSumRangeAffineWithMod(
-    A: list[int], mod: int
-) -> LazySegmentTree[int, list[int, int]]:
+    A: list[int], mod: int, fast: bool = False
+) -> Union[LazySegmentTree[int, list[int, int]], AffineRangeSumLazySegmentTree]:
     """Range Sum Query & Range Affine Query
 
     Args:
         A (list[int]): Segment Treeに乗せる元の配列
         mod (int): mod
+        fast (bool): Trueの場合, array上に構築したAffineRangeSumLazySegmentTreeを返す
 
     Returns:
-        LazySegmentTree[int, list[int, int]]: Range Sum Query & Range Affine Query
+        Union[LazySegmentTree[int, list[int, int]], AffineRangeSumLazySegmentTree]: Range Sum Query & Range Affine Query
 
     Notes:
         UpdateQuery(i, [b, c]) -> A[i] = b * A[i] + c
         計算途中でmodを取る
+        AffineRangeSumLazySegmentTreeはrange_update, one_point_update, query, getのみ持つ
     """
+    if fast:
+        return AffineRangeSumLazySegmentTree(A, mod)
+
     UpdatedValue = list[int, int]
     DataValue = int
 
@@ -0,0 +1,591 @@
+from typing import Callable, TypeVar, Generic
+from array import array
+
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+class FastLazySegmentTree(Generic[T, S]):
+    """区間作用・区間取得を O(log N)で行う (AtCoder Library方式)
+
+    遅延配列に「作用なし」を表すNoneを使わず, 作用の単位元id_で初期化する.
+    対象区間の祖先だけを根から順にpushし, 集約値は下から順に再計算する.
+    左右の集約値を分けて持つため, segfunc, compositionが非可換でもよい.
+
+    Attributes:
+        _N (int): 元の配列の長さ
+        N (int): segment tree用に拡張した配列の長さ, _N以上の最小の2のべき乗
+        log (int): log2(N)
+        segfunc (Callable[[T, T], T]): Segment Treeに乗せる演算
+        ide_ele (T): segfuncに対する単位元
+        mapping (Callable[[S, T, int], T]): mapping(f, x, length): 長さlengthの区間の集約値xに作用fを適用した値
+        composition (Callable[[S, S], S]): composition(f, g): 作用gの後に作用fを適用する作用
+        id_ (S): 作用の単位元
+        data (list[T]): データを格納するSegment Tree. 1-indexedで扱う.
+        lazy (list[S]): 遅延配列. 葉以外のノードのみ持つ.
+        length (array): 各ノードが表す区間の長さ
+
+    Methods:
+        range_update(left: int, right: int, f: S): A[left..right)に作用fを適用する, O(logN)
+        one_point_update(i: int, f: S): A[i]に作用fを適用する, O(logN)
+        update(i: int, x: T): A[i] = x, O(logN)
+        query(left: int, right: int): segfunc(A[left..right))の値を取得する, O(logN)
+        all_query(): segfunc(A[0..N)), O(1)
+        get(i: int): A[i], O(logN)
+        max_right(left: int, pred): pred(segfunc(A[left..right)))を満たす最大のright, O(logN)
+        min_left(right: int, pred): pred(segfunc(A[left..right)))を満たす最小のleft, O(logN)
+
+    Notes:
+        Bit演算
+        iの左の子 -> i << 1
+        iの右の子 -> (i << 1) + 1
+        iの親 -> i >> 1
+    """
+
+    def __init__(
+        self,
+        A: list[T],
+        segfunc: Callable[[T, T], T],
+        ide_ele: T,
+        mapping: Callable[[S, T, int], T],
+        composition: Callable[[S, S], S],
+        id_: S,
+    ):
+        """Lazy Segment Tree
+
+        Args:
+            A (list[T]): 元の配列
+            segfunc (Callable[[T, T], T]): Segment Treeに乗せる演算
+            ide_ele (T): segfuncに対する単位元
+            mapping (Callable[[S, T, int], T]): 長さlengthの区間の集約値xに作用fを適用する関数
+            composition (Callable[[S, S], S]): composition(f, g) = f ∘ g
+            id_ (S): 作用の単位元
+
+        TimeComplexity:
+            O(N)
+        """
+        self._N = len(A)
+        self.log = (self._N - 1).bit_length()
+        # N以上の最小の2のべき乗
+        self.N = 1 << self.log
+        self.segfunc = segfunc
+        self.ide_ele = ide_ele
+        self.mapping = mapping
+        self.composition = composition
+        self.id_ = id_
+
+        self.data = [ide_ele] * (2 * self.N)
+        self.data[self.N: self.N + self._N] = A
+        for k in range(self.N - 1, 0, -1):
+            self.data[k] = segfunc(self.data[k << 1], self.data[(k << 1) + 1])
+
+        self.lazy = [id_] * self.N
+        self.length = _node_length(self.N)
+
+    def _update(self, k: int):
+        """ノードkの集約値を子から再計算する
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+        """
+        self.data[k] = self.segfunc(self.data[k << 1], self.data[(k << 1) + 1])
+
+    def _all_apply(self, k: int, f: S):
+        """ノードkに作用fを適用し, 葉でなければ遅延配列に合成する
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+            f (S): 作用.
+        """
+        self.data[k] = self.mapping(f, self.data[k], self.length[k])
+        if k < self.N:
+            self.lazy[k] = self.composition(f, self.lazy[k])
+
+    def _push(self, k: int):
+        """ノードkの遅延情報を子に伝播する
+
+        Args:
+            k (int): ノード番号. 1-indexed. 葉でないこと.
+        """
+        f = self.lazy[k]
+        self._all_apply(k << 1, f)
+        self._all_apply((k << 1) + 1, f)
+        self.lazy[k] = self.id_
+
+    def range_update(self, left: int, right: int, f: S):
+        """A[left..right)に作用fを適用する
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            f (S): 作用.
+
+        Notes
+            1. 根 -> 対象区間の祖先までLazyを伝播
+            2. 対象区間に作用を適用
+            3. 対象区間の祖先の集約値を下から再計算
+
+        TimeComplexity:
+            O(log N)
+        """
+        if left >= right:
+            return
+
+        left += self.N
+        right += self.N
+
+        # 1. 対象区間の境界を含むノードのみpushする
+        for i in range(self.log, 0, -1):
+            if ((left >> i) << i) != left:
+                self._push(left >> i)
+            if ((right >> i) << i) != right:
+                self._push((right - 1) >> i)
+
+        # 2. 対象区間に作用を適用
+        _left, _right = left, right
+        while _left < _right:
+            if _left & 1:
+                self._all_apply(_left, f)
+                _left += 1
+            if _right & 1:
+                _right -= 1
+                self._all_apply(_right, f)
+            _left >>= 1
+            _right >>= 1
+
+        # 3. 祖先の集約値を再計算
+        for i in range(1, self.log + 1):
+            if ((left >> i) << i) != left:
+                self._update(left >> i)
+            if ((right >> i) << i) != right:
+                self._update((right - 1) >> i)
+
+    def one_point_update(self, i: int, f: S):
+        """A[i]に作用fを適用する
+
+        Args:
+            i (int): index, 0-indexed
+            f (S): 作用
+
+        TimeComplexity:
+            O(log N)
+        """
+        self.range_update(i, i + 1, f)
+
+    def update(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): 更新値.
+
+        TimeComplexity:
+            O(log N)
+        """
+        i += self.N
+        for h in range(self.log, 0, -1):
+            self._push(i >> h)
+        self.data[i] = x
+        for h in range(1, self.log + 1):
+            self._update(i >> h)
+
+    def query(self, left: int, right: int) -> T:
+        """segfunc(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            T: segfunc(A[left..right))
+
+        TimeComplexity:
+            O(log N)
+        """
+        if left >= right:
+            return self.ide_ele
+
+        left += self.N
+        right += self.N
+
+        for i in range(self.log, 0, -1):
+            if ((left >> i) << i) != left:
+                self._push(left >> i)
+            if ((right >> i) << i) != right:
+                self._push((right - 1) >> i)
+
+        data = self.data
+        left_value = self.ide_ele
+        right_value = self.ide_ele
+        while left < right:
+            if left & 1:
+                left_value = self.segfunc(left_value, data[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                right_value = self.segfunc(data[right], right_value)
+            left >>= 1
+            right >>= 1
+
+        return self.segfunc(left_value, right_value)
+
+    def all_query(self) -> T:
+        """segfunc(A[0..N))
+
+        Returns:
+            T: 全体の集約値
+
+        TimeComplexity:
+            O(1)
+        """
+        return self.data[1]
+
+    def __getitem__(self, i: int) -> T:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+
+        TimeComplexity:
+            O(logN)
+        """
+        return self.get(i)
+
+    def get(self, i: int) -> T:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+
+        TimeComplexity:
+            O(log N)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        i += self.N
+        for h in range(self.log, 0, -1):
+            self._push(i >> h)
+        return self.data[i]
+
+    def max_right(self, left: int, pred: Callable[[T], bool]) -> int:
+        """pred(segfunc(A[left..right))) = Trueとなる最大のrightを返す
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            pred (Callable[[T], bool]): 判定関数. pred(ide_ele) = Trueである必要がある.
+
+        Returns:
+            int: right. left <= right <= len(A).
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= left <= self._N):
+            raise IndexError("list index out of range")
+        if left == self._N:
+            return self._N
+
+        left += self.N
+        for i in range(self.log, 0, -1):
+            self._push(left >> i)
+
+        data = self.data
+        value = self.ide_ele
+        while True:
+            while left & 1 == 0:
+                left >>= 1
+
+            if not pred(self.segfunc(value, data[left])):
+                while left < self.N:
+                    self._push(left)
+                    left <<= 1
+                    if pred(self.segfunc(value, data[left])):
+                        value = self.segfunc(value, data[left])
+                        left += 1
+                return left - self.N
+
+            value = self.segfunc(value, data[left])
+            left += 1
+            if left & -left == left:
+                return self._N
+
+    def min_left(self, right: int, pred: Callable[[T], bool]) -> int:
+        """pred(segfunc(A[left..right))) = Trueとなる最小のleftを返す
+
+        Args:
+            right (int): 上限index. 0-indexed.
+            pred (Callable[[T], bool]): 判定関数. pred(ide_ele) = Trueである必要がある.
+
+        Returns:
+            int: left. 0 <= left <= right.
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= right <= self._N):
+            raise IndexError("list index out of range")
+        if right == 0:
+            return 0
+
+        right += self.N
+        for i in range(self.log, 0, -1):
+            self._push((right - 1) >> i)
+
+        data = self.data
+        value = self.ide_ele
+        while True:
+            right -= 1
+            while right > 1 and right & 1:
+                right >>= 1
+
+            if not pred(self.segfunc(data[right], value)):
+                while right < self.N:
+                    self._push(right)
+                    right = (right << 1) + 1
+                    if pred(self.segfunc(data[right], value)):
+                        value = self.segfunc(data[right], value)
+                        right -= 1
+                return right + 1 - self.N
+
+            value = self.segfunc(data[right], value)
+            if right & -right == right:
+                return 0
+
+
+class AffineRangeSumLazySegmentTree:
+    """mod上の区間アフィン変換・区間和を O(log N)で行う
+
+    FastLazySegmentTreeの作用・演算を (b, c): x -> b * x + c と和に固定し,
+    集約値と遅延情報をarray("q")に持ち, 演算をインライン化したもの.
+
+    Attributes:
+        _N (int): 元の配列の長さ
+        N (int): segment tree用に拡張した配列の長さ, _N以上の最小の2のべき乗
+        log (int): log2(N)
+        mod (int): mod. mod^2 < 2^63 である必要がある.
+        data (array): 区間和を格納するSegment Tree. 1-indexedで扱う.
+        lazy_b (array): 遅延中のアフィン変換の係数b. 葉以外のノードのみ持つ.
+        lazy_c (array): 遅延中のアフィン変換の定数項c. 葉以外のノードのみ持つ.
+        length (array): 各ノードが表す区間の長さ
+
+    Methods:
+        range_update(left: int, right: int, x: tuple[int, int]): A[left..right) = b * A[left..right) + c, O(logN)
+        one_point_update(i: int, x: tuple[int, int]): A[i] = b * A[i] + c, O(logN)
+        query(left: int, right: int): sum(A[left..right)) % mod, O(logN)
+        get(i: int): A[i], O(logN)
+    """
+
+    def __init__(self, A: list[int], mod: int):
+        """mod上の区間アフィン変換・区間和 Lazy Segment Tree
+
+        Args:
+            A (list[int]): 元の配列
+            mod (int): mod
+
+        TimeComplexity:
+            O(N)
+        """
+        self._N = len(A)
+        self.log = (self._N - 1).bit_length()
+        self.N = 1 << self.log
+        self.mod = mod
+
+        N = self.N
+        self.data = array("q", [0]) * (2 * N)
+        self.data[N: N + self._N] = array("q", [a % mod for a in A])
+        for k in range(N - 1, 0, -1):
+            self.data[k] = (self.data[k << 1] + self.data[(k << 1) + 1]) % mod
+
+        self.lazy_b = array("q", [1]) * N
+        self.lazy_c = array("q", [0]) * N
+        self.length = _node_length(N)
+
+    def _push_path(self, left: int, right: int):
+        """葉left, right - 1の祖先の遅延情報を, 根から順に子に伝播する
+
+        Args:
+            left (int): 区間の左端の葉のノード番号.
+            right (int): 区間の右端の葉のノード番号 + 1.
+
+        Notes:
+            呼び出し回数を減らすため, 伝播処理をインライン化している
+        """
+        data, lazy_b, lazy_c, length = self.data, self.lazy_b, self.lazy_c, self.length
+        N, mod = self.N, self.mod
+        for i in range(self.log, 0, -1):
+            k = left >> i
+            last = (right - 1) >> i
+            while True:
+                b, c = lazy_b[k], lazy_c[k]
+                # 恒等変換でなければ子に伝播
+                if b != 1 or c != 0:
+                    child = k << 1
+                    c_length = c * length[child]
+                    data[child] = (b * data[child] + c_length) % mod
+                    data[child + 1] = (b * data[child + 1] + c_length) % mod
+                    if child < N:
+                        lazy_b[child] = (b * lazy_b[child]) % mod
+                        lazy_c[child] = (b * lazy_c[child] + c) % mod
+                        lazy_b[child + 1] = (b * lazy_b[child + 1]) % mod
+                        lazy_c[child + 1] = (b * lazy_c[child + 1] + c) % mod
+                    lazy_b[k] = 1
+                    lazy_c[k] = 0
+
+                if k == last:
+                    break
+                k = last
+
+    def range_update(self, left: int, right: int, x: tuple[int, int]):
+        """A[left..right) = b * A[left..right) + c
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            x (tuple[int, int]): (b, c)
+
+        TimeComplexity:
+            O(log N)
+        """
+        if left >= right:
+            return
+
+        data, lazy_b, lazy_c, length = self.data, self.lazy_b, self.lazy_c, self.length
+        N, mod = self.N, self.mod
+        b, c = x[0] % mod, x[1] % mod
+        left += N
+        right += N
+
+        # 1. 根 -> 対象区間の祖先までLazyを伝播
+        self._push_path(left, right)
+
+        # 2. 対象区間にアフィン変換を適用
+        _left, _right = left, right
+        while _left < _right:
+            if _left & 1:
+                data[_left] = (b * data[_left] + c * length[_left]) % mod
+                if _left < N:
+                    lazy_b[_left] = (b * lazy_b[_left]) % mod
+                    lazy_c[_left] = (b * lazy_c[_left] + c) % mod
+                _left += 1
+            if _right & 1:
+                _right -= 1
+                data[_right] = (b * data[_right] + c * length[_right]) % mod
+                if _right < N:
+                    lazy_b[_right] = (b * lazy_b[_right]) % mod
+                    lazy_c[_right] = (b * lazy_c[_right] + c) % mod
+            _left >>= 1
+            _right >>= 1
+
+        # 3. 祖先の集約値を下から再計算
+        for i in range(1, self.log + 1):
+            if ((left >> i) << i) != left:
+                k = left >> i
+                data[k] = (data[k << 1] + data[(k << 1) + 1]) % mod
+            if ((right >> i) << i) != right:
+                k = (right - 1) >> i
+                data[k] = (data[k << 1] + data[(k << 1) + 1]) % mod
+
+    def one_point_update(self, i: int, x: tuple[int, int]):
+        """A[i] = b * A[i] + c
+
+        Args:
+            i (int): index, 0-indexed
+            x (tuple[int, int]): (b, c)
+
+        TimeComplexity:
+            O(log N)
+        """
+        self.range_update(i, i + 1, x)
+
+    def query(self, left: int, right: int) -> int:
+        """sum(A[left..right)) % mod
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: sum(A[left..right)) % mod
+
+        TimeComplexity:
+            O(log N)
+        """
+        if left >= right:
+            return 0
+
+        left += self.N
+        right += self.N
+        self._push_path(left, right)
+
+        data = self.data
+        # 和は可換なので, 左右の集約値を分ける必要はない
+        value = 0
+        while left < right:
+            if left & 1:
+                value += data[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                value += data[right]
+            left >>= 1
+            right >>= 1
+        return value % self.mod
+
+    def __getitem__(self, i: int) -> int:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: A[i]
+
+        TimeComplexity:
+            O(logN)
+        """
+        return self.get(i)
+
+    def get(self, i: int) -> int:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: A[i]
+
+        TimeComplexity:
+            O(log N)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        i += self.N
+        self._push_path(i, i + 1)
+        return self.data[i]
+
+
+def _node_length(N: int) -> array:
+    """各ノードが表す区間の長さを計算する
+
+    Args:
+        N (int): 葉の数. 2のべき乗.
+
+    Returns:
+        array: length[k] = ノードkが表す区間の長さ. 1-indexed.
+    """
+    length = array("q", [0]) * (2 * N)
+    k, width = 1, N
+    while k <= N:
+        length[k: 2 * k] = array("q", [width]) * k
+        k <<= 1
+        width >>= 1
+    return length
@@ -0,0 +1,426 @@
+from array import array
+from bisect import bisect_left
+from collections import deque
+
+
+INF = 1 << 62
+
+
+class LiChaoTree:
+    """直線 y = ax + b の追加と, 座標xにおける最小値の取得を行う (座標は事前に与える)
+
+    各ノードには「そのノードの区間の中点で最小となる直線」を1本だけ持つ.
+    追加した直線と元の直線のうち, 中点で負けた方を, 勝ち得る側の子にのみ降ろす.
+
+    Attributes:
+        xs (list[int]): クエリに使用する座標 (昇順, 重複なし). 長さNになるように末尾の値で埋める.
+        _N (int): 座標の数
+        N (int): 葉の数. _N以上の最小の2のべき乗.
+        a (array): a[k]: ノードkの直線の傾き
+        b (array): b[k]: ノードkの直線の切片. 直線がない場合はINF.
+
+    Methods:
+        add_line(a: int, b: int): 直線 y = ax + b を追加する, O(logN).
+        add_segment(a: int, b: int, left: int, right: int): 線分 y = ax + b (left <= x < right) を追加する, O(log^2 N).
+        query(x: int): 座標xにおける最小値, O(logN).
+
+    Notes:
+        - 最大値を求める場合は, 直線 y = -ax - b を追加し, 結果の符号を反転すればよい
+        - 直線がない座標の値はINF (= 2^62)
+    """
+
+    def __init__(self, xs: list[int]):
+        """Li Chao Tree
+
+        Args:
+            xs (list[int]): クエリに使用する座標
+
+        TimeComplexity:
+            O(N logN)
+        """
+        xs = sorted(set(xs))
+        self._N = len(xs)
+        self.N = 1 << (self._N - 1).bit_length()
+        self.xs = xs + [xs[-1] if xs else 0] * (self.N - self._N)
+        self.a = array("q", [0]) * (2 * self.N)
+        self.b = array("q", [INF]) * (2 * self.N)
+
+    def _add_line(self, a: int, b: int, node_k: int, node_left: int, node_right: int):
+        """ノードnode_k以下に直線 y = ax + b を追加する
+
+        Args:
+            a (int): 傾き
+            b (int): 切片
+            node_k (int): ノード番号. 1-indexed.
+            node_left (int): ノードの左端index. 0-indexed.
+            node_right (int): ノードの右端index. 0-indexed.
+        """
+        xs = self.xs
+        while True:
+            node_mid = (node_left + node_right) >> 1
+            x_left, x_mid = xs[node_left], xs[node_mid]
+            a0, b0 = self.a[node_k], self.b[node_k]
+            left_better = a * x_left + b < a0 * x_left + b0
+            mid_better = a * x_mid + b < a0 * x_mid + b0
+
+            # 中点で勝つ方をノードに残し, 負けた方を子に降ろす
+            if mid_better:
+                self.a[node_k], self.b[node_k] = a, b
+                a, b = a0, b0
+            if node_right - node_left == 1:
+                return
+
+            # 負けた直線は, 左端でも負けるなら右側でのみ勝ち得る
+            if left_better != mid_better:
+                node_k, node_right = node_k << 1, node_mid
+            else:
+                node_k, node_left = (node_k << 1) + 1, node_mid
+
+    def add_line(self, a: int, b: int):
+        """直線 y = ax + b を追加する
+
+        Args:
+            a (int): 傾き
+            b (int): 切片
+
+        TimeComplexity:
+            O(logN)
+        """
+        self._add_line(a, b, 1, 0, self.N)
+
+    def add_segment(self, a: int, b: int, left: int, right: int):
+        """線分 y = ax + b (left <= x < right) を追加する
+
+        Args:
+            a (int): 傾き
+            b (int): 切片
+            left (int): 線分の左端の座標
+            right (int): 線分の右端の座標 (含まない)
+
+        TimeComplexity:
+            O(log^2 N)
+        """
+        left = bisect_left(self.xs, left, 0, self._N) + self.N
+        right = bisect_left(self.xs, right, 0, self._N) + self.N
+
+        # 区間を覆うノードそれぞれに, 直線として追加する
+        length = 1
+        while left < right:
+            if left & 1:
+                self._add_line(a, b, left, left * length - self.N, (left + 1) * length - self.N)
+                left += 1
+            if right & 1:
+                right -= 1
+                self._add_line(a, b, right, right * length - self.N, (right + 1) * length - self.N)
+            left >>= 1
+            right >>= 1
+            length <<= 1
+
+    def query(self, x: int) -> int:
+        """座標xにおける, 追加した直線の最小値
+
+        Args:
+            x (int): 座標. 初期化時に与えた座標であること.
+
+        Returns:
+            int: 最小値. 直線がない場合はINF.
+
+        TimeComplexity:
+            O(logN)
+        """
+        i = bisect_left(self.xs, x, 0, self._N)
+        if i == self._N or self.xs[i] != x:
+            raise KeyError(x)
+
+        # 葉 -> 根までの直線の最小値
+        a, b = self.a, self.b
+        node_k = i + self.N
+        result = INF
+        while node_k:
+            y = a[node_k] * x + b[node_k]
+            if y < result:
+                result = y
+            node_k >>= 1
+        return result
+
+
+class DynamicLiChaoTree:
+    """直線 y = ax + b の追加と, 座標xにおける最小値の取得を行う (整数座標 lo <= x < hi)
+
+    ノードは直線を降ろす経路上にのみ作成する. ノードはオブジェクトではなく,
+    ノード番号で参照する並列な配列 (ノードプール) に格納する.
+
+    Attributes:
+        lo (int): 座標の下限
+        hi (int): 座標の上限 (含まない)
+        left (array): left[k]: ノードkの左の子のノード番号. 存在しない場合は0.
+        right (array): right[k]: ノードkの右の子のノード番号. 存在しない場合は0.
+        a (array): a[k]: ノードkの直線の傾き
+        b (array): b[k]: ノードkの直線の切片. 直線がない場合はINF.
+
+    Methods:
+        add_line(a: int, b: int): 直線 y = ax + b を追加する, O(log(hi - lo)).
+        add_segment(a: int, b: int, left: int, right: int): 線分 y = ax + b (left <= x < right) を追加する, O(log^2(hi - lo)).
+        query(x: int): 座標xにおける最小値, O(log(hi - lo)).
+
+    Notes:
+        - ノード0は番兵, ノード1が根
+        - Q本の直線を追加した場合のノード数はO(Q log(hi - lo))
+    """
+
+    def __init__(self, lo: int, hi: int):
+        """動的Li Chao Tree
+
+        Args:
+            lo (int): 座標の下限
+            hi (int): 座標の上限 (含まない)
+
+        TimeComplexity:
+            O(1)
+        """
+        self.lo = lo
+        self.hi = hi
+        # ノード0: 番兵, ノード1: 根
+        self.left = array("q", [0, 0])
+        self.right = array("q", [0, 0])
+        self.a = array("q", [0, 0])
+        self.b = array("q", [INF, INF])
+
+    def __len__(self) -> int:
+        """作成したノード数 (番兵を除く)
+
+        Returns:
+            int: ノード数
+        """
+        return len(self.left) - 1
+
+    def _new_node(self) -> int:
+        """ノードプールに新しいノードを追加する
+
+        Returns:
+            int: 追加したノードのノード番号
+        """
+        self.left.append(0)
+        self.right.append(0)
+        self.a.append(0)
+        self.b.append(INF)
+        return len(self.left) - 1
+
+    def _add_line(self, a: int, b: int, node: int, node_left: int, node_right: int):
+        """ノードnode以下に直線 y = ax + b を追加する
+
+        Args:
+            a (int): 傾き
+            b (int): 切片
+            node (int): ノード番号. 存在するノードであること.
+            node_left (int): ノードの左端の座標
+            node_right (int): ノードの右端の座標 (含まない)
+        """
+        while True:
+            node_mid = (node_left + node_right) >> 1
+            a0, b0 = self.a[node], self.b[node]
+            left_better = a * node_left + b < a0 * node_left + b0
+            mid_better = a * node_mid + b < a0 * node_mid + b0
+
+            # 中点で勝つ方をノードに残し, 負けた方を子に降ろす
+            if mid_better:
+                self.a[node], self.b[node] = a, b
+                a, b = a0, b0
+            if node_right - node_left == 1 or b == INF:
+                return
+
+            if left_better != mid_better:
+                if self.left[node] == 0:
+                    child = self._new_node()
+                    self.left[node] = child
+                node, node_right = self.left[node], node_mid
+            else:
+                if self.right[node] == 0:
+                    child = self._new_node()
+                    self.right[node] = child
+                node, node_left = self.right[node], node_mid
+
+    def add_line(self, a: int, b: int):
+        """直線 y = ax + b を追加する
+
+        Args:
+            a (int): 傾き
+            b (int): 切片
+
+        TimeComplexity:
+            O(log(hi - lo))
+        """
+        self._add_line(a, b, 1, self.lo, self.hi)
+
+    def add_segment(self, a: int, b: int, left: int, right: int):
+        """線分 y = ax + b (left <= x < right) を追加する
+
+        Args:
+            a (int): 傾き
+            b (int): 切片
+            left (int): 線分の左端の座標
+            right (int): 線分の右端の座標 (含まない)
+
+        TimeComplexity:
+            O(log^2(hi - lo))
+        """
+        left, right = max(left, self.lo), min(right, self.hi)
+        if left >= right:
+            return
+
+        # 根 -> 区間を覆うノードまで降りる (経路上のノードは作成する)
+        stack = [(1, self.lo, self.hi)]
+        while stack:
+            node, node_left, node_right = stack.pop()
+            if right <= node_left or node_right <= left:
+                continue
+            if left <= node_left and node_right <= right:
+                self._add_line(a, b, node, node_left, node_right)
+                continue
+
+            node_mid = (node_left + node_right) >> 1
+            if self.left[node] == 0:
+                child = self._new_node()
+                self.left[node] = child
+            if self.right[node] == 0:
+                child = self._new_node()
+                self.right[node] = child
+            stack.append((self.left[node], node_left, node_mid))
+            stack.append((self.right[node], node_mid, node_right))
+
+    def query(self, x: int) -> int:
+        """座標xにおける, 追加した直線の最小値
+
+        Args:
+            x (int): 座標. lo <= x < hi.
+
+        Returns:
+            int: 最小値. 直線がない場合はINF.
+
+        TimeComplexity:
+            O(log(hi - lo))
+        """
+        if not (self.lo <= x < self.hi):
+            raise IndexError("list index out of range")
+
+        # 根 -> 葉までの直線の最小値
+        result = INF
+        node = 1
+        node_left, node_right = self.lo, self.hi
+        while node:
+            y = self.a[node] * x + self.b[node]
+            if y < result:
+                result = y
+            node_mid = (node_left + node_right) >> 1
+            if x < node_mid:
+                node, node_right = self.left[node], node_mid
+            else:
+                node, node_left = self.right[node], node_mid
+        return result
+
+
+class MonotoneConvexHullTrick:
+    """傾きが単調非増加な直線の追加と, 単調非減少な座標xにおける最小値の取得を, 償却O(1)で行う
+
+    最小値を与えうる直線のみを, 傾きの降順にdequeで持つ.
+
+    Attributes:
+        lines (deque[tuple[int, int]]): 最小値を与えうる直線 (a, b). 傾きの降順.
+        last_x (Optional[int]): 直前のクエリの座標
+
+    Methods:
+        add_line(a: int, b: int): 直線 y = ax + b を追加する, 償却O(1).
+        query(x: int): 座標xにおける最小値, 償却O(1).
+
+    Notes:
+        - 最大値を求める場合は, 直線 y = -ax - b を追加し, 結果の符号を反転すればよい
+    """
+
+    def __init__(self):
+        """Convex Hull Trick (単調)
+
+        TimeComplexity:
+            O(1)
+        """
+        self.lines: deque[tuple[int, int]] = deque()
+        self.last_x = None
+
+    def __len__(self) -> int:
+        """保持している直線の数
+
+        Returns:
+            int: 直線の数
+        """
+        return len(self.lines)
+
+    @staticmethod
+    def _is_unnecessary(line1: tuple[int, int], line2: tuple[int, int], line3: tuple[int, int]) -> bool:
+        """傾きa1 > a2 > a3 の3直線について, line2が最小値を与えることがないか判定する
+
+        Args:
+            line1 (tuple[int, int]): 直線 (a1, b1)
+            line2 (tuple[int, int]): 直線 (a2, b2)
+            line3 (tuple[int, int]): 直線 (a3, b3)
+
+        Returns:
+            bool: line1とline3の交点が, line1とline2の交点より左にある場合True
+        """
+        a1, b1 = line1
+        a2, b2 = line2
+        a3, b3 = line3
+        return (b3 - b1) * (a1 - a2) <= (b2 - b1) * (a1 - a3)
+
+    def add_line(self, a: int, b: int):
+        """直線 y = ax + b を追加する
+
+        Args:
+            a (int): 傾き. これまでに追加した直線の傾き以下であること.
+            b (int): 切片
+
+        Raises:
+            ValueError: 傾きが単調非増加でない場合
+
+        TimeComplexity:
+            償却O(1)
+        """
+        lines = self.lines
+        if lines and lines[-1][0] < a:
+            raise ValueError("slopes must be added in non-increasing order")
+
+        # 傾きが同じ場合は, 切片が小さい方のみ残す
+        if lines and lines[-1][0] == a:
+            if lines[-1][1] <= b:
+                return
+            lines.pop()
+
+        while len(lines) >= 2 and self._is_unnecessary(lines[-2], lines[-1], (a, b)):
+            lines.pop()
+        lines.append((a, b))
+
+    def query(self, x: int) -> int:
+        """座標xにおける, 追加した直線の最小値
+
+        Args:
+            x (int): 座標. これまでのクエリの座標以上であること.
+
+        Returns:
+            int: 最小値. 直線がない場合はINF.
+
+        Raises:
+            ValueError: 座標が単調非減少でない場合
+
+        TimeComplexity:
+            償却O(1)
+        """
+        if self.last_x is not None and x < self.last_x:
+            raise ValueError("query points must be non-decreasing")
+        self.last_x = x
+
+        lines = self.lines
+        if not lines:
+            return INF
+
+        # 先頭の直線が, 2番目の直線に負けるなら以降も負けるので取り除く
+        while len(lines) >= 2 and lines[1][0] * x + lines[1][1] <= lines[0][0] * x + lines[0][1]:
+            lines.popleft()
+        return lines[0][0] * x + lines[0][1]
@@ -0,0 +1,307 @@
+from array import array
+from collections import deque
+
+from src.common.Graph.type import AdjacencyList
+
+
+class MergeableSegmentTree:
+    """値の範囲[0, V)上の多重集合を動的Segment Treeで表し, 木同士をマージできるようにしたもの
+
+    1つのインスタンスが複数の木を管理し, 各木は根のノード番号で表す (空の木はノード0).
+    ノードはオブジェクトではなく, ノード番号で参照する並列な配列 (ノードプール) に格納する.
+
+    Attributes:
+        V (int): 値の範囲. [0, V).
+        left (array): left[k]: ノードkの左の子のノード番号. 存在しない場合は0.
+        right (array): right[k]: ノードkの右の子のノード番号. 存在しない場合は0.
+        count (array): count[k]: ノードkが表す値の範囲に含まれる要素の個数 (重複を含む)
+        distinct (array): distinct[k]: ノードkが表す値の範囲に含まれる要素の種類数
+
+    Methods:
+        insert(root: int, x: int, c: int): 木rootに値xをc個追加し, 新しい根を返す, O(logV).
+        merge(a: int, b: int): 木aと木bをマージした木の根を返す, 償却O(logV).
+        count_range(root: int, left: int, right: int): 木rootに含まれる, left <= x < rightの要素数, O(logV).
+        distinct_range(root: int, left: int, right: int): 木rootに含まれる, left <= x < rightの要素の種類数, O(logV).
+        kth(root: int, k: int): 木rootのk番目に小さい値 (0-indexed), O(logV).
+
+    Notes:
+        - ノード0は「存在しないノード」を表す番兵で, count, distinctは常に0
+        - merge(a, b)の後, 木bは木aと節点を共有するので使用してはいけない
+        - 全部でQ個の要素を追加した場合, ノード数はO(Q logV)で, merge全体の計算量もO(Q logV)
+    """
+
+    def __init__(self, V: int):
+        """マージ可能なSegment Tree
+
+        Args:
+            V (int): 値の範囲. [0, V).
+
+        TimeComplexity:
+            O(1)
+        """
+        self.V = V
+        # ノード0: 番兵
+        self.left = array("q", [0])
+        self.right = array("q", [0])
+        self.count = array("q", [0])
+        self.distinct = array("q", [0])
+
+    def __len__(self) -> int:
+        """作成したノード数 (番兵を除く)
+
+        Returns:
+            int: ノード数
+        """
+        return len(self.left) - 1
+
+    def _new_node(self) -> int:
+        """ノードプールに新しいノードを追加する
+
+        Returns:
+            int: 追加したノードのノード番号
+        """
+        self.left.append(0)
+        self.right.append(0)
+        self.count.append(0)
+        self.distinct.append(0)
+        return len(self.left) - 1
+
+    def _pull(self, node: int):
+        """ノードnodeの集約値を子から再計算する
+
+        Args:
+            node (int): ノード番号
+        """
+        left, right = self.left[node], self.right[node]
+        self.count[node] = self.count[left] + self.count[right]
+        self.distinct[node] = self.distinct[left] + self.distinct[right]
+
+    def insert(self, root: int, x: int, c: int = 1) -> int:
+        """木rootに値xをc個追加する
+
+        Args:
+            root (int): 木の根のノード番号. 空の木は0.
+            x (int): 追加する値. 0 <= x < V.
+            c (int): 追加する個数. 負の場合は削除する.
+
+        Returns:
+            int: 追加後の木の根のノード番号
+
+        TimeComplexity:
+            O(logV)
+        """
+        if not (0 <= x < self.V):
+            raise IndexError("list index out of range")
+
+        if root == 0:
+            root = self._new_node()
+
+        # 根 -> 葉まで降りる (経路上のノードは作成する)
+        path = []
+        node = root
+        node_left, node_right = 0, self.V
+        while node_right - node_left > 1:
+            path.append(node)
+            node_mid = (node_left + node_right) >> 1
+            if x < node_mid:
+                if self.left[node] == 0:
+                    child = self._new_node()
+                    self.left[node] = child
+                node = self.left[node]
+                node_right = node_mid
+            else:
+                if self.right[node] == 0:
+                    child = self._new_node()
+                    self.right[node] = child
+                node = self.right[node]
+                node_left = node_mid
+
+        self.count[node] += c
+        self.distinct[node] = 1 if self.count[node] > 0 else 0
+
+        # 葉 -> 根まで集約値を更新
+        for node in reversed(path):
+            self._pull(node)
+        return root
+
+    def _merge(self, a: int, b: int, node_left: int, node_right: int) -> int:
+        """同じ値の範囲[node_left, node_right)を表すノードa, bをマージする
+
+        Args:
+            a (int): ノード番号
+            b (int): ノード番号
+            node_left (int): ノードの左端の値
+            node_right (int): ノードの右端の値
+
+        Returns:
+            int: マージ後のノード番号
+        """
+        # 片方が空なら, もう片方をそのまま使う
+        if a == 0:
+            return b
+        if b == 0:
+            return a
+
+        # 葉 -> 個数を足す
+        if node_right - node_left == 1:
+            self.count[a] += self.count[b]
+            self.distinct[a] = 1 if self.count[a] > 0 else 0
+            return a
+
+        node_mid = (node_left + node_right) >> 1
+        self.left[a] = self._merge(self.left[a], self.left[b], node_left, node_mid)
+        self.right[a] = self._merge(self.right[a], self.right[b], node_mid, node_right)
+        self._pull(a)
+        return a
+
+    def merge(self, a: int, b: int) -> int:
+        """木aと木bをマージする
+
+        Args:
+            a (int): 木の根のノード番号
+            b (int): 木の根のノード番号. マージ後は使用しないこと.
+
+        Returns:
+            int: マージ後の木の根のノード番号
+
+        TimeComplexity:
+            償却O(logV)
+
+        Notes:
+            両方の木に存在するノードでのみ再帰し, そのノードの片方は以降使われなくなる.
+            よって, 全てのマージの計算量の合計は作成したノード数で抑えられる.
+        """
+        return self._merge(a, b, 0, self.V)
+
+    def _fold(self, values: array, root: int, left: int, right: int) -> int:
+        """valuesの, [left, right)の範囲の値を表すノードの和を求める
+
+        Args:
+            values (array): self.count or self.distinct
+            root (int): 木の根のノード番号
+            left (int): 下限の値
+            right (int): 上限の値
+
+        Returns:
+            int: 和
+        """
+        result = 0
+        stack = [(root, 0, self.V)]
+        while stack:
+            node, node_left, node_right = stack.pop()
+            # 範囲外 or 存在しないノード
+            if node == 0 or right <= node_left or node_right <= left:
+                continue
+            # ノード区間[node_left, node_right) ⊂ クエリ区間[left, right)
+            if left <= node_left and node_right <= right:
+                result += values[node]
+                continue
+
+            node_mid = (node_left + node_right) >> 1
+            stack.append((self.left[node], node_left, node_mid))
+            stack.append((self.right[node], node_mid, node_right))
+        return result
+
+    def count_range(self, root: int, left: int, right: int) -> int:
+        """木rootに含まれる, left <= x < rightを満たす要素xの個数 (重複を含む)
+
+        Args:
+            root (int): 木の根のノード番号
+            left (int): 下限の値
+            right (int): 上限の値
+
+        Returns:
+            int: 個数
+
+        TimeComplexity:
+            O(logV)
+        """
+        return self._fold(self.count, root, left, right)
+
+    def distinct_range(self, root: int, left: int, right: int) -> int:
+        """木rootに含まれる, left <= x < rightを満たす要素xの種類数
+
+        Args:
+            root (int): 木の根のノード番号
+            left (int): 下限の値
+            right (int): 上限の値
+
+        Returns:
+            int: 種類数
+
+        TimeComplexity:
+            O(logV)
+        """
+        return self._fold(self.distinct, root, left, right)
+
+    def kth(self, root: int, k: int) -> int:
+        """木rootに含まれる要素のうち, k番目に小さい値 (重複を含む)
+
+        Args:
+            root (int): 木の根のノード番号
+            k (int): 0-indexed.
+
+        Returns:
+            int: k番目に小さい値
+
+        TimeComplexity:
+            O(logV)
+        """
+        if not (0 <= k < self.count[root]):
+            raise IndexError("list index out of range")
+
+        node = root
+        node_left, node_right = 0, self.V
+        while node_right - node_left > 1:
+            node_mid = (node_left + node_right) >> 1
+            left_count = self.count[self.left[node]]
+            if k < left_count:
+                node = self.left[node]
+                node_right = node_mid
+            else:
+                k -= left_count
+                node = self.right[node]
+                node_left = node_mid
+        return node_left
+
+
+def subtree_distinct_counts(graph: AdjacencyList, colors: list[int], root: int = 0) -> list[int]:
+    """根付き木の各頂点vについて, vの部分木に含まれる頂点の色の種類数を求める
+
+    Args:
+        graph (AdjacencyList): 木グラフ
+        colors (list[int]): colors[v]: 頂点vの色. 0 <= colors[v].
+        root (int): 根とする頂点
+
+    Returns:
+        list[int]: 各頂点の部分木の色の種類数
+
+    TimeComplexity:
+        O(N logV). V = max(colors) + 1.
+    """
+    N = len(graph)
+    seg = MergeableSegmentTree(max(colors, default=0) + 1)
+
+    # BFSで頂点を訪問順に並べる
+    prev = [-1] * N
+    order = []
+    queue = deque([root])
+    visited = [False] * N
+    visited[root] = True
+    while queue:
+        v = queue.popleft()
+        order.append(v)
+        for u in graph[v]:
+            if not visited[u]:
+                visited[u] = True
+                prev[u] = v
+                queue.append(u)
+
+    # 葉から順に, 子の木を親の木にマージする
+    roots = [seg.insert(0, colors[v]) for v in range(N)]
+    result = [0] * N
+    for v in reversed(order):
+        result[v] = seg.distinct[roots[v]]
+        if prev[v] != -1:
+            roots[prev[v]] = seg.merge(roots[prev[v]], roots[v])
+    return result
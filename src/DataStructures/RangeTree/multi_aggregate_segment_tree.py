@@ -0,0 +1,183 @@
+from typing import Generic, TypeVar
+from array import array
+
+
+T = TypeVar("T", int, float)
+
+INF = 1 << 62
+
+
+class MultiAggregateSegmentTree(Generic[T]):
+    """区間和・区間最小値・区間最大値・要素数を1回の探索でまとめて求めるSegment Tree
+
+    RangeSumQuery, RangeMinimumQuery, RangeMaximumQueryを別々に構築すると,
+    更新・クエリのたびに3回探索することになる. ここでは各集約値を並列なarrayに持ち (struct of arrays),
+    1回の探索で全ての集約値を更新・計算する.
+
+    Attributes:
+        _N (int): 元の配列のサイズ
+        N (int): segment tree用に拡張した配列のサイズ. _N以上の最小の2のべき乗.
+        inf (T): 最小値・最大値の単位元に使う値. typecodeが"q"の場合は2^62, "d"の場合はfloat("inf").
+        sum (array): sum[k]: ノードkの区間和
+        min (array): min[k]: ノードkの区間最小値
+        max (array): max[k]: ノードkの区間最大値
+
+    Methods:
+        get(i: int): A[i], O(1).
+        update(i: int, x: T): A[i] = x, O(logN).
+        add(i: int, x: T): A[i] += x, O(logN).
+        query(left: int, right: int): (sum, min, max, count) of A[left..right), O(logN).
+
+    Notes:
+        - 各ノードの値は1-indexed
+        - 値は -inf < x < inf である必要がある
+        - 要素数は区間の長さなので, 配列には持たない
+    """
+
+    def __init__(self, A: list[T], typecode: str = "q"):
+        """複数の集約値を持つSegment Tree
+
+        Args:
+            A (list[T]): 元の配列
+            typecode (str): 値を格納するarrayのtypecode. ("q" or "d")
+
+        TimeComplexity:
+            O(N)
+        """
+        self._N = len(A)
+        self.N = 1 << (self._N - 1).bit_length()
+        self.inf = INF if typecode == "q" else float("inf")
+        N, inf = self.N, self.inf
+
+        # 拡張した部分の葉は単位元にしておく
+        self.sum = array(typecode, [0]) * (2 * N)
+        self.min = array(typecode, [inf]) * (2 * N)
+        self.max = array(typecode, [-inf]) * (2 * N)
+
+        self.sum[N: N + self._N] = self.min[N: N + self._N] = self.max[N: N + self._N] = array(typecode, A)
+        for k in range(N - 1, 0, -1):
+            self._update(k)
+
+    def _update(self, k: int):
+        """ノードkの集約値を子から再計算する
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+        """
+        left, right = k << 1, (k << 1) + 1
+        self.sum[k] = self.sum[left] + self.sum[right]
+        self.min[k] = min(self.min[left], self.min[right])
+        self.max[k] = max(self.max[left], self.max[right])
+
+    def __getitem__(self, i: int) -> T:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+        """
+        return self.get(i)
+
+    def __setitem__(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+        """
+        self.update(i, x)
+
+    def get(self, i: int) -> T:
+        """元の配列A[i]の値を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+
+        TimeComplexity:
+            O(1)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+        return self.sum[i + self.N]
+
+    def update(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        sum_, min_, max_ = self.sum, self.min, self.max
+        i += self.N
+        sum_[i] = min_[i] = max_[i] = x
+        i >>= 1
+        while i:
+            left, right = i << 1, (i << 1) + 1
+            sum_[i] = sum_[left] + sum_[right]
+            min_[i] = min_[left] if min_[left] < min_[right] else min_[right]
+            max_[i] = max_[left] if max_[left] > max_[right] else max_[right]
+            i >>= 1
+
+    def add(self, i: int, x: T):
+        """A[i] += x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): add value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        self.update(i, self.get(i) + x)
+
+    def query(self, left: int, right: int) -> tuple[T, T, T, int]:
+        """非再起で, A[left..right)の区間和・最小値・最大値・要素数をまとめて求める
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            tuple[T, T, T, int]: (sum, min, max, count).
+                空区間の場合は (0, inf, -inf, 0).
+
+        TimeComplexity:
+            O(logN)
+        """
+        left, right = max(left, 0), min(right, self._N)
+        sum_, min_, max_ = self.sum, self.min, self.max
+        s, lo, hi = 0, self.inf, -self.inf
+        count = max(right - left, 0)
+
+        left += self.N
+        right += self.N
+        # 全ての演算が可換なので, 左右の集約値を分ける必要はない
+        while left < right:
+            if left & 1:
+                s += sum_[left]
+                if min_[left] < lo:
+                    lo = min_[left]
+                if max_[left] > hi:
+                    hi = max_[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                s += sum_[right]
+                if min_[right] < lo:
+                    lo = min_[right]
+                if max_[right] > hi:
+                    hi = max_[right]
+            left >>= 1
+            right >>= 1
+        return s, lo, hi, count
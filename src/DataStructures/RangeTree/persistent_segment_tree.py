@@ -0,0 +1,233 @@
+from typing import Callable, Generic, Optional, TypeVar
+from array import array
+
+
+T = TypeVar("T")
+
+
+class PersistentSegmentTree(Generic[T]):
+    """過去の版に対しても区間集約ができる, 1点更新・区間集約の永続Segment Tree
+
+    更新時は根から葉までの経路上のノードのみ複製し (経路コピー), それ以外のノードは前の版と共有する.
+    ノードはオブジェクトではなく, ノード番号で参照する並列な配列 (ノードプール) に格納する.
+
+    Attributes:
+        _N (int): 元の配列のサイズ
+        N (int): セグメント木の葉の数. N以上の最小の2のべき乗.
+        segfunc (Callable[[T, T], T]): モノイド上の2項演算.
+        ide_ele (T): モノイド上の単位元.
+        left (array): left[k]: ノードkの左の子のノード番号. 葉の場合は0.
+        right (array): right[k]: ノードkの右の子のノード番号. 葉の場合は0.
+        value (list[T] | array): value[k]: ノードkが表す区間の集約値.
+        roots (array): roots[v]: 版vの根のノード番号.
+
+    Methods:
+        get(version: int, i: int): 版versionのA[i], O(logN).
+        update(version: int, i: int, x: T): 版versionに対してA[i] = xとした新しい版を作り, その番号を返す, O(logN).
+        add(version: int, i: int, x: T): 版versionに対してA[i] += xとした新しい版を作り, その番号を返す, O(logN).
+        query(version: int, left: int, right: int): 版versionのsegfunc(A[left..right)), O(logN).
+
+    Notes:
+        - 版0は元の配列
+        - 更新1回あたりのノードの増加はO(logN)
+    """
+
+    def __init__(
+        self,
+        A: list[T],
+        segfunc: Callable[[T, T], T],
+        ide_ele: T,
+        typecode: Optional[str] = None,
+    ):
+        """永続Segment Tree
+
+        Args:
+            A (list[T]): 元の配列
+            segfunc (Callable[[T, T], T]): Segment Treeに乗せる演算
+            ide_ele (T): segfuncに対する単位元
+            typecode (Optional[str]): 指定した場合, 集約値をそのtypecodeのarrayに格納する. ("q" or "d")
+
+        TimeComplexity:
+            O(N)
+        """
+        self._N = len(A)
+        # N以上の最小の2のべき乗
+        self.N = 1 << (self._N - 1).bit_length()
+        self.segfunc = segfunc
+        self.ide_ele = ide_ele
+
+        # ノード0は番兵
+        self.left = array("q", [0])
+        self.right = array("q", [0])
+        self.value = [ide_ele] if typecode is None else array(typecode, [ide_ele])
+        self.roots = array("q", [self._build(A)])
+
+    def _new_node(self, left: int, right: int, value: T) -> int:
+        """ノードプールに新しいノードを追加する
+
+        Args:
+            left (int): 左の子のノード番号
+            right (int): 右の子のノード番号
+            value (T): 集約値
+
+        Returns:
+            int: 追加したノードのノード番号
+        """
+        self.left.append(left)
+        self.right.append(right)
+        self.value.append(value)
+        return len(self.left) - 1
+
+    def _build(self, A: list[T]) -> int:
+        """元の配列から版0の木を構築する
+
+        Args:
+            A (list[T]): 元の配列
+
+        Returns:
+            int: 根のノード番号
+        """
+        # 葉から1段ずつ親を作っていく
+        nodes = [self._new_node(0, 0, a) for a in A]
+        nodes += [self._new_node(0, 0, self.ide_ele) for _ in range(self.N - self._N)]
+        while len(nodes) > 1:
+            nodes = [
+                self._new_node(
+                    nodes[i], nodes[i + 1], self.segfunc(self.value[nodes[i]], self.value[nodes[i + 1]])
+                )
+                for i in range(0, len(nodes), 2)
+            ]
+        return nodes[0]
+
+    def __len__(self) -> int:
+        """版の数
+
+        Returns:
+            int: 版の数
+        """
+        return len(self.roots)
+
+    def get(self, version: int, i: int) -> T:
+        """版versionのA[i]
+
+        Args:
+            version (int): 版
+            i (int): index. 0-indexed.
+
+        Returns:
+            T: A[i]
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        node = self.roots[version]
+        width = self.N
+        while width > 1:
+            width >>= 1
+            if i & width:
+                node = self.right[node]
+            else:
+                node = self.left[node]
+        return self.value[node]
+
+    def update(self, version: int, i: int, x: T) -> int:
+        """版versionに対してA[i] = xとした新しい版を作る
+
+        Args:
+            version (int): 元にする版
+            i (int): index. 0-indexed.
+            x (T): update value.
+
+        Returns:
+            int: 新しい版の番号
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        # 根 -> 葉までの経路を記録
+        path = []
+        node = self.roots[version]
+        width = self.N
+        while width > 1:
+            path.append(node)
+            width >>= 1
+            node = self.right[node] if i & width else self.left[node]
+
+        # 葉 -> 根まで, 経路上のノードを複製する
+        new_node = self._new_node(0, 0, x)
+        width = 1
+        for node in reversed(path):
+            if i & width:
+                left, right = self.left[node], new_node
+            else:
+                left, right = new_node, self.right[node]
+            new_node = self._new_node(left, right, self.segfunc(self.value[left], self.value[right]))
+            width <<= 1
+
+        self.roots.append(new_node)
+        return len(self.roots) - 1
+
+    def add(self, version: int, i: int, x: T) -> int:
+        """版versionに対してA[i] += xとした新しい版を作る
+
+        Args:
+            version (int): 元にする版
+            i (int): index. 0-indexed.
+            x (T): add value.
+
+        Returns:
+            int: 新しい版の番号
+
+        TimeComplexity:
+            O(logN)
+        """
+        return self.update(version, i, self.get(version, i) + x)
+
+    def _query(self, node: int, node_left: int, node_right: int, left: int, right: int) -> T:
+        """A[left..right)を表すノードまで探索する
+
+        Args:
+            node (int): 現在見ているノード番号.
+            node_left (int): 現在見ているノードの左端index. 0-indexed.
+            node_right (int): 現在見ているノードの右端index. 0-indexed.
+            left (int): クエリ下限index. 0-indexed.
+            right (int): クエリ上限index. 0-indexed.
+
+        Returns:
+            T: segfunc(A[left..right))
+        """
+        # 範囲外なら単位元を返す
+        if right <= node_left or node_right <= left:
+            return self.ide_ele
+        # ノード区間[node_left, node_right) ⊂ クエリ区間[left, right) -> ノード区間の値を返す
+        if left <= node_left and node_right <= right:
+            return self.value[node]
+
+        node_mid = (node_left + node_right) >> 1
+        left_value = self._query(self.left[node], node_left, node_mid, left, right)
+        right_value = self._query(self.right[node], node_mid, node_right, left, right)
+        return self.segfunc(left_value, right_value)
+
+    def query(self, version: int, left: int, right: int) -> T:
+        """版versionのsegfunc(A[left..right))
+
+        Args:
+            version (int): 版
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            T: segfunc(A[left..right))
+
+        TimeComplexity:
+            O(logN)
+        """
+        if left >= right:
+            return self.ide_ele
+        return self._query(self.roots[version], 0, self.N, left, right)
@@ -1,5 +1,14 @@
-from typing import Callable, Generic, TypeVar
+from typing import Callable, Generic, Optional, TypeVar
 from itertools import chain
+from array import array
+from math import gcd
+from operator import add, xor
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 
 T = TypeVar("T")
@@ -21,6 +30,10 @@ class SegmentTree(Generic[T]):
         update(i: int, x: T): A[i] = x, O(logN).
         query(left: int, right: int): 非再帰segfunc(A[left..right)), O(logN).
         query_recursion(left: int, right: int): 再帰segfunc(A[left..right)), O(logN).
+        query_many(lefts, rights): 各iについてquery(lefts[i], rights[i]), O(Q logN).
+        add_many(indices, values): 各iについてadd(indices[i], values[i]), O(Q logN).
+        max_right(left, pred): pred(segfunc(A[left..right)))を満たす最大のright, O(logN).
+        min_left(right, pred): pred(segfunc(A[left..right)))を満たす最小のleft, O(logN).
 
     Notes:
         Bit演算
@@ -237,31 +250,654 @@ class SegmentTree(Generic[T]):
 
         return self.segfunc(left_value, right_value)
 
+    def max_right(self, left: int, pred: Callable[[T], bool]) -> int:
+        """pred(segfunc(A[left..right))) = Trueとなる最大のrightを返す
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            pred (Callable[[T], bool]): 判定関数. pred(ide_ele) = Trueである必要がある.
+
+        Returns:
+            int: right. left <= right <= len(A).
+
+        TimeComplexity:
+            O(logN)
+
+        Notes:
+            predが単調 (rightを大きくすると, あるところからFalseになる) である場合,
+            predを満たす最大のrightを二分探索する
+        """
+        if not (0 <= left <= self._N):
+            raise IndexError("list index out of range")
+        if left == self._N:
+            return self._N
+
+        data = self.data
+        left += self.N
+        value = self.ide_ele
+        while True:
+            # leftが左の子である限り親に登る (ノードの左端がleftのままになる)
+            while left & 1 == 0:
+                left >>= 1
+
+            # このノードを加えるとpredを満たさない -> このノードの中に答えがあるので子に降りる
+            if not pred(self.segfunc(value, data[left])):
+                while left < self.N:
+                    left <<= 1
+                    if pred(self.segfunc(value, data[left])):
+                        value = self.segfunc(value, data[left])
+                        left += 1
+                return left - self.N
+
+            value = self.segfunc(value, data[left])
+            left += 1
+            # 右端まで到達した
+            if left & -left == left:
+                return self._N
+
+    def min_left(self, right: int, pred: Callable[[T], bool]) -> int:
+        """pred(segfunc(A[left..right))) = Trueとなる最小のleftを返す
+
+        Args:
+            right (int): 上限index. 0-indexed.
+            pred (Callable[[T], bool]): 判定関数. pred(ide_ele) = Trueである必要がある.
+
+        Returns:
+            int: left. 0 <= left <= right.
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= right <= self._N):
+            raise IndexError("list index out of range")
+        if right == 0:
+            return 0
+
+        data = self.data
+        right += self.N
+        value = self.ide_ele
+        while True:
+            right -= 1
+            # rightが右の子である限り親に登る
+            while right > 1 and right & 1:
+                right >>= 1
+
+            # このノードを加えるとpredを満たさない -> このノードの中に答えがあるので子に降りる
+            if not pred(self.segfunc(data[right], value)):
+                while right < self.N:
+                    right = (right << 1) + 1
+                    if pred(self.segfunc(data[right], value)):
+                        value = self.segfunc(data[right], value)
+                        right -= 1
+                return right + 1 - self.N
+
+            value = self.segfunc(data[right], value)
+            # 左端まで到達した
+            if right & -right == right:
+                return 0
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int]) -> list[T]:
+        """各iについて, segfunc(A[lefts[i]..rights[i]))をまとめて計算する
+
+        Args:
+            lefts (Sequence[int]): 下限indexの列. 0-indexed.
+            rights (Sequence[int]): 上限indexの列. 0-indexed.
+
+        Returns:
+            list[T]: 各クエリの結果
+
+        TimeComplexity:
+            O(Q logN)
+        """
+        return list(map(self.query, lefts, rights))
+
+    def add_many(self, indices: Sequence[int], values: Sequence[T]):
+        """各iについて, A[indices[i]] += values[i]をまとめて行う
+
+        Args:
+            indices (Sequence[int]): indexの列. 0-indexed.
+            values (Sequence[T]): 加算する値の列.
+
+        TimeComplexity:
+            O(Q logN)
+        """
+        for i, x in zip(indices, values):
+            self.add(i, x)
+
+
+class TypedSegmentTree(SegmentTree[T]):
+    """組み込みの数値モノイド用の1点更新・区間集約Segment Tree.
+
+    ノードをarray (typecode="q" or "d") に格納し, 更新・集約時の演算をインライン化する.
+    演算ごとにサブクラス (SumSegmentTree, MinSegmentTree, ...) で update / query を実装する.
+
+    Attributes:
+        _N (int): 元の配列のサイズ
+        N (int): セグメント木の葉の数. N以上の最小の2のべき乗.
+        data (array): 元の配列の集約値を保存する木. 1-indexed.
+        segfunc (Callable[[T, T], T]): モノイド上の2項演算. 構築・再帰クエリで使用する.
+        ide_ele (T): モノイド上の単位元.
+        typecode (str): dataのtypecode.
+
+    Notes:
+        - listに比べてノードあたりのメモリが小さく (intオブジェクトを保持しない), segfuncの呼び出しもない
+        - 値はtypecodeの範囲に収まる必要がある ("q"なら -2^63 <= x < 2^63)
+    """
+
+    segfunc: Callable[[T, T], T]
+    # segfuncに対応するnumpyのufunc名
+    _ufunc_name: str
+
+    def __init__(self, A: list[T], ide_ele: T, typecode: str = "q"):
+        """数値モノイド用Segment Tree
+
+        Args:
+            A (list[T]): 元の配列
+            ide_ele (T): segfuncに対する単位元
+            typecode (str): ノードを格納するarrayのtypecode. "q" (int64) or "d" (float64).
+
+        TimeComplexity:
+            O(N)
+        """
+        self._N = len(A)
+        # N以上の最小の2のべき乗
+        self.N = 1 << (self._N - 1).bit_length()
+        self.ide_ele = ide_ele
+        self.typecode = typecode
+
+        self.data = self._build(A)
+
+    def _build(self, A: list[T]) -> array:
+        """元の配列からセグメント木を構築する
+
+        Args:
+            A (list[T]): 元の配列
+
+        Returns:
+            array: Segment Tree
+        """
+        N = self.N
+        data = array(self.typecode, [self.ide_ele]) * (2 * N)
+        data[N: N + self._N] = array(self.typecode, A)
+
+        # 1段ずつ, 子のスライス同士をmapで集約する
+        k = N >> 1
+        while k:
+            data[k: 2 * k] = array(
+                self.typecode, map(self.segfunc, data[2 * k: 4 * k: 2], data[2 * k + 1: 4 * k: 2])
+            )
+            k >>= 1
+        return data
+
+    def add(self, i: int, x: T):
+        """A[i] += x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): add value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        self.update(i, self.data[i + self.N] + x)
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int]) -> array:
+        """各iについて, segfunc(A[lefts[i]..rights[i]))をまとめて計算する
+
+        Args:
+            lefts (Sequence[int]): 下限indexの列. 0-indexed. numpy配列も可.
+            rights (Sequence[int]): 上限indexの列. 0-indexed. numpy配列も可.
+
+        Returns:
+            array: 各クエリの結果. typecodeはself.typecode.
+
+        TimeComplexity:
+            O(Q logN)
+
+        Notes:
+            numpyがある場合, 全クエリを1段ずつまとめて葉から根へ登る (段ごとにベクトル演算)
+        """
+        if np is None:
+            return array(self.typecode, map(self.query, lefts, rights))
+
+        ufunc = getattr(np, self._ufunc_name)
+        data = np.frombuffer(self.data, dtype=self.typecode)
+        left = np.asarray(lefts, dtype=np.int64) + self.N
+        right = np.asarray(rights, dtype=np.int64) + self.N
+        value = np.full(left.shape, self.ide_ele, dtype=self.typecode)
+
+        # 演算は可換なので, 左右の集約値を分ける必要はない
+        while True:
+            active = left < right
+            if not active.any():
+                break
+
+            # 奇数なら対象ノードは親の右のノードなので, 集約して一つ右のノードへ
+            mask = active & ((left & 1) == 1)
+            value[mask] = ufunc(value[mask], data[left[mask]])
+            left += mask
+
+            # 奇数なら対象ノードは親の左のノードなので, 左に移動して集約
+            mask = active & ((right & 1) == 1)
+            right -= mask
+            value[mask] = ufunc(value[mask], data[right[mask]])
+
+            left >>= 1
+            right >>= 1
+
+        return array(self.typecode, value.tobytes())
+
+    def add_many(self, indices: Sequence[int], values: Sequence[T]):
+        """各iについて, add(indices[i], values[i])をまとめて行う
+
+        Args:
+            indices (Sequence[int]): indexの列. 0-indexed. numpy配列も可.
+            values (Sequence[T]): 加算する値の列. numpy配列も可.
+
+        Raises:
+            IndexError: numpyがあり, 範囲外のindexを含む場合 (木は変更しない)
+
+        TimeComplexity:
+            O(Q logN)
+
+        Notes:
+            numpyがある場合, 葉に一括で加算した後, 影響を受けるノードを1段ずつまとめて再計算する
+        """
+        if np is None:
+            for i, x in zip(indices, values):
+                self.add(i, x)
+            return
+
+        ufunc = getattr(np, self._ufunc_name)
+        data = np.frombuffer(self.data, dtype=self.typecode)
+        nodes = np.asarray(indices, dtype=np.int64)
+        # 途中まで加算した状態で失敗しないよう, 先に全てのindexを検査する
+        if nodes.size and (nodes.min() < 0 or nodes.max() >= self._N):
+            raise IndexError("list index out of range")
+        nodes += self.N
+        # 同じindexが複数回現れる場合も正しく加算する
+        np.add.at(data, nodes, np.asarray(values, dtype=self.typecode))
+
+        nodes = np.unique(nodes >> 1)
+        while nodes.size and nodes[-1] > 0:
+            nodes = nodes[nodes > 0]
+            data[nodes] = ufunc(data[nodes << 1], data[(nodes << 1) + 1])
+            nodes = np.unique(nodes >> 1)
+
+
+class SumSegmentTree(TypedSegmentTree[T]):
+    """区間和のTypedSegmentTree"""
+
+    segfunc = add
+    _ufunc_name = "add"
+
+    def add(self, i: int, x: T):
+        """A[i] += x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): add value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        # 和の場合は, 葉から根までxを足すだけでよい
+        data = self.data
+        i += self.N
+        while i:
+            data[i] += x
+            i >>= 1
+
+    def update(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        i += self.N
+        data[i] = x
+        i >>= 1
+        while i:
+            data[i] = data[i << 1] + data[(i << 1) + 1]
+            i >>= 1
+
+    def query(self, left: int, right: int) -> T:
+        """非再起sum(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            T: sum(A[left..right))
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        left += self.N
+        right += self.N
+
+        # 可換なので, 左右の集約値を分ける必要はない
+        value = self.ide_ele
+        while left < right:
+            if left & 1:
+                value += data[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                value += data[right]
+            left >>= 1
+            right >>= 1
+        return value
+
+
+class MinSegmentTree(TypedSegmentTree[T]):
+    """区間最小値のTypedSegmentTree"""
+
+    segfunc = min
+    _ufunc_name = "minimum"
+
+    def update(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        i += self.N
+        data[i] = x
+        i >>= 1
+        while i:
+            left_value, right_value = data[i << 1], data[(i << 1) + 1]
+            data[i] = left_value if left_value < right_value else right_value
+            i >>= 1
+
+    def query(self, left: int, right: int) -> T:
+        """非再起min(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            T: min(A[left..right))
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        left += self.N
+        right += self.N
+
+        value = self.ide_ele
+        while left < right:
+            if left & 1:
+                if data[left] < value:
+                    value = data[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                if data[right] < value:
+                    value = data[right]
+            left >>= 1
+            right >>= 1
+        return value
+
+
+class MaxSegmentTree(TypedSegmentTree[T]):
+    """区間最大値のTypedSegmentTree"""
+
+    segfunc = max
+    _ufunc_name = "maximum"
+
+    def update(self, i: int, x: T):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (T): update value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        i += self.N
+        data[i] = x
+        i >>= 1
+        while i:
+            left_value, right_value = data[i << 1], data[(i << 1) + 1]
+            data[i] = left_value if left_value > right_value else right_value
+            i >>= 1
+
+    def query(self, left: int, right: int) -> T:
+        """非再起max(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            T: max(A[left..right))
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        left += self.N
+        right += self.N
+
+        value = self.ide_ele
+        while left < right:
+            if left & 1:
+                if data[left] > value:
+                    value = data[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                if data[right] > value:
+                    value = data[right]
+            left >>= 1
+            right >>= 1
+        return value
+
+
+class XorSegmentTree(TypedSegmentTree[int]):
+    """区間xorのTypedSegmentTree
+
+    Notes:
+        add(i, x)は他のSegment Treeと同じく A[i] += x (A[i] ^= x ではない)
+    """
+
+    segfunc = xor
+    _ufunc_name = "bitwise_xor"
+
+    def update(self, i: int, x: int):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (int): update value.
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        i += self.N
+        data[i] = x
+        i >>= 1
+        while i:
+            data[i] = data[i << 1] ^ data[(i << 1) + 1]
+            i >>= 1
+
+    def query(self, left: int, right: int) -> int:
+        """非再起xor(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: A[left] ^ ... ^ A[right - 1]
+
+        TimeComplexity:
+            O(logN)
+        """
+        data = self.data
+        left += self.N
+        right += self.N
+
+        value = self.ide_ele
+        while left < right:
+            if left & 1:
+                value ^= data[left]
+                left += 1
+            if right & 1:
+                right -= 1
+                value ^= data[right]
+            left >>= 1
+            right >>= 1
+        return value
+
+
+class GcdSegmentTree(TypedSegmentTree[int]):
+    """区間gcdのTypedSegmentTree"""
+
+    segfunc = gcd
+    _ufunc_name = "gcd"
+
+    def update(self, i: int, x: int):
+        """A[i] = x
+
+        Args:
+            i (int): index. 0-indexed.
+            x (int): update value.
+
+        TimeComplexity:
+            O(logN * log(max(A)))
+        """
+        data = self.data
+        i += self.N
+        data[i] = x
+        i >>= 1
+        while i:
+            data[i] = gcd(data[i << 1], data[(i << 1) + 1])
+            i >>= 1
+
+    def query(self, left: int, right: int) -> int:
+        """非再起gcd(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: gcd(A[left..right))
 
-def RangeMinimumQuery(A: list[int]) -> SegmentTree[int]:
+        TimeComplexity:
+            O(logN * log(max(A)))
+        """
+        data = self.data
+        left += self.N
+        right += self.N
+
+        value = self.ide_ele
+        while left < right:
+            if left & 1:
+                value = gcd(value, data[left])
+                left += 1
+            if right & 1:
+                right -= 1
+                value = gcd(value, data[right])
+            left >>= 1
+            right >>= 1
+        return value
+
+
+def RangeMinimumQuery(A: list[int], typecode: Optional[str] = None) -> SegmentTree[int]:
     """Range Minimum Query
 
     Args:
         A (list[int]): Segment Treeに乗せる配列
+        typecode (Optional[str]): 指定した場合, そのtypecodeのarrayを使うMinSegmentTreeを返す. ("q" or "d")
 
     Returns:
         SegmentTree[int]: Range Minimum Query
     """
+    if typecode is not None:
+        return MinSegmentTree[int](A, 10**15, typecode)
     return SegmentTree[int](A, min, 10**15)
 
 
-def RangeSumQuery(A: list[int]) -> SegmentTree[int]:
+def RangeMaximumQuery(A: list[int], typecode: Optional[str] = None) -> SegmentTree[int]:
+    """Range Maximum Query
+
+    Args:
+        A (list[int]): Segment Treeに乗せる配列
+        typecode (Optional[str]): 指定した場合, そのtypecodeのarrayを使うMaxSegmentTreeを返す. ("q" or "d")
+
+    Returns:
+        SegmentTree[int]: Range Maximum Query
+    """
+    if typecode is not None:
+        return MaxSegmentTree[int](A, -(10**15), typecode)
+    return SegmentTree[int](A, max, -(10**15))
+
+
+def RangeSumQuery(A: list[int], typecode: Optional[str] = None) -> SegmentTree[int]:
     """Range Sum Query
 
     Args:
         A (list[int]): Segment Treeに乗せる配列
+        typecode (Optional[str]): 指定した場合, そのtypecodeのarrayを使うSumSegmentTreeを返す. ("q" or "d")
 
     Returns:
         SegmentTree[int]: Range Sum Query
     """
+    if typecode is not None:
+        return SumSegmentTree[int](A, 0, typecode)
     return SegmentTree[int](A, lambda x, y: x + y, 0)
 
 
+def RangeXorQuery(A: list[int], typecode: Optional[str] = None) -> SegmentTree[int]:
+    """Range Xor Query
+
+    Args:
+        A (list[int]): Segment Treeに乗せる配列
+        typecode (Optional[str]): 指定した場合, そのtypecodeのarrayを使うXorSegmentTreeを返す. ("q"のみ)
+
+    Returns:
+        SegmentTree[int]: Range Xor Query
+    """
+    if typecode is not None:
+        return XorSegmentTree(A, 0, typecode)
+    return SegmentTree[int](A, xor, 0)
+
+
+def RangeGcdQuery(A: list[int], typecode: Optional[str] = None) -> SegmentTree[int]:
+    """Range Gcd Query
+
+    Args:
+        A (list[int]): Segment Treeに乗せる配列
+        typecode (Optional[str]): 指定した場合, そのtypecodeのarrayを使うGcdSegmentTreeを返す. ("q"のみ)
+
+    Returns:
+        SegmentTree[int]: Range Gcd Query
+    """
+    if typecode is not None:
+        return GcdSegmentTree(A, 0, typecode)
+    return SegmentTree[int](A, gcd, 0)
+
+
 def RangeCompositeQuery(A: list[list[int, int]]) -> SegmentTree[list[list[int, int]]]:
     """Range Composite Query
 
@@ -0,0 +1,414 @@
+from typing import Callable
+from array import array
+
+
+INF = 1 << 62
+
+
+class SegmentTreeBeats:
+    """区間chmin・区間chmax・区間加算・区間和・区間最大値・区間最小値を扱うSegment Tree Beats
+
+    各ノードに最大値, 2番目の最大値, 最大値の個数 (最小値も同様) を持つ.
+    chmin(x)では 2番目の最大値 < x < 最大値 のノードで探索を打ち切り, 最大値のみを書き換える.
+
+    Attributes:
+        _N (int): 元の配列の長さ
+        N (int): segment tree用に拡張した配列の長さ, _N以上の最小の2のべき乗
+        max1 (array): 区間の最大値
+        max2 (array): 区間の2番目の最大値 (存在しない場合は-INF)
+        max_count (array): 区間の最大値の個数
+        min1 (array): 区間の最小値
+        min2 (array): 区間の2番目の最小値 (存在しない場合はINF)
+        min_count (array): 区間の最小値の個数
+        sum (array): 区間和
+        length (array): 区間の長さ (拡張した部分は含まない)
+        lazy_add (array): 子に伝播していない加算値
+
+    Methods:
+        range_chmin(left, right, x): A[i] = min(A[i], x) (left <= i < right), 償却O(log^2 N)
+        range_chmax(left, right, x): A[i] = max(A[i], x) (left <= i < right), 償却O(log^2 N)
+        range_add(left, right, x): A[i] += x (left <= i < right), 償却O(log^2 N)
+        range_update(left, right, x): A[i] = x (left <= i < right), 償却O(log^2 N)
+        range_sum(left, right): sum(A[left..right)), O(logN)
+        range_max(left, right): max(A[left..right)), O(logN)
+        range_min(left, right): min(A[left..right)), O(logN)
+        get(i): A[i], O(logN)
+
+    Notes:
+        - 値は -INF < x < INF (INF = 2^62) である必要がある
+        - 各ノードの値はarray("q")に格納する. 1-indexed.
+    """
+
+    def __init__(self, A: list[int]):
+        """Segment Tree Beats
+
+        Args:
+            A (list[int]): 元の配列
+
+        TimeComplexity:
+            O(N)
+        """
+        self._N = len(A)
+        self.N = 1 << (self._N - 1).bit_length()
+        N = self.N
+
+        # 拡張した部分の葉は, どの操作でも変化しない値にしておく
+        self.max1 = array("q", [-INF]) * (2 * N)
+        self.max2 = array("q", [-INF]) * (2 * N)
+        self.max_count = array("q", [0]) * (2 * N)
+        self.min1 = array("q", [INF]) * (2 * N)
+        self.min2 = array("q", [INF]) * (2 * N)
+        self.min_count = array("q", [0]) * (2 * N)
+        self.sum = array("q", [0]) * (2 * N)
+        self.length = array("q", [0]) * (2 * N)
+        self.lazy_add = array("q", [0]) * (2 * N)
+
+        for i, a in enumerate(A):
+            k = i + N
+            self.max1[k] = self.min1[k] = self.sum[k] = a
+            self.max_count[k] = self.min_count[k] = self.length[k] = 1
+
+        for k in range(N - 1, 0, -1):
+            self.length[k] = self.length[k << 1] + self.length[(k << 1) + 1]
+            self._update(k)
+
+    def _update(self, k: int):
+        """ノードkの値を子から再計算する
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+        """
+        left, right = k << 1, (k << 1) + 1
+        self.sum[k] = self.sum[left] + self.sum[right]
+
+        max1, max2, max_count = self.max1, self.max2, self.max_count
+        if max1[left] < max1[right]:
+            max1[k] = max1[right]
+            max_count[k] = max_count[right]
+            max2[k] = max(max1[left], max2[right])
+        elif max1[left] > max1[right]:
+            max1[k] = max1[left]
+            max_count[k] = max_count[left]
+            max2[k] = max(max2[left], max1[right])
+        else:
+            max1[k] = max1[left]
+            max_count[k] = max_count[left] + max_count[right]
+            max2[k] = max(max2[left], max2[right])
+
+        min1, min2, min_count = self.min1, self.min2, self.min_count
+        if min1[left] > min1[right]:
+            min1[k] = min1[right]
+            min_count[k] = min_count[right]
+            min2[k] = min(min1[left], min2[right])
+        elif min1[left] < min1[right]:
+            min1[k] = min1[left]
+            min_count[k] = min_count[left]
+            min2[k] = min(min2[left], min1[right])
+        else:
+            min1[k] = min1[left]
+            min_count[k] = min_count[left] + min_count[right]
+            min2[k] = min(min2[left], min2[right])
+
+    def _apply_chmin(self, k: int, x: int):
+        """max2 < x < max1 であるノードkの最大値をxに書き換える
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+            x (int): chminの値.
+        """
+        self.sum[k] += (x - self.max1[k]) * self.max_count[k]
+        # 最大値と最小値 (or 2番目の最小値) が同じ要素の場合は, そちらも書き換える
+        if self.max1[k] == self.min1[k]:
+            self.min1[k] = x
+        elif self.max1[k] == self.min2[k]:
+            self.min2[k] = x
+        self.max1[k] = x
+
+    def _apply_chmax(self, k: int, x: int):
+        """min1 < x < min2 であるノードkの最小値をxに書き換える
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+            x (int): chmaxの値.
+        """
+        self.sum[k] += (x - self.min1[k]) * self.min_count[k]
+        if self.min1[k] == self.max1[k]:
+            self.max1[k] = x
+        elif self.min1[k] == self.max2[k]:
+            self.max2[k] = x
+        self.min1[k] = x
+
+    def _apply_add(self, k: int, x: int):
+        """ノードkの区間全体にxを加算する
+
+        Args:
+            k (int): ノード番号. 1-indexed.
+            x (int): 加算する値.
+        """
+        self.max1[k] += x
+        if self.max2[k] != -INF:
+            self.max2[k] += x
+        self.min1[k] += x
+        if self.min2[k] != INF:
+            self.min2[k] += x
+        self.sum[k] += x * self.length[k]
+        self.lazy_add[k] += x
+
+    def _push(self, k: int):
+        """ノードkの遅延情報 (加算, chmin, chmax) を子に伝播する
+
+        Args:
+            k (int): ノード番号. 1-indexed. 葉でないこと.
+        """
+        left, right = k << 1, (k << 1) + 1
+        if self.lazy_add[k]:
+            self._apply_add(left, self.lazy_add[k])
+            self._apply_add(right, self.lazy_add[k])
+            self.lazy_add[k] = 0
+
+        # 子の最大値が親の最大値より大きい -> 親にchminが適用されている
+        if self.max1[k] < self.max1[left]:
+            self._apply_chmin(left, self.max1[k])
+        if self.max1[k] < self.max1[right]:
+            self._apply_chmin(right, self.max1[k])
+
+        if self.min1[k] > self.min1[left]:
+            self._apply_chmax(left, self.min1[k])
+        if self.min1[k] > self.min1[right]:
+            self._apply_chmax(right, self.min1[k])
+
+    def _range_chmin(self, left: int, right: int, x: int, k: int, node_left: int, node_right: int):
+        """A[left..right)を表すノードまで探索し, chminを適用する
+
+        Args:
+            left (int): クエリ下限index. 0-indexed.
+            right (int): クエリ上限index. 0-indexed.
+            x (int): chminの値.
+            k (int): 現在見ているノード番号. 1-indexed.
+            node_left (int): 現在見ているノードの左端index. 0-indexed.
+            node_right (int): 現在見ているノードの右端index. 0-indexed.
+        """
+        if right <= node_left or node_right <= left or self.max1[k] <= x:
+            return
+        if left <= node_left and node_right <= right and self.max2[k] < x:
+            self._apply_chmin(k, x)
+            return
+
+        self._push(k)
+        node_mid = (node_left + node_right) >> 1
+        self._range_chmin(left, right, x, k << 1, node_left, node_mid)
+        self._range_chmin(left, right, x, (k << 1) + 1, node_mid, node_right)
+        self._update(k)
+
+    def _range_chmax(self, left: int, right: int, x: int, k: int, node_left: int, node_right: int):
+        """A[left..right)を表すノードまで探索し, chmaxを適用する
+
+        Args:
+            left (int): クエリ下限index. 0-indexed.
+            right (int): クエリ上限index. 0-indexed.
+            x (int): chmaxの値.
+            k (int): 現在見ているノード番号. 1-indexed.
+            node_left (int): 現在見ているノードの左端index. 0-indexed.
+            node_right (int): 現在見ているノードの右端index. 0-indexed.
+        """
+        if right <= node_left or node_right <= left or self.min1[k] >= x:
+            return
+        if left <= node_left and node_right <= right and self.min2[k] > x:
+            self._apply_chmax(k, x)
+            return
+
+        self._push(k)
+        node_mid = (node_left + node_right) >> 1
+        self._range_chmax(left, right, x, k << 1, node_left, node_mid)
+        self._range_chmax(left, right, x, (k << 1) + 1, node_mid, node_right)
+        self._update(k)
+
+    def _range_add(self, left: int, right: int, x: int, k: int, node_left: int, node_right: int):
+        """A[left..right)を表すノードまで探索し, xを加算する
+
+        Args:
+            left (int): クエリ下限index. 0-indexed.
+            right (int): クエリ上限index. 0-indexed.
+            x (int): 加算する値.
+            k (int): 現在見ているノード番号. 1-indexed.
+            node_left (int): 現在見ているノードの左端index. 0-indexed.
+            node_right (int): 現在見ているノードの右端index. 0-indexed.
+        """
+        if right <= node_left or node_right <= left:
+            return
+        if left <= node_left and node_right <= right:
+            self._apply_add(k, x)
+            return
+
+        self._push(k)
+        node_mid = (node_left + node_right) >> 1
+        self._range_add(left, right, x, k << 1, node_left, node_mid)
+        self._range_add(left, right, x, (k << 1) + 1, node_mid, node_right)
+        self._update(k)
+
+    def range_chmin(self, left: int, right: int, x: int):
+        """A[i] = min(A[i], x) (left <= i < right)
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            x (int): chminの値.
+
+        TimeComplexity:
+            償却O(log^2 N)
+        """
+        self._range_chmin(max(left, 0), min(right, self._N), x, 1, 0, self.N)
+
+    def range_chmax(self, left: int, right: int, x: int):
+        """A[i] = max(A[i], x) (left <= i < right)
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            x (int): chmaxの値.
+
+        TimeComplexity:
+            償却O(log^2 N)
+        """
+        self._range_chmax(max(left, 0), min(right, self._N), x, 1, 0, self.N)
+
+    def range_add(self, left: int, right: int, x: int):
+        """A[i] += x (left <= i < right)
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            x (int): 加算する値.
+
+        TimeComplexity:
+            償却O(log^2 N)
+        """
+        self._range_add(max(left, 0), min(right, self._N), x, 1, 0, self.N)
+
+    def range_update(self, left: int, right: int, x: int):
+        """A[i] = x (left <= i < right)
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+            x (int): 更新値.
+
+        TimeComplexity:
+            償却O(log^2 N)
+        """
+        self.range_chmin(left, right, x)
+        self.range_chmax(left, right, x)
+
+    def _query(
+        self,
+        left: int,
+        right: int,
+        values: array,
+        k: int,
+        node_left: int,
+        node_right: int,
+        op: Callable[[int, int], int],
+        ide: int,
+    ) -> int:
+        """A[left..right)を表すノードまで探索し, valuesの値をopで集約する
+
+        Args:
+            left (int): クエリ下限index. 0-indexed.
+            right (int): クエリ上限index. 0-indexed.
+            values (array): 集約する値 (sum, max1, min1のいずれか).
+            k (int): 現在見ているノード番号. 1-indexed.
+            node_left (int): 現在見ているノードの左端index. 0-indexed.
+            node_right (int): 現在見ているノードの右端index. 0-indexed.
+            op (Callable[[int, int], int]): 集約する演算.
+            ide (int): opの単位元.
+
+        Returns:
+            int: op(values[A[left..right)])
+        """
+        if right <= node_left or node_right <= left:
+            return ide
+        if left <= node_left and node_right <= right:
+            return values[k]
+
+        self._push(k)
+        node_mid = (node_left + node_right) >> 1
+        return op(
+            self._query(left, right, values, k << 1, node_left, node_mid, op, ide),
+            self._query(left, right, values, (k << 1) + 1, node_mid, node_right, op, ide),
+        )
+
+    def range_sum(self, left: int, right: int) -> int:
+        """sum(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: sum(A[left..right))
+
+        TimeComplexity:
+            O(logN)
+        """
+        return self._query(left, right, self.sum, 1, 0, self.N, int.__add__, 0)
+
+    def range_max(self, left: int, right: int) -> int:
+        """max(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: max(A[left..right)). 空区間の場合は-INF.
+
+        TimeComplexity:
+            O(logN)
+        """
+        return self._query(left, right, self.max1, 1, 0, self.N, max, -INF)
+
+    def range_min(self, left: int, right: int) -> int:
+        """min(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            int: min(A[left..right)). 空区間の場合はINF.
+
+        TimeComplexity:
+            O(logN)
+        """
+        return self._query(left, right, self.min1, 1, 0, self.N, min, INF)
+
+    def __getitem__(self, i: int) -> int:
+        """A[i]を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: A[i]
+        """
+        return self.get(i)
+
+    def get(self, i: int) -> int:
+        """A[i]を取得する
+
+        Args:
+            i (int): index. 0-indexed.
+
+        Returns:
+            int: A[i]
+
+        TimeComplexity:
+            O(logN)
+        """
+        if not (0 <= i < self._N):
+            raise IndexError("list index out of range")
+
+        k = i + self.N
+        for h in range(self.N.bit_length() - 1, 0, -1):
+            self._push(k >> h)
+        return self.sum[k]
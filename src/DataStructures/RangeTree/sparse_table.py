@@ -0,0 +1,334 @@
+from typing import Callable, Generic, Optional, TypeVar
+from array import array
+from collections.abc import Sequence
+from math import gcd
+from operator import add, and_, or_, xor
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+T = TypeVar("T")
+
+# query_manyでnumpyのufuncに置き換えられる冪等な演算 (SparseTable用)
+_IDEMPOTENT_UFUNC_NAMES = {
+    min: "minimum",
+    max: "maximum",
+    gcd: "gcd",
+    and_: "bitwise_and",
+    or_: "bitwise_or",
+}
+# query_manyでnumpyのufuncに置き換えられる演算 (DisjointSparseTable用)
+_UFUNC_NAMES = {
+    **_IDEMPOTENT_UFUNC_NAMES,
+    add: "add",
+    xor: "bitwise_xor",
+}
+
+
+def _init_result(nonempty, ide_ele, typecode):
+    """query_manyの結果の配列を, 空区間のクエリをide_eleで埋めて用意する
+
+    Args:
+        nonempty (np.ndarray): 各クエリの区間が空でないか
+        ide_ele (Optional[T]): 空区間に対して返す値
+        typecode (str): 結果のtypecode
+
+    Returns:
+        np.ndarray: 結果の配列. 空でない区間の値は未設定.
+
+    Raises:
+        ValueError: ide_eleがNoneで, 空区間のクエリがある場合
+    """
+    if ide_ele is not None:
+        return np.full(nonempty.shape, ide_ele, dtype=typecode)
+    if not nonempty.all():
+        raise ValueError("ide_ele is required for empty ranges")
+    return np.empty(nonempty.shape, dtype=typecode)
+
+
+class SparseTable(Generic[T]):
+    """静的な配列に対する区間集約を O(1)で行う (冪等な演算のみ)
+
+    table[k][i] = segfunc(A[i..i+2^k)) を前計算し, クエリ区間を重なりを許す2つの区間で覆う.
+
+    Attributes:
+        _N (int): 元の配列のサイズ
+        LOG (int): 段数. 2^(LOG-1) <= _N.
+        segfunc (Callable[[T, T], T]): 冪等なモノイド上の2項演算. (min, max, gcd, and, or など)
+        ide_ele (Optional[T]): 空区間に対して返す値.
+        table (list[T] | array): 各段を1次元に並べたもの. table[k * _N + i] = segfunc(A[i..i+2^k)).
+
+    Methods:
+        query(left: int, right: int): segfunc(A[left..right)), O(1).
+        query_many(lefts, rights): 各iについてquery(lefts[i], rights[i]), O(Q).
+    """
+
+    def __init__(
+        self,
+        A: list[T],
+        segfunc: Callable[[T, T], T],
+        ide_ele: Optional[T] = None,
+        typecode: Optional[str] = None,
+    ):
+        """Sparse Table
+
+        Args:
+            A (list[T]): 元の配列
+            segfunc (Callable[[T, T], T]): 冪等なモノイド上の2項演算 (segfunc(x, x) = x)
+            ide_ele (Optional[T]): 空区間に対して返す値
+            typecode (Optional[str]): 指定した場合, tableをそのtypecodeのarrayに格納する. ("q" or "d")
+
+        Raises:
+            ValueError: segfuncが冪等でないことが分かっている演算 (add, xor) の場合
+
+        TimeComplexity:
+            O(N logN)
+        """
+        if segfunc in _UFUNC_NAMES and segfunc not in _IDEMPOTENT_UFUNC_NAMES:
+            raise ValueError("segfunc must be idempotent. Use DisjointSparseTable instead.")
+
+        self._N = len(A)
+        self.LOG = max(self._N.bit_length(), 1)
+        self.segfunc = segfunc
+        self.ide_ele = ide_ele
+        self.typecode = typecode
+        self.table = self._build(A)
+
+    def _build(self, A: list[T]) -> list[T]:
+        """tableを構築する
+
+        Args:
+            A (list[T]): 元の配列
+
+        Returns:
+            list[T] | array: table
+        """
+        N = self._N
+        rows = [list(A)]
+        for k in range(1, self.LOG):
+            prev, half = rows[-1], 1 << (k - 1)
+            row = list(map(self.segfunc, prev[: N - (1 << k) + 1], prev[half: half + N - (1 << k) + 1]))
+            rows.append(row)
+
+        # 各段の長さをNに揃えて1次元に並べる (はみ出た部分は使用しない)
+        pad = A[0] if A else self.ide_ele
+        table = []
+        for row in rows:
+            table += row
+            table += [pad] * (N - len(row))
+        return table if self.typecode is None else array(self.typecode, table)
+
+    def query(self, left: int, right: int) -> Optional[T]:
+        """segfunc(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            Optional[T]: segfunc(A[left..right)). 空区間の場合はide_ele.
+
+        TimeComplexity:
+            O(1)
+        """
+        left, right = max(left, 0), min(right, self._N)
+        if left >= right:
+            return self.ide_ele
+
+        k = (right - left).bit_length() - 1
+        offset = k * self._N
+        return self.segfunc(self.table[offset + left], self.table[offset + right - (1 << k)])
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int]) -> list[T]:
+        """各iについて, segfunc(A[lefts[i]..rights[i]))をまとめて計算する
+
+        Args:
+            lefts (Sequence[int]): 下限indexの列. 0-indexed. numpy配列も可.
+            rights (Sequence[int]): 上限indexの列. 0-indexed. numpy配列も可.
+
+        Returns:
+            list[T] | array: 各クエリの結果. typecodeを指定した場合はarray.
+
+        TimeComplexity:
+            O(Q)
+
+        Notes:
+            numpy & typecodeあり & segfuncがnumpyのufuncに対応する場合, まとめてベクトル演算する.
+            空区間のクエリはide_eleになる (queryと同じ).
+        """
+        name = _IDEMPOTENT_UFUNC_NAMES.get(self.segfunc)
+        if np is None or self.typecode is None or name is None:
+            result = list(map(self.query, lefts, rights))
+            return result if self.typecode is None else array(self.typecode, result)
+
+        table = np.frombuffer(self.table, dtype=self.typecode)
+        left = np.clip(np.asarray(lefts, dtype=np.int64), 0, self._N)
+        right = np.clip(np.asarray(rights, dtype=np.int64), 0, self._N)
+        nonempty = left < right
+        result = _init_result(nonempty, self.ide_ele, self.typecode)
+        left, right = left[nonempty], right[nonempty]
+
+        # k = floor(log2(right - left))
+        length = right - left
+        k = np.zeros(length.shape, dtype=np.int64)
+        for b in range(1, self.LOG):
+            k += (length >> b) > 0
+
+        offset = k * self._N
+        result[nonempty] = getattr(np, name)(table[offset + left], table[offset + right - (1 << k)])
+        return array(self.typecode, result.tobytes())
+
+
+class DisjointSparseTable(Generic[T]):
+    """静的な配列に対する区間集約を O(1)で行う (任意のモノイド)
+
+    段hでは配列を長さ2^(h+1)のブロックに分け, 各ブロックの中央から左右への累積を前計算する.
+    クエリ区間[left, right)は, leftとright-1が初めて別れる段の中央で2つに分割できる.
+
+    Attributes:
+        _N (int): 元の配列のサイズ
+        N (int): 元の配列を拡張したサイズ. _N以上の最小の2のべき乗.
+        LOG (int): 段数. log2(N).
+        segfunc (Callable[[T, T], T]): モノイド上の2項演算. (非可換でもよい)
+        ide_ele (Optional[T]): 空区間に対して返す値.
+        A (list[T] | array): 元の配列.
+        table (list[T] | array): 各段を1次元に並べたもの.
+
+    Methods:
+        query(left: int, right: int): segfunc(A[left..right)), O(1).
+        query_many(lefts, rights): 各iについてquery(lefts[i], rights[i]), O(Q).
+    """
+
+    def __init__(
+        self,
+        A: list[T],
+        segfunc: Callable[[T, T], T],
+        ide_ele: Optional[T] = None,
+        typecode: Optional[str] = None,
+    ):
+        """Disjoint Sparse Table
+
+        Args:
+            A (list[T]): 元の配列
+            segfunc (Callable[[T, T], T]): モノイド上の2項演算
+            ide_ele (Optional[T]): 空区間に対して返す値
+            typecode (Optional[str]): 指定した場合, tableをそのtypecodeのarrayに格納する. ("q" or "d")
+
+        TimeComplexity:
+            O(N logN)
+        """
+        self._N = len(A)
+        self.N = 1 << (self._N - 1).bit_length()
+        self.LOG = max(self.N.bit_length() - 1, 1)
+        self.segfunc = segfunc
+        self.ide_ele = ide_ele
+        self.typecode = typecode
+        self.A = list(A) if typecode is None else array(typecode, A)
+        self.table = self._build(A)
+
+    def _build(self, A: list[T]) -> list[T]:
+        """tableを構築する
+
+        Args:
+            A (list[T]): 元の配列
+
+        Returns:
+            list[T] | array: table. table[h * _N + i]
+        """
+        N, op = self._N, self.segfunc
+        pad = A[0] if A else self.ide_ele
+        table = [pad] * (self.LOG * N)
+        for h in range(self.LOG):
+            offset = h * N
+            block = 1 << (h + 1)
+            for mid in range(1 << h, N + (1 << h), block):
+                if mid > N:
+                    break
+                # 中央から左へ: table[i] = segfunc(A[i..mid))
+                value = A[mid - 1]
+                table[offset + mid - 1] = value
+                for i in range(mid - 2, mid - (1 << h) - 1, -1):
+                    value = op(A[i], value)
+                    table[offset + i] = value
+
+                # 中央から右へ: table[i] = segfunc(A[mid..i])
+                if mid == N:
+                    continue
+                value = A[mid]
+                table[offset + mid] = value
+                for i in range(mid + 1, min(mid + (1 << h), N)):
+                    value = op(value, A[i])
+                    table[offset + i] = value
+        return table if self.typecode is None else array(self.typecode, table)
+
+    def query(self, left: int, right: int) -> Optional[T]:
+        """segfunc(A[left..right))
+
+        Args:
+            left (int): 下限index. 0-indexed.
+            right (int): 上限index. 0-indexed.
+
+        Returns:
+            Optional[T]: segfunc(A[left..right)). 空区間の場合はide_ele.
+
+        TimeComplexity:
+            O(1)
+        """
+        left, right = max(left, 0), min(right, self._N)
+        if left >= right:
+            return self.ide_ele
+
+        right -= 1
+        if left == right:
+            return self.A[left]
+
+        # leftとrightが初めて別のブロックに分かれる段
+        h = (left ^ right).bit_length() - 1
+        offset = h * self._N
+        return self.segfunc(self.table[offset + left], self.table[offset + right])
+
+    def query_many(self, lefts: Sequence[int], rights: Sequence[int]) -> list[T]:
+        """各iについて, segfunc(A[lefts[i]..rights[i]))をまとめて計算する
+
+        Args:
+            lefts (Sequence[int]): 下限indexの列. 0-indexed. numpy配列も可.
+            rights (Sequence[int]): 上限indexの列. 0-indexed. numpy配列も可.
+
+        Returns:
+            list[T] | array: 各クエリの結果. typecodeを指定した場合はarray.
+
+        TimeComplexity:
+            O(Q)
+
+        Notes:
+            numpy & typecodeあり & segfuncがnumpyのufuncに対応する場合, まとめてベクトル演算する.
+            空区間のクエリはide_eleになる (queryと同じ).
+        """
+        name = _UFUNC_NAMES.get(self.segfunc)
+        if np is None or self.typecode is None or name is None:
+            result = list(map(self.query, lefts, rights))
+            return result if self.typecode is None else array(self.typecode, result)
+
+        A = np.frombuffer(self.A, dtype=self.typecode)
+        table = np.frombuffer(self.table, dtype=self.typecode)
+        left = np.clip(np.asarray(lefts, dtype=np.int64), 0, self._N)
+        right = np.clip(np.asarray(rights, dtype=np.int64), 0, self._N)
+        nonempty = left < right
+        result = _init_result(nonempty, self.ide_ele, self.typecode)
+        left, right = left[nonempty], right[nonempty] - 1
+
+        # h = (left ^ right).bit_length() - 1. 長さ1の区間はh = -1.
+        x = left ^ right
+        h = np.full(x.shape, -1, dtype=np.int64)
+        for b in range(self.LOG + 1):
+            h += (x >> b) > 0
+
+        single = h < 0
+        offset = np.maximum(h, 0) * self._N
+        value = getattr(np, name)(table[offset + left], table[offset + right])
+        value[single] = A[left[single]]
+        result[nonempty] = value
+        return array(self.typecode, result.tobytes())
@@ -1,4 +1,4 @@
-from src.DataStructures.BinarySearchTree.SplayTree.bottom_up_splay_tree import SplayTree
+from src.DataStructures.BinarySearchTree.SplayTree.bottom_up_splay_tree import Node, SplayTree
 
 
 def test_search():
@@ -470,3 +470,8 @@ def test_AOJ_heap_test_case():
     tree.delete(99)
 
     assert [node.key for node in tree.inorder()] == [1, 3, 6, 7, 14, 21, 42, 80, 86]
+
+
+def test_node_slots():
+    # ノードは__dict__を持たない
+    assert not hasattr(Node(1), "__dict__")
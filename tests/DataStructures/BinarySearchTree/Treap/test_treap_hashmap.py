@@ -1,4 +1,4 @@
-from src.DataStructures.BinarySearchTree.Treap.treap_hash_map import TreapHashMap
+from src.DataStructures.BinarySearchTree.Treap.treap_hash_map import TreapHashMap, TreapNode
 
 
 def test_library_checker_case():
@@ -14,3 +14,8 @@ def test_library_checker_case():
 
     tree[2] = 1
     assert tree[2] == 1
+
+
+def test_node_slots():
+    # ノードは__dict__を持たない (型引数を付けて生成した場合も)
+    assert not hasattr(TreapNode[int, int](1, 2), "__dict__")
@@ -1,4 +1,4 @@
-from src.DataStructures.BinarySearchTree.SearchTree.binary_search_tree import BinarySearchTree
+from src.DataStructures.BinarySearchTree.SearchTree.binary_search_tree import BinarySearchTree, Node
 
 
 def test_search():
@@ -600,3 +600,8 @@ def test_AOJ_binary_search_tree_3_case3():
     tree.delete(8)
     assert [node.key for node in tree.inorder()] == [-1, 17, 18, 27, 28, 30, 55, 60, 63, 88]
     assert [node.key for node in tree.preorder()] == [30, 17, -1, 27, 18, 28, 88, 60, 55, 63]
+
+
+def test_node_slots():
+    # ノードは__dict__を持たない
+    assert not hasattr(Node(1), "__dict__")
@@ -0,0 +1,54 @@
+from itertools import combinations
+from random import Random
+
+from src.DataStructures.BinaryTree.compressed_wavelet_matrix import CompressedWaveletMatrix
+
+
+def test_negative_and_large_values():
+    rng = Random(0)
+    T = [rng.choice([-(10**18), -5, -1, 0, 3, 10**18, 2**63 + 1]) for _ in range(20)]
+    wm = CompressedWaveletMatrix[int](T)
+
+    assert wm.wavelet_matrix.bit_size == 3
+    assert [wm[i] for i in range(len(T))] == T
+    queries = [-(10**19), -(10**18), -3, 0, 1, 3, 10**18, 2**64]
+    for left, right in combinations(range(len(T) + 1), r=2):
+        S = sorted(T[left:right])
+        for k in range(1, right - left + 1):
+            assert wm.quantile(left, right, k) == S[k - 1]
+            assert wm.kth_largest(left, right, k) == S[-k]
+        for x in queries:
+            assert wm.rank_range(x, left, right) == S.count(x)
+            assert wm.prev_value(left, right, x) == max((s for s in S if s < x), default=None)
+            assert wm.next_value(left, right, x) == min((s for s in S if x <= s), default=None)
+        for lower, upper in combinations(queries, r=2):
+            assert wm.range_freq(left, right, lower, upper) == sum(lower <= s < upper for s in S)
+
+
+def test_strings():
+    T = ["pear", "apple", "fig", "apple", "kiwi", "fig", "apple"]
+    wm = CompressedWaveletMatrix[str](T)
+
+    assert wm.access(0) == "pear"
+    assert wm.rank("apple", 4) == 2
+    assert wm.rank("banana", 7) == 0
+    assert wm.select("fig", 2) == 5
+    assert wm.select("banana", 1) is None
+    assert wm.kth_smallest(1, 6, 3) == "fig"
+    assert wm.topk(0, 7, 2) == [("apple", 3), ("fig", 2)]
+    assert wm.range_freq(0, 7, "b", "l") == 3
+    assert wm.prev_value(0, 7, "g") == "fig"
+    assert wm.next_value(0, 4, "g") == "pear"
+
+
+def test_floats_and_single_value():
+    wm = CompressedWaveletMatrix[float]([0.5, -1.5, 0.5, 2.25])
+    assert wm.quantile(0, 4, 1) == -1.5
+    assert wm.range_freq(0, 4, -1.0, 1.0) == 2
+
+    wm = CompressedWaveletMatrix[int]([-7, -7, -7])
+    assert len(wm) == 3
+    assert wm.rank_range(-7, 0, 3) == 3
+    assert wm.select(-7, 3) == 2
+    assert wm.select(-7, 4) is None
+    assert wm.quantile(0, 3, 2) == -7
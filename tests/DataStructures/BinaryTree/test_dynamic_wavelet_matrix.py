@@ -0,0 +1,75 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.BitVector import dynamic_bit_vector
+from src.DataStructures.BinaryTree.dynamic_wavelet_matrix import DynamicWaveletMatrix
+
+
+def test_insert_erase_set():
+    T = [5, 4, 5, 5, 2, 1]
+    wm = DynamicWaveletMatrix(T, bit_size=4)
+
+    wm.insert(0, 9)
+    wm.insert(7, 0)
+    wm.insert(3, 15)
+    T = [9, 5, 4, 15, 5, 5, 2, 1, 0]
+    assert len(wm) == len(T)
+    assert [wm[i] for i in range(len(T))] == T
+
+    assert wm.erase(3) == 15
+    wm[0] = 3
+    T = [3, 5, 4, 5, 5, 2, 1, 0]
+    assert [wm[i] for i in range(len(T))] == T
+    assert wm.quantile(0, 8, 4) == 3
+    assert wm.rank_range(5, 1, 5) == 3
+    assert wm.range_freq(0, 8, 2, 5) == 3
+    assert wm.select(5, 3) == 4
+
+    with pytest.raises(ValueError):
+        wm.insert(0, 16)
+    with pytest.raises(ValueError):
+        DynamicWaveletMatrix([16], bit_size=4)
+
+
+def test_random(monkeypatch):
+    monkeypatch.setattr(dynamic_bit_vector, "BLOCK_SIZE", 4)
+
+    rng = Random(0)
+    T = []
+    wm = DynamicWaveletMatrix(bit_size=5)
+    for _ in range(300):
+        t = rng.randrange(3)
+        if t == 0 or not T:
+            i, x = rng.randint(0, len(T)), rng.randrange(32)
+            T.insert(i, x)
+            wm.insert(i, x)
+        elif t == 1:
+            i = rng.randrange(len(T))
+            assert wm.erase(i) == T.pop(i)
+        else:
+            i, x = rng.randrange(len(T)), rng.randrange(32)
+            T[i] = x
+            wm.set(i, x)
+
+        if len(T) < 2:
+            continue
+        left, right = sorted(rng.sample(range(len(T) + 1), 2))
+        S = sorted(T[left:right])
+        k = rng.randint(1, right - left)
+        x = rng.randrange(32)
+        assert wm.quantile(left, right, k) == S[k - 1]
+        assert wm.rank_range(x, left, right) == S.count(x)
+        assert wm.range_freq(left, right, x, x + 5) == sum(x <= s < x + 5 for s in S)
+        assert wm.prev_value(left, right, x) == max((s for s in S if s < x), default=None)
+
+    assert [wm[i] for i in range(len(T))] == T
+
+
+def test_save_load(tmp_path):
+    wm = DynamicWaveletMatrix([5, 1, 4], bit_size=4)
+    wm.save(tmp_path / "wm.bin")
+    loaded = DynamicWaveletMatrix.load(tmp_path / "wm.bin")
+
+    loaded.insert(1, 15)
+    assert [loaded[i] for i in range(len(loaded))] == [5, 15, 1, 4]
@@ -0,0 +1,67 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.BinaryTree.rectangle_wavelet_matrix import (
+    PointAddRectangleSumWaveletMatrix,
+    RectangleSumWaveletMatrix,
+)
+from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc
+from src.DataStructures.BitVector.succinct_bit_vector import SuccinctBitVector
+
+
+def brute_force(points, weights, x1, y1, x2, y2):
+    inside = [w for (x, y), w in zip(points, weights) if x1 <= x < x2 and y1 <= y < y2]
+    return len(inside), sum(inside)
+
+
+@pytest.mark.parametrize("bit_vector", [BitVectorAcc, SuccinctBitVector])
+def test_rectangle_sum(bit_vector):
+    rng = Random(0)
+    points = [(rng.randrange(-10, 10), rng.randrange(-10**9, 10**9, 10**8)) for _ in range(60)]
+    weights = [rng.randrange(-10**12, 10**12) for _ in range(60)]
+    wm = RectangleSumWaveletMatrix(points, weights, bit_vector)
+
+    for _ in range(500):
+        x1, x2 = rng.randrange(-12, 12), rng.randrange(-12, 12)
+        y1, y2 = rng.randrange(-2 * 10**9, 2 * 10**9), rng.randrange(-2 * 10**9, 2 * 10**9)
+        count, total = brute_force(points, weights, x1, y1, x2, y2)
+        assert wm.count_rectangle(x1, y1, x2, y2) == count
+        assert wm.sum_rectangle(x1, y1, x2, y2) == total
+
+
+def test_rectangle_sum_small():
+    # 重みを省略した場合は個数と同じ
+    wm = RectangleSumWaveletMatrix([(0, 0), (0, 0), (1, 5), (3, 2)])
+    assert wm.sum_rectangle(0, 0, 4, 6) == 4
+    assert wm.sum_rectangle(0, 0, 1, 1) == 2
+    assert wm.count_rectangle(1, 1, 4, 5) == 1
+    assert wm.sum_rectangle(4, 0, 0, 6) == 0
+
+    wm = RectangleSumWaveletMatrix([])
+    assert wm.count_rectangle(0, 0, 1, 1) == 0
+    assert wm.sum_rectangle(0, 0, 1, 1) == 0
+
+
+def test_point_add_rectangle_sum():
+    rng = Random(1)
+    points = [(rng.randrange(20), rng.randrange(20)) for _ in range(50)]
+    weights = [rng.randrange(100) for _ in range(50)]
+    wm = PointAddRectangleSumWaveletMatrix(points, weights)
+
+    for _ in range(300):
+        if rng.randrange(2):
+            i = rng.randrange(len(points))
+            w = rng.randrange(-100, 100)
+            wm.add(*points[i], w)
+            # 同じ座標の点が複数ある場合も, 和は変わらない
+            weights[i] += w
+        else:
+            x1, x2 = sorted((rng.randrange(21), rng.randrange(21)))
+            y1, y2 = sorted((rng.randrange(21), rng.randrange(21)))
+            count, total = brute_force(points, weights, x1, y1, x2, y2)
+            assert wm.count_rectangle(x1, y1, x2, y2) == count
+            assert wm.sum_rectangle(x1, y1, x2, y2) == total
+
+    with pytest.raises(KeyError):
+        wm.add(-1, 0, 1)
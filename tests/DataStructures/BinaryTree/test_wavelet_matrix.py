@@ -1,7 +1,15 @@
 from itertools import combinations
 from collections import Counter
+from random import Random
+
+import pytest
+
+from src.DataStructures.BinaryTree import wavelet_matrix
 
 from src.DataStructures.BinaryTree.wavelet_matrix import WaveletMatrix
+from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc
+from src.DataStructures.BitVector.dynamic_bit_vector import DynamicBitVector
+from src.DataStructures.BitVector.succinct_bit_vector import SuccinctBitVector
 
 
 def test_access():
@@ -255,7 +263,7 @@ def test_topk():
 
 def test_sum():
     T = [5, 4, 5, 5, 2, 1, 5, 6, 1, 3, 5, 0]
-    wm = WaveletMatrix(T)
+    wm = WaveletMatrix(T, with_sum=True)
     assert wm.sum(1, 10) == 32
 
     # 変な範囲を指定したケース
@@ -404,3 +412,159 @@ def test_next_value():
                 assert actual == expected
             else:
                 assert actual is None
+
+
+def test_succinct_bit_vector():
+    T = [5, 4, 5, 5, 2, 1, 5, 6, 1, 3, 5, 0]
+    wm = WaveletMatrix(T)
+    succinct_wm = WaveletMatrix(T, bit_vector=SuccinctBitVector)
+
+    assert [succinct_wm[i] for i in range(len(T))] == T
+    for left, right in combinations(range(len(T) + 1), r=2):
+        for x in range(8):
+            assert succinct_wm.rank_range(x, left, right) == wm.rank_range(x, left, right)
+            assert succinct_wm.range_freq(left, right, x, x + 3) == wm.range_freq(left, right, x, x + 3)
+        for k in range(1, right - left + 1):
+            assert succinct_wm.quantile(left, right, k) == wm.quantile(left, right, k)
+    for x in range(8):
+        for k in range(1, len(T) + 1):
+            assert succinct_wm.select(x, k) == wm.select(x, k)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("bit_vector", [BitVectorAcc, SuccinctBitVector])
+def test_build(monkeypatch, use_numpy, bit_vector):
+    if not use_numpy:
+        monkeypatch.setattr(wavelet_matrix, "np", None)
+
+    rng = Random(0)
+    T = [rng.randrange(1 << 20) for _ in range(300)]
+    wm = WaveletMatrix(T, bit_vector=bit_vector)
+
+    assert wm.bit_size == 20
+    assert [wm[i] for i in range(len(T))] == T
+    assert [wm.quantile(0, len(T), k) for k in range(1, len(T) + 1)] == sorted(T)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_range_sum(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(wavelet_matrix, "np", None)
+
+    T = [5, 4, 5, 5, 2, 1, 5, 6, 1, 3, 5, 0]
+    wm = WaveletMatrix(T, with_sum=True)
+    without_sum = WaveletMatrix(T)
+
+    for left, right in combinations(range(len(T) + 1), r=2):
+        assert wm.sum(left, right) == sum(T[left:right])
+        assert without_sum.sum(left, right) == sum(T[left:right])
+        for upper in range(10):
+            assert wm.range_sum_lower(left, right, upper) == sum(t for t in T[left:right] if t < upper)
+            for lower in range(upper):
+                assert wm.range_sum(left, right, lower, upper) == sum(
+                    t for t in T[left:right] if lower <= t < upper
+                )
+
+    with pytest.raises(ValueError):
+        without_sum.range_sum_lower(0, len(T), 3)
+
+
+def test_range_sum_large_values():
+    rng = Random(2)
+    T = [rng.randrange(1 << 70) for _ in range(50)]
+    wm = WaveletMatrix(T, with_sum=True)
+
+    assert wm.sum(3, 40) == sum(T[3:40])
+    upper = sorted(T)[25]
+    assert wm.range_sum_lower(0, 50, upper) == sum(t for t in T if t < upper)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("bit_vector", [BitVectorAcc, SuccinctBitVector, DynamicBitVector])
+def test_quantile_many(monkeypatch, use_numpy, bit_vector):
+    if not use_numpy:
+        monkeypatch.setattr(wavelet_matrix, "np", None)
+
+    T = [5, 4, 5, 5, 2, 1, 5, 6, 1, 3, 5, 0]
+    wm = WaveletMatrix(T, bit_vector=bit_vector)
+
+    lefts, rights, ks = [], [], []
+    for left, right in combinations(range(-1, len(T) + 2), r=2):
+        for k in range(right - left + 2):
+            lefts.append(left)
+            rights.append(right)
+            ks.append(k)
+    # 空の範囲
+    lefts.append(5)
+    rights.append(3)
+    ks.append(1)
+
+    expected = []
+    for left, right, k in zip(lefts, rights, ks):
+        S = sorted(T[max(left, 0): max(right, 0)])
+        expected.append(S[k - 1] if 1 <= k <= len(S) else None)
+    assert wm.quantile_many(lefts, rights, ks) == expected
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("bit_vector", [BitVectorAcc, SuccinctBitVector, DynamicBitVector])
+def test_range_freq_many(monkeypatch, use_numpy, bit_vector):
+    if not use_numpy:
+        monkeypatch.setattr(wavelet_matrix, "np", None)
+
+    rng = Random(3)
+    T = [rng.randrange(100) for _ in range(80)]
+    wm = WaveletMatrix(T, bit_vector=bit_vector)
+
+    Q = 500
+    lefts = [rng.randrange(-5, 85) for _ in range(Q)]
+    rights = [rng.randrange(-5, 85) for _ in range(Q)]
+    lowers = [rng.randrange(-10, 140) for _ in range(Q)]
+    uppers = [rng.randrange(-10, 140) for _ in range(Q)]
+    # 値の上限が大きいクエリ
+    lefts.append(0)
+    rights.append(80)
+    lowers.append(-(1 << 70))
+    uppers.append(1 << 70)
+
+    assert wm.range_freq_many(lefts, rights, lowers, uppers) == [
+        sum(lower <= t < upper for t in T[max(left, 0): max(right, 0)])
+        for left, right, lower, upper in zip(lefts, rights, lowers, uppers)
+    ]
+    assert wm.quantile_many([], [], []) == []
+    assert wm.range_freq_many([], [], [], []) == []
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("bit_vector", [BitVectorAcc, SuccinctBitVector])
+def test_save_load(tmp_path, mmap, bit_vector):
+    rng = Random(4)
+    T = [rng.randrange(1000) for _ in range(500)]
+    wm = WaveletMatrix(T, bit_vector=bit_vector, with_sum=True)
+    wm.save(tmp_path / "wm.bin")
+    loaded = WaveletMatrix.load(tmp_path / "wm.bin", mmap=mmap)
+
+    assert loaded.bit_vector is bit_vector
+    assert len(loaded) == len(T)
+    assert [loaded[i] for i in range(len(T))] == T
+    for _ in range(100):
+        left, right = sorted((rng.randrange(len(T) + 1), rng.randrange(len(T) + 1)))
+        assert loaded.range_freq(left, right, 100, 700) == wm.range_freq(left, right, 100, 700)
+        assert loaded.range_sum(left, right, 100, 700) == wm.range_sum(left, right, 100, 700)
+        assert loaded.select(T[left], 1) == wm.select(T[left], 1)
+    assert loaded.quantile_many([0, 10], [500, 20], [250, 5]) == wm.quantile_many([0, 10], [500, 20], [250, 5])
+
+    # 読み込んだものを保存し直せる
+    loaded.save(tmp_path / "wm2.bin")
+    assert (tmp_path / "wm.bin").read_bytes() == (tmp_path / "wm2.bin").read_bytes()
+
+
+def test_save_errors(tmp_path):
+    WaveletMatrix([3, 1, 2]).save(tmp_path / "wm.bin")
+    with pytest.raises(ValueError):
+        SuccinctBitVector.load(tmp_path / "wm.bin")
+
+    with pytest.raises(ValueError):
+        WaveletMatrix([1 << 70, 1], with_sum=True).save(tmp_path / "large.bin")
+    WaveletMatrix([1 << 70, 1]).save(tmp_path / "large.bin")
+    assert WaveletMatrix.load(tmp_path / "large.bin").quantile(0, 2, 2) == 1 << 70
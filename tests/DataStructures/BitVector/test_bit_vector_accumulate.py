@@ -1,3 +1,8 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.BitVector import bit_vector_accumulate
 from src.DataStructures.BitVector.bit_vector_accumulate import BitVectorAcc as BitVector
 
 
@@ -73,3 +78,29 @@ def test_select1():
     assert bv.select1(4) == 6
     assert bv.select1(5) is None
     assert bv.select1(6) is None
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("N", [1, 100])
+def test_rank1_many(monkeypatch, use_numpy, N):
+    if not use_numpy:
+        monkeypatch.setattr(bit_vector_accumulate, "np", None)
+
+    rng = Random(N)
+    B = [rng.randrange(2) for _ in range(N)]
+    bv = BitVector(B)
+    indices = list(range(-2, N + 3))
+    assert list(bv.rank1_many(indices)) == [bv.rank1(i) for i in indices]
+
+
+@pytest.mark.parametrize("p", [0.0, 0.01, 0.5, 0.99, 1.0])
+def test_select_sampled(p):
+    # サンプルの境界をまたぐ長さで, 0, 1が偏っている場合も含めて確認する
+    rng = Random(0)
+    B = [int(rng.random() < p) for _ in range(1000)]
+    bv = BitVector(B)
+
+    ones = [i for i, b in enumerate(B) if b == 1]
+    zeros = [i for i, b in enumerate(B) if b == 0]
+    assert [bv.select1(k) for k in range(1, len(ones) + 2)] == ones + [None]
+    assert [bv.select0(k) for k in range(1, len(zeros) + 2)] == zeros + [None]
@@ -0,0 +1,58 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.BitVector import dynamic_bit_vector
+from src.DataStructures.BitVector.dynamic_bit_vector import DynamicBitVector
+
+
+def test_rank_select():
+    B = [1, 0, 0, 1, 1, 0, 1]
+    bv = DynamicBitVector(B)
+
+    assert len(bv) == 7
+    assert [bv[i] for i in range(7)] == B
+    assert [bv.rank1(i) for i in range(-1, 9)] == [0, 0, 1, 1, 1, 2, 3, 3, 4, 4]
+    assert [bv.rank0(i) for i in range(-1, 9)] == [0, 0, 0, 1, 2, 2, 2, 3, 3, 3]
+    assert [bv.select1(k) for k in range(6)] == [None, 0, 3, 4, 6, None]
+    assert [bv.select0(k) for k in range(5)] == [None, 1, 2, 5, None]
+
+    with pytest.raises(IndexError):
+        bv.insert(8, 1)
+    with pytest.raises(IndexError):
+        bv.erase(7)
+
+
+def test_insert_erase_set_random(monkeypatch):
+    # ブロックの分割・削除が起きるように, ブロックを小さくする
+    monkeypatch.setattr(dynamic_bit_vector, "BLOCK_SIZE", 4)
+
+    rng = Random(0)
+    B = []
+    bv = DynamicBitVector()
+    for _ in range(2000):
+        t = rng.randrange(4)
+        if t <= 1 or not B:
+            i, bit = rng.randint(0, len(B)), rng.randrange(2)
+            B.insert(i, bit)
+            bv.insert(i, bit)
+        elif t == 2:
+            i = rng.randrange(len(B))
+            assert bv.erase(i) == B.pop(i)
+        else:
+            i, bit = rng.randrange(len(B)), rng.randrange(2)
+            B[i] = bit
+            bv.set(i, bit)
+
+        assert len(bv) == len(B)
+        i = rng.randint(0, len(B))
+        assert bv.rank1(i) == sum(B[:i])
+        assert bv.rank0(i) == i - sum(B[:i])
+        if B:
+            j = rng.randrange(len(B))
+            assert bv[j] == B[j]
+            bit = B[j]
+            k = B[: j + 1].count(bit)
+            assert (bv.select1(k) if bit else bv.select0(k)) == j
+
+    assert [bv[i] for i in range(len(B))] == B
@@ -0,0 +1,70 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.BitVector import succinct_bit_vector
+from src.DataStructures.BitVector.succinct_bit_vector import SuccinctBitVector
+
+
+def test_rank_select():
+    B = [1, 0, 0, 1, 1, 0, 1]
+    bv = SuccinctBitVector(B)
+
+    assert len(bv) == 7
+    assert [bv[i] for i in range(7)] == B
+    assert [bv.rank1(i) for i in range(-1, 9)] == [0, 0, 1, 1, 1, 2, 3, 3, 4, 4]
+    assert [bv.rank0(i) for i in range(-1, 9)] == [0, 0, 0, 1, 2, 2, 2, 3, 3, 3]
+    assert bv.rank0_all() == 3
+    assert bv.rank1_all() == 4
+    assert [bv.select1(k) for k in range(6)] == [None, 0, 3, 4, 6, None]
+    assert [bv.select0(k) for k in range(5)] == [None, 1, 2, 5, None]
+
+    with pytest.raises(IndexError):
+        bv[7]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("p", [0.01, 0.5, 0.99])
+@pytest.mark.parametrize("N", [1, 512, 5000])
+def test_rank_select_random(monkeypatch, use_numpy: bool, p: float, N: int):
+    if not use_numpy:
+        monkeypatch.setattr(succinct_bit_vector, "np", None)
+
+    rng = Random(N)
+    B = [int(rng.random() < p) for _ in range(N)]
+    bv = SuccinctBitVector(B)
+
+    ones = [i for i, b in enumerate(B) if b]
+    zeros = [i for i, b in enumerate(B) if not b]
+    acc = [0]
+    for b in B:
+        acc.append(acc[-1] + b)
+    assert [bv.rank1(i) for i in range(N + 1)] == acc
+    assert [bv.rank0(i) for i in range(N + 1)] == [i - acc[i] for i in range(N + 1)]
+    assert list(bv.rank1_many(range(-2, N + 3))) == [0, 0] + acc + [acc[-1]] * 2
+    assert [bv.select1(k) for k in range(1, len(ones) + 1)] == ones
+    assert [bv.select0(k) for k in range(1, len(zeros) + 1)] == zeros
+
+
+def test_from_words():
+    rng = Random(1)
+    B = [rng.randrange(2) for _ in range(1000)]
+    bv = SuccinctBitVector(B)
+    bv2 = SuccinctBitVector.from_words(bv.words, len(B))
+
+    assert [bv2[i] for i in range(1000)] == B
+    assert [bv2.rank1(i) for i in range(1001)] == [bv.rank1(i) for i in range(1001)]
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load(tmp_path, mmap):
+    rng = Random(5)
+    B = [rng.randrange(2) for _ in range(3000)]
+    SuccinctBitVector(B).save(tmp_path / "bv.bin")
+    bv = SuccinctBitVector.load(tmp_path / "bv.bin", mmap=mmap)
+
+    assert len(bv) == len(B)
+    assert [bv[i] for i in range(len(B))] == B
+    assert [bv.rank1(i) for i in range(len(B) + 1)] == [sum(B[:i]) for i in range(len(B) + 1)]
+    ones = [i for i, b in enumerate(B) if b]
+    assert [bv.select1(k) for k in range(1, len(ones) + 1)] == ones
@@ -1,5 +1,8 @@
-from itertools import combinations
+from itertools import combinations, accumulate
 
+import pytest
+
+from src.DataStructures.RangeTree import binary_indexed_tree
 from src.DataStructures.RangeTree.binary_indexed_tree import BinaryIndexedTree
 
 
@@ -132,3 +135,52 @@ def test_lower_bound():
 
     assert bit.lower_bound(34) is None
     assert bit.lower_bound(10000) is None
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_query_many_add_many(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(binary_indexed_tree, "np", None)
+
+    A = [1, 5, 2, 3, 4, 5, 6, 7, 4, 2]
+    bit = BinaryIndexedTree(A)
+
+    # 範囲外のindexは無視される
+    indices = [0, 3, 3, 9, -1, 10, 5]
+    values = [2, -1, 4, 7, 100, 100, 1]
+    bit.add_many(indices, values)
+    for i, x in zip(indices, values):
+        if 0 <= i < len(A):
+            A[i] += x
+    assert [bit[i] for i in range(len(A))] == A
+
+    lefts, rights = [-1, 3, 5], [1000, 3, 2]
+    for i, j in combinations(range(len(A) + 1), r=2):
+        lefts.append(i)
+        rights.append(j)
+
+    result = bit.query_many(lefts, rights)
+    assert list(result) == [bit.sum_range(i, j) for i, j in zip(lefts, rights)]
+    assert result[0] == sum(A)
+    assert result[1] == 0
+    assert result[2] == 0
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_build(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(binary_indexed_tree, "np", None)
+
+    A = [1, 5, 2, 3, 7, 5, 6, 4, -3, 0, 8]
+    bit = BinaryIndexedTree(A)
+
+    # data[i] = sum(A[i - lsb(i)..i)) (1-indexed)
+    expected = [0] + [sum(A[i - (i & -i): i]) for i in range(1, len(A) + 1)]
+    assert list(bit.data) == expected
+
+    bit = BinaryIndexedTree.from_prefix_sums(list(accumulate(A)))
+    assert list(bit.data) == expected
+    for i in range(len(A) + 1):
+        assert bit.sum(i) == sum(A[:i])
+
+    assert BinaryIndexedTree.from_prefix_sums([]).sum(10) == 0
@@ -0,0 +1,85 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree.binary_indexed_tree_2d import (
+    BinaryIndexedTree2D,
+    OfflineBinaryIndexedTree2D,
+)
+
+
+def test_dense_sum_rectangle():
+    A = [
+        [1, 2, 3, 4],
+        [5, 6, 7, 8],
+        [9, 10, 11, 12],
+    ]
+    bit = BinaryIndexedTree2D(A)
+
+    assert bit.sum(3, 4) == sum(map(sum, A))
+    assert bit.sum(2, 2) == 1 + 2 + 5 + 6
+    assert bit.sum(0, 4) == 0
+    assert bit.sum(100, 100) == sum(map(sum, A))
+    assert bit.sum_rectangle(1, 1, 3, 3) == 6 + 7 + 10 + 11
+    assert bit.sum_rectangle(1, 1, 1, 3) == 0
+
+    for x in range(3):
+        for y in range(4):
+            assert bit.get(x, y) == A[x][y]
+
+    with pytest.raises(IndexError):
+        bit.get(3, 0)
+
+
+def test_dense_add():
+    rng = Random(0)
+    H, W = 7, 5
+    A = [[rng.randrange(10) for _ in range(W)] for _ in range(H)]
+    bit = BinaryIndexedTree2D(A)
+
+    for _ in range(100):
+        x, y, v = rng.randrange(H), rng.randrange(W), rng.randrange(-10, 10)
+        A[x][y] += v
+        bit.add(x, y, v)
+
+        x1, x2 = sorted((rng.randrange(H + 1), rng.randrange(H + 1)))
+        y1, y2 = sorted((rng.randrange(W + 1), rng.randrange(W + 1)))
+        expected = sum(A[i][j] for i in range(x1, x2) for j in range(y1, y2))
+        assert bit.sum_rectangle(x1, y1, x2, y2) == expected
+
+
+def test_offline_count():
+    points = [(-5, 3), (10**12, -(10**12)), (3, 3), (3, 4), (0, 0), (3, 3)]
+    bit = OfflineBinaryIndexedTree2D(points, [1] * len(points))
+
+    assert bit.sum_rectangle(-(10**18), -(10**18), 10**18, 10**18) == 6
+    assert bit.sum_rectangle(3, 3, 4, 4) == 2
+    assert bit.sum_rectangle(-5, 0, 4, 4) == 4
+    assert bit.sum(0, 10) == 1
+    assert bit.sum(10**12 + 1, -(10**12) + 1) == 1
+
+    bit.add(3, 4, 10)
+    assert bit.sum_rectangle(3, 4, 4, 5) == 11
+
+    with pytest.raises(KeyError):
+        bit.add(3, 5, 1)
+    with pytest.raises(KeyError):
+        bit.add(1, 3, 1)
+
+
+def test_offline_random():
+    rng = Random(1)
+    points = [(rng.randrange(-50, 50), rng.randrange(-50, 50)) for _ in range(200)]
+    weights = [rng.randrange(100) for _ in range(200)]
+    bit = OfflineBinaryIndexedTree2D(points, weights)
+
+    for _ in range(100):
+        k = rng.randrange(len(points))
+        v = rng.randrange(-10, 10)
+        weights[k] += v
+        bit.add(*points[k], v)
+
+        x1, x2 = sorted((rng.randrange(-60, 60), rng.randrange(-60, 60)))
+        y1, y2 = sorted((rng.randrange(-60, 60), rng.randrange(-60, 60)))
+        expected = sum(w for (x, y), w in zip(points, weights) if x1 <= x < x2 and y1 <= y < y2)
+        assert bit.sum_rectangle(x1, y1, x2, y2) == expected
@@ -0,0 +1,91 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree.dynamic_segment_tree import DynamicSegmentTree
+
+
+def test_point_update_huge_range():
+    seg = DynamicSegmentTree[int, None](10**18, lambda x, y: x + y, 0, typecode="q")
+
+    seg.update(0, 5)
+    seg.update(10**18 - 1, 7)
+    seg.add(123456789012345, 3)
+    seg[10**17] = 11
+
+    assert seg.query(0, 10**18) == 26
+    assert seg.query(1, 10**18 - 1) == 14
+    assert seg.query(10**17, 10**17 + 1) == 11
+    assert seg.query(-100, 10**20) == 26
+    assert seg.get(123456789012345) == 3
+    assert seg[5] == 0
+
+    # ノードは更新した経路上にのみ作られる
+    assert len(seg) <= 4 * 60 + 1
+
+    with pytest.raises(IndexError):
+        seg.get(10**18)
+    with pytest.raises(ValueError):
+        seg.range_update(0, 10, 1)
+
+
+def test_non_commutative():
+    seg = DynamicSegmentTree[str, None](10**9, lambda x, y: x + y, "")
+    seg.update(10, "a")
+    seg.update(5, "b")
+    seg.update(10**9 - 1, "c")
+
+    assert seg.query(0, 10**9) == "bac"
+    assert seg.query(6, 10**9) == "ac"
+
+
+def test_range_add_range_sum_random():
+    rng = Random(0)
+    size = 50
+    A = [0] * size
+    seg = DynamicSegmentTree[int, int](
+        size,
+        lambda x, y: x + y,
+        0,
+        mapping=lambda f, x, length: x + f * length,
+        composition=lambda f, g: f + g,
+        id_=0,
+    )
+
+    for _ in range(500):
+        left, right = sorted(rng.sample(range(size + 1), 2))
+        t = rng.randrange(3)
+        if t == 0:
+            x = rng.randrange(-10, 10)
+            seg.range_update(left, right, x)
+            for i in range(left, right):
+                A[i] += x
+        elif t == 1:
+            i, x = rng.randrange(size), rng.randrange(-10, 10)
+            seg.update(i, x)
+            A[i] = x
+        else:
+            assert seg.query(left, right) == sum(A[left:right])
+
+    assert [seg.get(i) for i in range(size)] == A
+
+
+def test_range_update_range_min_huge():
+    INF = 10**18
+    seg = DynamicSegmentTree[int, int](
+        10**18,
+        min,
+        INF,
+        mapping=lambda f, x, length: f if f is not None else x,
+        composition=lambda f, g: f if f is not None else g,
+        id_=None,
+    )
+
+    seg.range_update(10**10, 10**15, 3)
+    seg.range_update(10**12, 10**13, 1)
+    assert seg.query(0, 10**10) == INF
+    assert seg.query(0, 10**10 + 1) == 3
+    assert seg.query(10**13, 10**18) == 3
+    assert seg.query(10**13 - 1, 10**18) == 1
+    assert seg.get(10**12) == 1
+    assert seg.get(10**15) == INF
@@ -1,4 +1,11 @@
-from src.DataStructures.RangeTree.lazy_segment_tree import RangeMinimumRangeAdd
+from random import Random
+
+from src.DataStructures.RangeTree.lazy_segment_tree import (
+    RangeMinimumRangeAdd,
+    RangeSumRangeAdd,
+    RangeSumRangeAffine,
+)
+from src.DataStructures.RangeTree.lazy_segment_tree_fast import FastLazySegmentTree
 
 
 def test_propagated_segment():
@@ -19,3 +26,51 @@ def test_propagated_segment():
 
     propagated_segment = seg._propagated_segment(0, 7)
     assert propagated_segment == [1, 3, 7]
+
+
+def test_max_right_min_left():
+    rng = Random(0)
+    N = 13
+    A = [rng.randrange(10) for _ in range(N)]
+    seg = RangeSumRangeAdd(A)
+    fast = FastLazySegmentTree[int, int](
+        A, lambda x, y: x + y, 0, lambda f, x, length: x + f * length, lambda f, g: f + g, 0
+    )
+
+    for _ in range(30):
+        left, right = sorted(rng.sample(range(N + 1), 2))
+        x = rng.randrange(5)
+        seg.range_update(left, right, x)
+        fast.range_update(left, right, x)
+        for i in range(left, right):
+            A[i] += x
+
+        threshold = rng.randrange(sum(A) + 1)
+        pred = lambda x: x <= threshold  # noqa: E731
+        for left in range(N + 1):
+            expected = max(r for r in range(left, N + 1) if sum(A[left:r]) <= threshold)
+            assert seg.max_right(left, pred) == expected
+            assert fast.max_right(left, pred) == expected
+        for right in range(N + 1):
+            expected = min(left for left in range(right + 1) if sum(A[left:right]) <= threshold)
+            assert seg.min_left(right, pred) == expected
+            assert fast.min_left(right, pred) == expected
+
+
+def test_get_and_to_list():
+    rng = Random(1)
+    A = [rng.randint(-10, 10) for _ in range(13)]
+    seg = RangeSumRangeAffine(A)
+
+    for _ in range(100):
+        left, right = sorted(rng.sample(range(14), 2))
+        b, c = rng.randint(-2, 2), rng.randint(-5, 5)
+        seg.range_update(left, right, [b, c])
+        for i in range(left, right):
+            A[i] = b * A[i] + c
+
+        i = rng.randrange(13)
+        assert seg.get(i) == A[i]
+        assert seg.to_list() == A
+        # to_list後もSegment Treeとして使える
+        assert seg.query(left, right) == sum(A[left:right])
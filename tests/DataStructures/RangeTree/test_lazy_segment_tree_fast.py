@@ -0,0 +1,84 @@
+from random import Random
+
+from src.DataStructures.RangeTree.lazy_segment_tree import RangeSumRangeAffineWithMod
+from src.DataStructures.RangeTree.lazy_segment_tree_fast import (
+    FastLazySegmentTree,
+    AffineRangeSumLazySegmentTree,
+)
+
+
+def shift(s: str, f: int) -> str:
+    return "".join(chr((ord(c) - ord("a") + f) % 26 + ord("a")) for c in s)
+
+
+def test_non_commutative():
+    # 文字列の連結 (非可換) & 区間の文字をシフトする作用
+    A = list("abcdefghij")
+    seg = FastLazySegmentTree[str, int](
+        A,
+        lambda x, y: x + y,
+        "",
+        lambda f, x, length: shift(x, f),
+        lambda f, g: (f + g) % 26,
+        0,
+    )
+    assert seg.all_query() == "abcdefghij"
+    assert seg.query(2, 7) == "cdefg"
+
+    seg.range_update(1, 4, 1)
+    assert seg.query(0, 10) == "acdeefghij"
+    seg.range_update(3, 9, 25)
+    assert seg.query(0, 10) == "acdddefghj"
+    assert seg.query(2, 6) == "ddde"
+    assert [seg[i] for i in range(10)] == list("acdddefghj")
+
+    seg.update(0, "z")
+    assert seg.query(0, 3) == "zcd"
+    assert seg.query(4, 4) == ""
+
+
+def test_random_affine():
+    MOD = 998244353
+    rng = Random(0)
+    N = 37
+    A = [rng.randrange(MOD) for _ in range(N)]
+    seg = AffineRangeSumLazySegmentTree(A, MOD)
+    generic = FastLazySegmentTree[int, tuple[int, int]](
+        A,
+        lambda x, y: (x + y) % MOD,
+        0,
+        lambda f, x, length: (f[0] * x + f[1] * length) % MOD,
+        lambda f, g: ((f[0] * g[0]) % MOD, (f[0] * g[1] + f[1]) % MOD),
+        (1, 0),
+    )
+
+    for _ in range(500):
+        left, right = sorted(rng.sample(range(N + 1), 2))
+        if rng.random() < 0.5:
+            b, c = rng.randrange(MOD), rng.randrange(MOD)
+            for i in range(left, right):
+                A[i] = (b * A[i] + c) % MOD
+            seg.range_update(left, right, (b, c))
+            generic.range_update(left, right, (b, c))
+        else:
+            assert seg.query(left, right) == sum(A[left:right]) % MOD
+            assert generic.query(left, right) == sum(A[left:right]) % MOD
+
+    assert [seg.get(i) for i in range(N)] == A
+    assert [generic[i] for i in range(N)] == A
+
+
+def test_range_affine_range_sum_library_checker_fast():
+    A = [1, 2, 3, 4, 5]
+    seg = RangeSumRangeAffineWithMod(A, 998244353, fast=True)
+
+    assert seg.query(0, 5) == 15
+
+    seg.range_update(2, 4, [100, 101])
+    assert seg.query(0, 3) == 404
+
+    seg.range_update(1, 3, [102, 103])
+    assert seg.query(2, 5) == 41511
+
+    seg.range_update(2, 5, [104, 105])
+    assert seg.query(0, 5) == 4317767
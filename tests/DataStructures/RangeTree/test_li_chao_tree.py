@@ -0,0 +1,69 @@
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree.li_chao_tree import (
+    INF,
+    LiChaoTree,
+    DynamicLiChaoTree,
+    MonotoneConvexHullTrick,
+)
+
+
+def brute_force(segments: list[tuple[int, int, int, int]], x: int) -> int:
+    return min((a * x + b for a, b, left, right in segments if left <= x < right), default=INF)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_li_chao_tree_random(seed: int):
+    rng = Random(seed)
+    xs = rng.sample(range(-100, 100), 37)
+    tree = LiChaoTree(xs)
+    dynamic_tree = DynamicLiChaoTree(-100, 100)
+    segments = []
+
+    for x in xs:
+        assert tree.query(x) == INF
+    for _ in range(100):
+        a, b = rng.randint(-20, 20), rng.randint(-1000, 1000)
+        if rng.randrange(2):
+            tree.add_line(a, b)
+            dynamic_tree.add_line(a, b)
+            segments.append((a, b, -100, 100))
+        else:
+            left, right = sorted(rng.sample(range(-100, 101), 2))
+            tree.add_segment(a, b, left, right)
+            dynamic_tree.add_segment(a, b, left, right)
+            segments.append((a, b, left, right))
+
+        for x in rng.sample(xs, 5):
+            assert tree.query(x) == brute_force(segments, x)
+        for x in rng.sample(range(-100, 100), 5):
+            assert dynamic_tree.query(x) == brute_force(segments, x)
+
+
+def test_li_chao_tree_invalid_query():
+    tree = LiChaoTree([1, 3, 5])
+    with pytest.raises(KeyError):
+        tree.query(2)
+
+    dynamic_tree = DynamicLiChaoTree(0, 10)
+    with pytest.raises(IndexError):
+        dynamic_tree.query(10)
+
+
+def test_monotone_convex_hull_trick():
+    rng = Random(0)
+    lines = sorted(((rng.randint(-50, 50), rng.randint(-500, 500)) for _ in range(100)), reverse=True)
+    xs = sorted(rng.randint(-100, 100) for _ in range(100))
+
+    cht = MonotoneConvexHullTrick()
+    assert cht.query(-100) == INF
+    for i, (x, (a, b)) in enumerate(zip(xs, lines)):
+        cht.add_line(a, b)
+        assert cht.query(x) == min(a * x + b for a, b in lines[: i + 1])
+
+    with pytest.raises(ValueError):
+        cht.add_line(100, 0)
+    with pytest.raises(ValueError):
+        cht.query(xs[-1] - 1)
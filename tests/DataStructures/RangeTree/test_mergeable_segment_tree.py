@@ -0,0 +1,70 @@
+from collections import Counter
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree.mergeable_segment_tree import MergeableSegmentTree, subtree_distinct_counts
+
+
+def test_insert_count_kth():
+    seg = MergeableSegmentTree(10)
+    root = 0
+    for x in [3, 1, 4, 1, 5, 9, 2, 6]:
+        root = seg.insert(root, x)
+
+    assert seg.count_range(root, 0, 10) == 8
+    assert seg.count_range(root, 1, 2) == 2
+    assert seg.distinct_range(root, 0, 10) == 7
+    assert seg.distinct_range(root, 1, 5) == 4
+    assert [seg.kth(root, k) for k in range(8)] == [1, 1, 2, 3, 4, 5, 6, 9]
+
+    root = seg.insert(root, 1, -2)
+    assert seg.count_range(root, 0, 10) == 6
+    assert seg.distinct_range(root, 0, 10) == 6
+
+    with pytest.raises(IndexError):
+        seg.kth(root, 6)
+    with pytest.raises(IndexError):
+        seg.insert(root, 10)
+
+
+def test_merge_random():
+    rng = Random(0)
+    V = 50
+    seg = MergeableSegmentTree(V)
+    roots, multisets = [], []
+    for _ in range(20):
+        root, counter = 0, Counter()
+        for _ in range(rng.randint(0, 10)):
+            x = rng.randrange(V)
+            root = seg.insert(root, x)
+            counter[x] += 1
+        roots.append(root)
+        multisets.append(counter)
+
+    while len(roots) > 1:
+        i, j = rng.sample(range(len(roots)), 2)
+        roots[i] = seg.merge(roots[i], roots[j])
+        multisets[i] += multisets[j]
+        roots.pop(j)
+        multisets.pop(j)
+
+        for root, counter in zip(roots, multisets):
+            values = sorted(counter.elements())
+            assert [seg.kth(root, k) for k in range(len(values))] == values
+            left, right = sorted(rng.sample(range(V + 1), 2))
+            assert seg.count_range(root, left, right) == sum(left <= x < right for x in values)
+            assert seg.distinct_range(root, left, right) == sum(left <= x < right for x in counter)
+
+
+def test_subtree_distinct_counts():
+    #       0
+    #     /   \
+    #    1     2
+    #   / \     \
+    #  3   4     5
+    graph = [[1, 2], [0, 3, 4], [0, 5], [1], [1], [2]]
+    colors = [1, 2, 1, 2, 3, 1]
+
+    assert subtree_distinct_counts(graph, colors) == [3, 2, 1, 1, 1, 1]
+    assert subtree_distinct_counts(graph, colors, root=3) == [1, 3, 1, 3, 1, 1]
@@ -0,0 +1,54 @@
+from itertools import combinations
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree.multi_aggregate_segment_tree import MultiAggregateSegmentTree, INF
+
+
+def test_multi_aggregate_segment_tree_query():
+    A = [3, -5, 2, 11, 9, -6, 20]
+    seg = MultiAggregateSegmentTree[int](A)
+
+    assert seg.query(1, 5) == (17, -5, 11, 4)
+    assert seg.query(3, 3) == (0, INF, -INF, 0)
+    for left, right in combinations(range(len(A) + 1), 2):
+        B = A[left:right]
+        assert seg.query(left, right) == (sum(B), min(B), max(B), len(B))
+
+
+def test_multi_aggregate_segment_tree_update_random():
+    rng = Random(0)
+    A = [rng.randint(-100, 100) for _ in range(50)]
+    seg = MultiAggregateSegmentTree[int](A)
+
+    for _ in range(500):
+        i, x = rng.randrange(50), rng.randint(-100, 100)
+        if rng.randrange(2):
+            A[i] = x
+            seg[i] = x
+        else:
+            A[i] += x
+            seg.add(i, x)
+
+        left, right = sorted(rng.sample(range(51), 2))
+        B = A[left:right]
+        assert seg.query(left, right) == (sum(B), min(B), max(B), len(B))
+    assert [seg[i] for i in range(50)] == A
+
+
+def test_multi_aggregate_segment_tree_float():
+    A = [0.5, 1.5, -2.0]
+    seg = MultiAggregateSegmentTree[float](A, typecode="d")
+
+    assert seg.query(0, 3) == (0.0, -2.0, 1.5, 3)
+    assert seg.query(1, 1) == (0, float("inf"), float("-inf"), 0)
+
+
+def test_multi_aggregate_segment_tree_index_error():
+    seg = MultiAggregateSegmentTree[int]([1, 2, 3])
+
+    with pytest.raises(IndexError):
+        seg.update(3, 0)
+    with pytest.raises(IndexError):
+        seg.get(-1)
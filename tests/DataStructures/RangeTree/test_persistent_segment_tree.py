@@ -0,0 +1,52 @@
+from itertools import combinations
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree.persistent_segment_tree import PersistentSegmentTree
+
+
+def test_versions():
+    A = [3, 5, 2, 11, 9]
+    seg = PersistentSegmentTree[int](A, lambda x, y: x + y, 0, typecode="q")
+
+    v1 = seg.update(0, 2, 100)
+    v2 = seg.add(v1, 0, 10)
+    v3 = seg.update(0, 4, 0)
+
+    assert len(seg) == 4
+    assert seg.query(0, 0, 5) == 30
+    assert seg.query(v1, 0, 5) == 128
+    assert seg.query(v2, 0, 5) == 138
+    assert seg.query(v3, 0, 5) == 21
+    assert seg.query(v2, 1, 3) == 105
+    assert seg.query(v2, 3, 3) == 0
+
+    assert [seg.get(0, i) for i in range(5)] == A
+    assert [seg.get(v2, i) for i in range(5)] == [13, 5, 100, 11, 9]
+
+    with pytest.raises(IndexError):
+        seg.update(0, 5, 1)
+
+
+def test_random_against_copies():
+    rng = Random(0)
+    N = 13
+    versions = [[rng.randrange(100) for _ in range(N)]]
+    seg = PersistentSegmentTree[int](versions[0], min, 10**9)
+    initial_nodes = len(seg.left)
+
+    for _ in range(200):
+        base = rng.randrange(len(versions))
+        i, x = rng.randrange(N), rng.randrange(100)
+        A = versions[base][:]
+        A[i] = x
+        versions.append(A)
+        assert seg.update(base, i, x) == len(versions) - 1
+
+    # 1回の更新あたり, log(N) + 1ノードだけ増える
+    assert len(seg.left) - initial_nodes == 200 * (seg.N.bit_length())
+
+    for version, A in enumerate(versions):
+        for left, right in combinations(range(N + 1), 2):
+            assert seg.query(version, left, right) == min(A[left:right])
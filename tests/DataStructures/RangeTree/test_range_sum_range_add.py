@@ -1,5 +1,7 @@
 from itertools import combinations
+from random import Random
 
+from src.DataStructures.RangeTree.binary_indexed_tree import RangeAddBinaryIndexedTree
 from src.DataStructures.RangeTree.lazy_segment_tree import RangeSumRangeAdd
 
 
@@ -410,3 +412,37 @@ def test_get_range_sum_range_add_no_recursion():
     assert seg.get(5) == A[5]
     assert seg.get(6) == A[6]
     assert seg.get(7) == A[7]
+
+
+def test_range_sum_range_add_bit():
+    A = [3, 5, 2, 11, 9, 1, 20, 8]
+    bit = RangeSumRangeAdd(A, use_bit=True)
+    assert isinstance(bit, RangeAddBinaryIndexedTree)
+
+    bit.range_update(3, 7, 2)
+    A = [3, 5, 2, 13, 11, 3, 22, 8]
+    for left, right in combinations(range(len(A) + 1), r=2):
+        assert bit.query(left, right) == sum(A[left:right])
+
+    bit.one_point_update(7, 100)
+    A = [3, 5, 2, 13, 11, 3, 22, 108]
+    assert [bit.get(i) for i in range(len(A))] == A
+    assert bit.query(-10, 100) == sum(A)
+
+
+def test_range_add_bit_matches_lazy_segment_tree():
+    rng = Random(0)
+    A = [rng.randrange(-100, 100) for _ in range(50)]
+    bit = RangeAddBinaryIndexedTree(A)
+    seg = RangeSumRangeAdd(A)
+
+    for _ in range(300):
+        left, right = sorted(rng.sample(range(len(A) + 1), 2))
+        if rng.random() < 0.5:
+            x = rng.randrange(-100, 100)
+            bit.range_add(left, right, x)
+            seg.range_update(left, right, x)
+        else:
+            assert bit.sum_range(left, right) == seg.query(left, right)
+
+    assert [bit[i] for i in range(len(A))] == [seg[i] for i in range(len(A))]
@@ -1,9 +1,19 @@
 from itertools import combinations
+from math import gcd
+from functools import reduce
+from random import Random
 
+import pytest
+
+from src.DataStructures.RangeTree import segment_tree
 from src.DataStructures.RangeTree.segment_tree import (
     RangeMinimumQuery,
+    RangeMaximumQuery,
     RangeSumQuery,
+    RangeXorQuery,
+    RangeGcdQuery,
     RangeCompositeQuery,
+    SumSegmentTree,
 )
 
 
@@ -89,3 +99,128 @@ def test_point_set_range_composite_library_checker():
     f = seg.query(2, 5)
     x = 16
     assert (f[0] * x + f[1]) % MOD == 5500
+
+
+def test_typed_data():
+    A = [3, 5, 2, 11, 9, 6, 20, 8]
+    seg = RangeMinimumQuery(A, typecode="q")
+
+    assert list(seg.data) == [10**15, 2, 2, 6, 3, 2, 6, 8, 3, 5, 2, 11, 9, 6, 20, 8]
+
+    seg.update(5, 1)
+    assert list(seg.data) == [10**15, 1, 2, 1, 3, 2, 1, 8, 3, 5, 2, 11, 9, 1, 20, 8]
+
+    seg = RangeSumQuery([1, 2, 3, 4, 5], typecode="q")
+    assert isinstance(seg, SumSegmentTree)
+    assert list(seg.data) == [0, 15, 10, 5, 3, 7, 5, 0, 1, 2, 3, 4, 5, 0, 0, 0]
+
+
+def test_typed_float_sum():
+    A = [0.5, 1.25, 2.0, 3.5, 0.25]
+    seg = RangeSumQuery(A, typecode="d")
+
+    assert seg.query(0, 5) == sum(A)
+    seg.add(2, 0.5)
+    assert seg.get(2) == 2.5
+    assert seg.query(1, 3) == 1.25 + 2.5
+
+
+def test_typed_matches_generic():
+    rng = Random(0)
+    factories = [
+        (RangeMinimumQuery, min),
+        (RangeMaximumQuery, max),
+        (RangeSumQuery, sum),
+        (RangeXorQuery, lambda x: reduce(lambda a, b: a ^ b, x, 0)),
+        (RangeGcdQuery, lambda x: reduce(gcd, x, 0)),
+    ]
+    for factory, naive in factories:
+        A = [rng.randrange(1, 1000) for _ in range(37)]
+        typed = factory(A, typecode="q")
+        generic = factory(A)
+
+        for _ in range(200):
+            i, x = rng.randrange(len(A)), rng.randrange(1, 1000)
+            if rng.random() < 0.5:
+                A[i] = x
+                typed.update(i, x)
+                generic[i] = x
+            else:
+                left, right = sorted(rng.sample(range(len(A) + 1), 2))
+                assert typed.query(left, right) == naive(A[left:right])
+                assert typed.query(left, right) == generic.query(left, right)
+                assert typed.query_recursion(left, right) == generic.query(left, right)
+
+        assert [typed[i] for i in range(len(A))] == A
+
+
+def test_typed_add():
+    A = [3, 5, 2, 11, 9, 6, 20, 8]
+    seg_sum = RangeSumQuery(A, typecode="q")
+    seg_min = RangeMinimumQuery(A, typecode="q")
+
+    seg_sum.add(5, -5)
+    seg_min.add(5, -5)
+    assert seg_sum.query(0, 8) == sum(A) - 5
+    assert seg_min.query(4, 8) == 1
+
+    # addはxorの場合も A[i] += x
+    seg_xor = RangeXorQuery(A, typecode="q")
+    seg_xor.add(1, 3)
+    assert seg_xor[1] == 8
+    assert seg_xor.query(0, 2) == 3 ^ 8
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_query_many_add_many(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(segment_tree, "np", None)
+
+    rng = Random(1)
+    for factory, naive in [(RangeSumQuery, sum), (RangeMinimumQuery, min), (RangeXorQuery, None)]:
+        A = [rng.randrange(1, 1000) for _ in range(29)]
+        typed = factory(A, typecode="q")
+        generic = factory(A)
+
+        indices = [rng.randrange(len(A)) for _ in range(50)]
+        values = [rng.randrange(0, 5) for _ in range(50)]
+        typed.add_many(indices, values)
+        generic.add_many(indices, values)
+
+        lefts, rights = [], []
+        for left, right in combinations(range(len(A) + 1), 2):
+            lefts.append(left)
+            rights.append(right)
+
+        expected = [generic.query(left, right) for left, right in zip(lefts, rights)]
+        assert list(typed.query_many(lefts, rights)) == expected
+        assert generic.query_many(lefts, rights) == expected
+        if naive is not None:
+            A = [generic[i] for i in range(len(A))]
+            assert expected == [naive(A[left:right]) for left, right in zip(lefts, rights)]
+
+
+def test_add_many_out_of_range():
+    A = [3, 5, 2, 11, 9]
+    seg = RangeSumQuery(A, typecode="q")
+    for indices in [[0, 5], [1, -1], [8]]:
+        with pytest.raises(IndexError):
+            seg.add_many(indices, [1] * len(indices))
+        # 範囲外のindexがあれば何も加算しない
+        assert [seg[i] for i in range(len(A))] == A
+        assert seg.query(0, len(A)) == sum(A)
+
+
+def test_max_right_min_left():
+    rng = Random(2)
+    for N in [1, 5, 8, 13]:
+        A = [rng.randrange(10) for _ in range(N)]
+        for seg in [RangeSumQuery(A), RangeSumQuery(A, typecode="q")]:
+            for threshold in range(0, sum(A) + 2, 3):
+                pred = lambda x: x <= threshold  # noqa: E731
+                for left in range(N + 1):
+                    expected = max(r for r in range(left, N + 1) if sum(A[left:r]) <= threshold)
+                    assert seg.max_right(left, pred) == expected
+                for right in range(N + 1):
+                    expected = min(left for left in range(right + 1) if sum(A[left:right]) <= threshold)
+                    assert seg.min_left(right, pred) == expected
@@ -0,0 +1,48 @@
+from random import Random
+
+from src.DataStructures.RangeTree.segment_tree_beats import SegmentTreeBeats
+
+
+def test_sample():
+    A = [1, 2, 3, 4, 5]
+    seg = SegmentTreeBeats(A)
+
+    assert seg.range_sum(0, 5) == 15
+    seg.range_chmin(2, 4, 3)
+    assert seg.range_sum(0, 5) == 14
+    seg.range_chmax(1, 3, 4)
+    assert seg.range_sum(0, 5) == 17
+    seg.range_add(0, 5, -10)
+    assert seg.range_sum(0, 5) == -33
+    assert [seg[i] for i in range(5)] == [-9, -6, -6, -7, -5]
+
+
+def test_random():
+    rng = Random(0)
+    for N in [1, 5, 16, 37]:
+        A = [rng.randrange(-100, 100) for _ in range(N)]
+        seg = SegmentTreeBeats(A)
+
+        for _ in range(500):
+            left, right = sorted((rng.randrange(N + 1), rng.randrange(N + 1)))
+            x = rng.randrange(-100, 100)
+            t = rng.randrange(5)
+            if t == 0:
+                seg.range_chmin(left, right, x)
+                A[left:right] = [min(a, x) for a in A[left:right]]
+            elif t == 1:
+                seg.range_chmax(left, right, x)
+                A[left:right] = [max(a, x) for a in A[left:right]]
+            elif t == 2:
+                seg.range_add(left, right, x)
+                A[left:right] = [a + x for a in A[left:right]]
+            elif t == 3:
+                seg.range_update(left, right, x)
+                A[left:right] = [x] * (right - left)
+            else:
+                assert seg.range_sum(left, right) == sum(A[left:right])
+                if left < right:
+                    assert seg.range_max(left, right) == max(A[left:right])
+                    assert seg.range_min(left, right) == min(A[left:right])
+
+        assert [seg.get(i) for i in range(N)] == A
@@ -0,0 +1,80 @@
+from itertools import combinations
+from functools import reduce
+from math import gcd
+from operator import add, xor
+from random import Random
+
+import pytest
+
+from src.DataStructures.RangeTree import sparse_table
+from src.DataStructures.RangeTree.sparse_table import SparseTable, DisjointSparseTable
+
+
+def test_sparse_table_min():
+    A = [3, 5, 2, 11, 9, 6, 20, 8]
+    st = SparseTable[int](A, min, typecode="q")
+
+    assert st.query(1, 5) == 2
+    assert st.query(3, 4) == 11
+    assert st.query(4, 4) is None
+    for left, right in combinations(range(len(A) + 1), 2):
+        assert st.query(left, right) == min(A[left:right])
+
+
+def test_disjoint_sparse_table_non_commutative():
+    A = list("abcdefghijk")
+    dst = DisjointSparseTable[str](A, lambda x, y: x + y, "")
+
+    assert dst.query(0, 11) == "abcdefghijk"
+    assert dst.query(3, 3) == ""
+    for left, right in combinations(range(len(A) + 1), 2):
+        assert dst.query(left, right) == "".join(A[left:right])
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+@pytest.mark.parametrize("N", [1, 2, 7, 16, 33])
+def test_query_many(monkeypatch, use_numpy, N):
+    if not use_numpy:
+        monkeypatch.setattr(sparse_table, "np", None)
+
+    rng = Random(N)
+    A = [rng.randrange(1, 1000) for _ in range(N)]
+    lefts, rights = [], []
+    for left, right in combinations(range(N + 1), 2):
+        lefts.append(left)
+        rights.append(right)
+
+    for segfunc in [min, max, gcd]:
+        expected = [reduce(segfunc, A[left:right]) for left, right in zip(lefts, rights)]
+        assert list(SparseTable[int](A, segfunc, typecode="q").query_many(lefts, rights)) == expected
+        assert SparseTable[int](A, segfunc).query_many(lefts, rights) == expected
+
+    expected = [sum(A[left:right]) for left, right in zip(lefts, rights)]
+    dst = DisjointSparseTable[int](A, add, 0, typecode="q")
+    assert list(dst.query_many(lefts, rights)) == expected
+    assert [dst.query(left, right) for left, right in zip(lefts, rights)] == expected
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_query_many_empty(monkeypatch, use_numpy):
+    if not use_numpy:
+        monkeypatch.setattr(sparse_table, "np", None)
+
+    A = [3, 1, 4, 1, 5]
+    lefts, rights = [1, 0, 5, 4, -3, 2], [1, 0, 5, 2, 0, 9]
+    st = SparseTable[int](A, min, 10**9, typecode="q")
+    assert list(st.query_many(lefts, rights)) == [st.query(left, right) for left, right in zip(lefts, rights)]
+    assert list(st.query_many(lefts, rights)) == [10**9] * 5 + [1]
+
+    dst = DisjointSparseTable[int](A, add, 0, typecode="q")
+    assert list(dst.query_many(lefts, rights)) == [0] * 5 + [10]
+
+    assert list(SparseTable[int]([], min, 10**9, typecode="q").query_many([0], [0])) == [10**9]
+    assert list(DisjointSparseTable[int]([], add, 0, typecode="q").query_many([0], [0])) == [0]
+
+
+def test_sparse_table_rejects_non_idempotent():
+    # 重なりのある2区間で覆うため, 冪等でない演算は二重に数えてしまう
+    for segfunc in [add, xor]:
+        with pytest.raises(ValueError):
+            SparseTable[int]([3, 1, 4, 1, 5], segfunc, 0, typecode="q")